@@ -0,0 +1,365 @@
+# app/services/audio.py
+
+"""
+This module provides AudioEngine, the long-lived playback service behind the
+Azan. The mixer is initialized once and clips are decoded into memory ahead
+of time by an AudioLibrary, so a reminder only has to start a channel. All
+mixer calls happen on the engine's own thread, which takes play/stop/fade
+commands from a queue; callers on the GUI or scheduler threads never block
+on audio. Given the scheduler's schedule, the engine also decodes the next
+prayer's clip shortly before it is due and plays the pre-alert chime
+config.PRE_ALERT_LEAD_SECONDS ahead of it.
+"""
+
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app.services.audio_library import AZAN, PRE_ALERT, AudioLibrary
+from app.utils import config
+from app.utils import utils
+from app.utils.clock import SystemClock
+from app.utils.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")
+
+# A chime reached more than this many seconds late (e.g. the app was started
+# just before a prayer) is skipped, matching the scheduler's one-minute window.
+MISSED_PRE_ALERT_GRACE_SECONDS = 60
+
+
+def _decoded_size(sound):
+    """Estimates a Sound's size from the mixer format; get_raw() would copy the whole buffer."""
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency) * channels * abs(size) // 8
+
+
+class AudioEngine(threading.Thread):
+    """
+    A single playback worker backed by a cache of decoded clips.
+
+    Trigger latency is the time from play() being called to the mixer starting
+    the sound; the mixer's own output buffer adds `output_latency_ms` on top
+    before the first sample is heard. Both are reported by stats().
+    """
+
+    _PLAY = "play"
+    _STOP = "stop"
+    _FADE = "fade"
+    _PREFETCH = "prefetch"
+    _FOLLOW = "follow"
+    _SHUTDOWN = "shutdown"
+
+    def __init__(self, library=None, clock=None):
+        """
+        Args:
+            library (AudioLibrary, optional): The clip library. Defaults to one built from
+                                              config once the mixer is initialized.
+            clock (optional): The time source the schedule is followed by.
+                              Defaults to the real system clock.
+        """
+        super().__init__(daemon=True, name="AudioEngine")
+        self.library = library
+        self.clock = clock or SystemClock()
+        self._commands = queue.Queue()
+        self._ready = threading.Event()
+        self._get_schedule = None
+        self._chimed_for = None   # The deadline whose pre-alert chime was already handled
+        self._playing = None      # The Sound currently started, if any
+        self._streaming = False   # True while a clip that could not be decoded is streamed
+        self._undecodable = set()  # Paths the decoder rejected; they are streamed instead
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "plays": 0,
+            "prefetches": 0,
+            "last_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+            "total_latency_ms": 0.0,
+            "output_latency_ms": 0.0,
+        }
+
+    # --- Commands (safe to call from any thread) ---
+
+    def play(self, prayer_name=None, kind=AZAN):
+        """
+        Starts a clip from the beginning, cutting off any playback in progress.
+
+        Args:
+            prayer_name (str, optional): The prayer whose clip to play. Defaults to the default Azan.
+            kind (str): The kind of clip, audio_library.AZAN or audio_library.PRE_ALERT.
+        """
+        self._commands.put((self._PLAY, (time.perf_counter(), prayer_name, kind)))
+
+    def stop(self):
+        """Stops playback immediately."""
+        self._commands.put((self._STOP, None))
+
+    def fade(self, duration_ms=None):
+        """
+        Fades playback out.
+
+        Args:
+            duration_ms (int, optional): The fade length. Defaults to config.AUDIO_FADE_OUT_MS.
+        """
+        self._commands.put((self._FADE, duration_ms or config.AUDIO_FADE_OUT_MS))
+
+    def prefetch(self, prayer_name=None, kind=AZAN):
+        """
+        Decodes a clip into the cache so that playing it later starts at once.
+
+        Args:
+            prayer_name (str, optional): The prayer whose clip to decode.
+            kind (str): The kind of clip.
+        """
+        self._commands.put((self._PREFETCH, (prayer_name, kind)))
+
+    def follow_schedule(self, get_schedule):
+        """
+        Prefetches each prayer's Azan config.AUDIO_PREFETCH_LEAD_SECONDS before it is due,
+        and plays the pre-alert chime config.PRE_ALERT_LEAD_SECONDS before it.
+
+        Args:
+            get_schedule (callable): Returns the current CompiledSchedule, e.g.
+                                     ReminderScheduler.get_schedule.
+        """
+        self._commands.put((self._FOLLOW, get_schedule))
+
+    def shutdown(self, timeout=None):
+        """
+        Stops playback and the worker thread.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait for the thread.
+        """
+        if self.is_alive():
+            self._commands.put((self._SHUTDOWN, None))
+            self.join(timeout)
+
+    def wait_ready(self, timeout=None):
+        """
+        Blocks until the mixer is initialized and the default Azan decoded (or that failed).
+
+        Returns:
+            bool: True if the engine finished warming up within the timeout.
+        """
+        return self._ready.wait(timeout)
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of plays and prefetches, the trigger-to-play latency in
+                  milliseconds (last, max and average), the mixer's output buffer
+                  latency, and the clip cache's statistics under "cache".
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_latency_ms"] = stats["total_latency_ms"] / stats["plays"] if stats["plays"] else 0.0
+        stats["cache"] = self.library.stats() if self.library else {}
+        return stats
+
+    # --- Worker ---
+
+    def run(self):
+        self._warm_up()
+        self._ready.set()
+        while True:
+            wait = self.run_scheduled(self.clock.now())
+            # Sleep until the next scheduled clip is due; the cap guards against wall-clock jumps
+            timeout = None if wait is None else min(wait, config.SCHEDULER_MAX_SLEEP_SECONDS)
+            try:
+                command, argument = self._commands.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            try:
+                if command == self._PLAY:
+                    self._play(*argument)
+                elif command == self._STOP:
+                    self._stop()
+                elif command == self._FADE:
+                    self._fade(argument)
+                elif command == self._PREFETCH:
+                    path = self.library.resolve(*argument) if self.library else None
+                    if path is not None:
+                        self._prefetch(path)
+                elif command == self._FOLLOW:
+                    self._get_schedule = argument
+                elif command == self._SHUTDOWN:
+                    self._stop()
+                    return
+            except Exception as e:
+                utils.logging.error(f"Audio command '{command}' failed: {e}")
+
+    def _warm_up(self):
+        """Initializes the mixer and decodes the default Azan."""
+        try:
+            if not pygame.mixer.get_init():
+                # A small buffer keeps the delay before the first sample low
+                pygame.mixer.pre_init(buffer=config.AUDIO_MIXER_BUFFER)
+                pygame.mixer.init()
+            frequency = pygame.mixer.get_init()[0]
+        except Exception as e:
+            utils.logging.error(f"Audio is unavailable, the Azan will not play: {e}")
+            return
+        with self._stats_lock:
+            self._stats["output_latency_ms"] = config.AUDIO_MIXER_BUFFER / frequency * 1000
+
+        if self.library is None:
+            self.library = AudioLibrary(pygame.mixer.Sound, _decoded_size)
+        path = self.library.resolve()
+        if path is None:
+            utils.logging.warning(f"Audio file not found at: {self.library.default_azan}")
+            return
+        self._prefetch(path)
+
+    def _prefetch(self, path):
+        """Decodes a clip into the library; a clip that cannot be decoded is marked for streaming."""
+        try:
+            if self.library.prefetch(path):
+                with self._stats_lock:
+                    self._stats["prefetches"] += 1
+        except Exception as e:
+            # Some SDL_mixer builds cannot decode MP3 into a Sound
+            self._undecodable.add(path)
+            utils.logging.warning(f"Could not decode {path} into memory ({e}); it will be streamed instead.")
+
+    def run_scheduled(self, now):
+        """
+        Performs the schedule-driven work due at `now`: decoding the next prayer's
+        Azan and the pre-alert chime ahead of time, and playing the chime.
+        Called from the worker thread.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            float or None: The number of seconds until more work is due, or None
+                           without a schedule to follow.
+        """
+        if self._get_schedule is None or self.library is None:
+            return None
+        try:
+            upcoming = [(deadline, name) for deadline, name in self._get_schedule().deadlines() if deadline > now]
+        except Exception as e:
+            utils.logging.error(f"Could not read the schedule for audio prefetching: {e}")
+            return None
+        if not upcoming:
+            # The scheduler replaces the schedule at midnight
+            next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            return (next_midnight - now).total_seconds()
+
+        deadline, prayer_name = upcoming[0]
+        prefetch_lead = timedelta(seconds=config.AUDIO_PREFETCH_LEAD_SECONDS)
+        # Look again once this prayer has passed
+        pending = [deadline, self._prefetch_at(self.library.resolve(prayer_name), deadline - prefetch_lead, now)]
+        if config.PRE_ALERT_LEAD_SECONDS and self._chimed_for != deadline:
+            chime = self.library.resolve(prayer_name, PRE_ALERT)
+            chime_at = deadline - timedelta(seconds=config.PRE_ALERT_LEAD_SECONDS)
+            if chime is not None:
+                pending.append(self._prefetch_at(chime, chime_at - prefetch_lead, now))
+                if now < chime_at:
+                    pending.append(chime_at)
+                else:
+                    self._chimed_for = deadline
+                    if (now - chime_at).total_seconds() <= MISSED_PRE_ALERT_GRACE_SECONDS:
+                        try:
+                            self._play(time.perf_counter(), prayer_name, PRE_ALERT)
+                        except Exception as e:
+                            utils.logging.error(f"Pre-alert chime for {prayer_name} failed: {e}")
+        return max(0.0, (min(moment for moment in pending if moment is not None) - now).total_seconds())
+
+    def _prefetch_at(self, path, due_at, now):
+        """
+        Decodes a clip if its prefetch time has come.
+
+        Returns:
+            datetime or None: When to decode it, or None if there is nothing left to do.
+        """
+        if path is None or path in self._undecodable or self.library.is_cached(path):
+            return None
+        if now < due_at:
+            return due_at
+        self._prefetch(path)
+        return None
+
+    def _play(self, triggered_at, prayer_name, kind):
+        if self.library is None:
+            utils.logging.warning("Audio is unavailable; skipping playback.")
+            return
+        path = self.library.resolve(prayer_name, kind)
+        if path is None:
+            utils.logging.warning(f"No {kind} clip found for {prayer_name or 'the default'}; skipping playback.")
+            return
+        self._stop()  # Restart rather than overlap when triggered again
+        sound = None
+        if path not in self._undecodable:
+            try:
+                sound = self.library.get(path)
+            except Exception as e:
+                self._undecodable.add(path)
+                utils.logging.warning(f"Could not decode {path} into memory ({e}); streaming it instead.")
+        if sound is not None:
+            sound.play()
+            self._playing = sound
+        else:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play()
+            self._streaming = True
+
+        latency_ms = (time.perf_counter() - triggered_at) * 1000
+        with self._stats_lock:
+            self._stats["plays"] += 1
+            self._stats["last_latency_ms"] = latency_ms
+            self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+            self._stats["total_latency_ms"] += latency_ms
+        label = "Azan sound" if kind == AZAN else "Pre-alert chime"
+        utils.logging.info(f"{label} started playing ({latency_ms:.1f} ms after the trigger).")
+
+    def _stop(self):
+        if self._streaming:
+            pygame.mixer.music.stop()
+            self._streaming = False
+        if self._playing is not None:
+            self._playing.stop()
+            self._playing = None
+
+    def _fade(self, duration_ms):
+        if self._streaming:
+            pygame.mixer.music.fadeout(duration_ms)
+        if self._playing is not None:
+            self._playing.fadeout(duration_ms)
+
+
+# --- Shared Instance ---
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_audio_engine():
+    """
+    Returns the shared AudioEngine, starting it (and its warm-up) on first use.
+
+    Returns:
+        AudioEngine: The running engine.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AudioEngine()
+            _engine.start()
+        return _engine
+
+
+def shutdown_audio_engine(timeout=2.0):
+    """
+    Stops the shared engine if it was started.
+
+    Args:
+        timeout (float): The maximum number of seconds to wait for the worker thread.
+    """
+    global _engine
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.shutdown(timeout)
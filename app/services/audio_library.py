@@ -0,0 +1,157 @@
+# app/services/audio_library.py
+
+"""
+This module provides AudioLibrary, which maps prayers to sound clips (a
+per-prayer Azan, and a short pre-alert chime played a few minutes before
+each prayer) and keeps decoded clips in an LRU cache bounded by a byte
+budget. A decoded three-minute Azan is tens of megabytes of PCM, so only
+the clips that were played or prefetched recently stay in memory; the rest
+are decoded again on demand.
+
+The library is not thread-safe: the AudioEngine uses it from its worker thread only.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+
+from app.utils import config
+
+AZAN = "azan"
+PRE_ALERT = "pre_alert"
+
+
+class AudioLibrary:
+    """
+    Resolves clips for prayers and caches their decoded sounds.
+    """
+
+    def __init__(self, decoder, size_of, budget_bytes=None, azan_files=None,
+                 default_azan=None, pre_alert_file=None):
+        """
+        Args:
+            decoder (callable): Decodes a file path into a playable sound, e.g. pygame.mixer.Sound.
+            size_of (callable): Returns the decoded size of a sound in bytes.
+            budget_bytes (int, optional): The most decoded audio kept in memory.
+                                          Defaults to config.AUDIO_CACHE_BUDGET_BYTES.
+            azan_files (dict, optional): Prayer name to Azan file overrides.
+                                         Defaults to config.PRAYER_AZAN_FILES.
+            default_azan (str or Path, optional): The Azan for prayers without an override.
+                                                  Defaults to config.AZAN_SOUND_FILE.
+            pre_alert_file (str or Path, optional): The pre-alert chime.
+                                                    Defaults to config.PRE_ALERT_SOUND_FILE.
+        """
+        self._decoder = decoder
+        self._size_of = size_of
+        self.budget_bytes = config.AUDIO_CACHE_BUDGET_BYTES if budget_bytes is None else budget_bytes
+        self.azan_files = dict(config.PRAYER_AZAN_FILES if azan_files is None else azan_files)
+        self.default_azan = default_azan or config.AZAN_SOUND_FILE
+        self.pre_alert_file = pre_alert_file or config.PRE_ALERT_SOUND_FILE
+        self._cache = OrderedDict()  # path -> (sound, size in bytes), least recently used first
+        self._cached_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "decode_ms": 0.0}
+
+    def resolve(self, prayer_name=None, kind=AZAN):
+        """
+        Args:
+            prayer_name (str, optional): The prayer the clip is for; None means the default clip.
+            kind (str): AZAN or PRE_ALERT.
+
+        Returns:
+            str or None: The clip's file path, or None if it does not exist.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        if kind == AZAN:
+            path = self.azan_files.get(prayer_name, self.default_azan)
+        elif kind == PRE_ALERT:
+            path = self.pre_alert_file
+        else:
+            raise ValueError(f"Unknown clip kind: {kind!r}")
+        if path is None or not os.path.exists(path):
+            return None
+        return str(path)
+
+    def get(self, path):
+        """
+        Returns the decoded sound for a file, decoding it on a cache miss.
+
+        Args:
+            path (str): The clip's file path, as returned by resolve().
+
+        Returns:
+            The decoded sound.
+
+        Raises:
+            Exception: Whatever the decoder raises if the file cannot be decoded.
+        """
+        entry = self._cache.get(path)
+        if entry is not None:
+            self._cache.move_to_end(path)
+            self._stats["hits"] += 1
+            return entry[0]
+        self._stats["misses"] += 1
+        return self._load(path)
+
+    def prefetch(self, path):
+        """
+        Decodes a clip into the cache ahead of time, unless it is already there.
+
+        Args:
+            path (str): The clip's file path, as returned by resolve().
+
+        Returns:
+            bool: True if the clip was decoded now.
+        """
+        if path in self._cache:
+            self._cache.move_to_end(path)
+            return False
+        self._load(path)
+        return True
+
+    def is_cached(self, path):
+        """
+        Returns:
+            bool: True if the clip is decoded and in memory.
+        """
+        return path in self._cache
+
+    def clear(self):
+        """Drops every decoded clip."""
+        self._cache.clear()
+        self._cached_bytes = 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: Cache hits, misses and evictions, the total decode time in
+                  milliseconds, and the number and size of the cached clips.
+        """
+        stats = dict(self._stats)
+        stats["entries"] = len(self._cache)
+        stats["cached_bytes"] = self._cached_bytes
+        stats["budget_bytes"] = self.budget_bytes
+        return stats
+
+    def _load(self, path):
+        """Decodes a clip, adds it to the cache and evicts older clips over the budget."""
+        started = time.perf_counter()
+        sound = self._decoder(path)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._stats["decode_ms"] += elapsed_ms
+        size = self._size_of(sound)
+        self._cache[path] = (sound, size)
+        self._cached_bytes += size
+        logging.info(f"Decoded {os.path.basename(path)} in {elapsed_ms:.0f} ms ({size / 1024 / 1024:.1f} MiB).")
+
+        # The newest clip always stays, even if it alone is over the budget
+        while self._cached_bytes > self.budget_bytes and len(self._cache) > 1:
+            evicted, (_, evicted_size) = self._cache.popitem(last=False)
+            self._cached_bytes -= evicted_size
+            self._stats["evictions"] += 1
+            logging.info(f"Evicted {os.path.basename(evicted)} from the audio cache.")
+        if size > self.budget_bytes:
+            logging.warning(f"{os.path.basename(path)} alone exceeds the audio cache budget.")
+        return sound
@@ -0,0 +1,99 @@
+# app/services/dispatcher.py
+
+"""
+This module provides NotificationDispatcher, the stage between the scheduler's
+queue and the reminder popup. Several reminders and snoozes can expire in the
+same scheduler tick; instead of showing each one separately, the dispatcher
+collects the reminders that arrive within a short window, drops prayers that
+are already on screen or already waiting, and hands each batch to the popup
+in one call. At most one batch is presented per window, so bursts cost a
+bounded amount of UI and audio work.
+"""
+
+import logging
+import time
+
+from app.utils import config
+
+
+class NotificationDispatcher:
+    """
+    Coalesces reminders into batches. It is not thread-safe: submit() and
+    resolve() are called on the GUI thread, and `schedule` must run its
+    callback on that thread too (e.g. Tk's `after`).
+    """
+
+    def __init__(self, schedule, present, window_ms=None, clock=time.monotonic):
+        """
+        Args:
+            schedule (callable): Called as schedule(delay_ms, callback) to run the flush later.
+            present (callable): Called as present(prayer_names, received_at) with each batch;
+                                received_at is when its earliest reminder arrived.
+            window_ms (int, optional): Batches are presented at most once per window.
+                                       Defaults to config.NOTIFICATION_COALESCE_MS.
+            clock (callable): Returns the current time in seconds, for tests.
+        """
+        self._schedule = schedule
+        self._present = present
+        self.window_ms = config.NOTIFICATION_COALESCE_MS if window_ms is None else window_ms
+        self._clock = clock
+        self._pending = {}     # prayer name -> time it arrived, in arrival order
+        self.on_screen = set()  # Prayers presented and not answered yet
+        self._flush_job = None
+        self._last_flush = None
+        self._stats = {"received": 0, "deduplicated": 0, "batches": 0, "largest_batch": 0}
+
+    def submit(self, prayer_name, received_at=None):
+        """
+        Queues a reminder for the next batch, unless the prayer is already on screen or waiting.
+
+        Args:
+            prayer_name (str): The prayer to remind about.
+            received_at (float, optional): The time.perf_counter() at which it arrived.
+
+        Returns:
+            bool: False if the reminder was a duplicate and was dropped.
+        """
+        self._stats["received"] += 1
+        if prayer_name in self.on_screen or prayer_name in self._pending:
+            self._stats["deduplicated"] += 1
+            logging.info(f"{prayer_name} reminder is already on screen; not showing it again.")
+            return False
+        self._pending[prayer_name] = time.perf_counter() if received_at is None else received_at
+        if self._flush_job is None:
+            # The first reminder after a quiet period goes out as soon as the current
+            # drain of the queue is done; later ones wait for the rest of the window.
+            delay_ms = 0
+            if self._last_flush is not None:
+                elapsed_ms = (self._clock() - self._last_flush) * 1000
+                delay_ms = max(0, int(self.window_ms - elapsed_ms))
+            self._flush_job = self._schedule(delay_ms, self.flush)
+        return True
+
+    def resolve(self, prayer_name):
+        """
+        Marks a prayer's reminder as answered, so a later reminder for it is shown again.
+
+        Args:
+            prayer_name (str): The prayer that was answered or snoozed.
+        """
+        self.on_screen.discard(prayer_name)
+
+    def flush(self):
+        """Presents everything waiting as one batch."""
+        self._flush_job = None
+        if not self._pending:
+            return
+        self._last_flush = self._clock()
+        batch, self._pending = self._pending, {}
+        self.on_screen.update(batch)
+        self._stats["batches"] += 1
+        self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
+        self._present(list(batch), min(batch.values()))
+
+    def stats(self):
+        """
+        Returns:
+            dict: Reminders received and deduplicated, batches presented and the largest batch.
+        """
+        return dict(self._stats)
@@ -0,0 +1,165 @@
+# app/services/event_channel.py
+
+"""
+This module provides EventChannel, the link between the scheduler thread and
+the Tk main loop. It is a queue.Queue whose producers also wake the GUI, so
+the GUI reacts to scheduler messages as soon as they are put instead of
+polling the queue on a timer, and drains everything that is pending in one
+batch.
+
+Producers never call into Tk: tkinter hands calls from other threads to the
+main loop and blocks until it serves them, which deadlocks if the main thread
+is itself waiting for the producer. Instead, put() writes a byte to a pipe
+that the main loop watches with a file handler. Where Tk has no file handlers
+(Windows), the main loop checks a flag every QUEUE_POLL_INTERVAL_MS instead.
+"""
+
+import os
+import queue
+import threading
+import time
+import tkinter
+
+from app.utils import config
+
+
+class EventChannel(queue.Queue):
+    """
+    A thread-safe queue that wakes a Tk widget when items are put into it.
+
+    Until attach() is called it behaves like a plain queue, so the scheduler
+    can be started before the GUI exists; anything put in the meantime is
+    delivered on attach. At most one wakeup is in flight at a time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._widget = None
+        self._handler = None
+        self._poll_job = None
+        self._wakeup_lock = threading.Lock()
+        self._wakeup_pending = False
+        self._read_fd = self._write_fd = None  # The wakeup pipe, once attached to a main loop
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "delivered": 0,
+            "wakeups": 0,
+            "last_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+            "total_latency_ms": 0.0,
+        }
+
+    def attach(self, widget, handler, poll_interval_ms=None):
+        """
+        Starts waking `widget` for new items. Must be called on the Tk main thread.
+
+        Args:
+            widget (tkinter.Misc): The widget whose main loop is woken, usually the root window.
+            handler (callable): Called on the main thread after a wakeup; it should
+                                drain the queue with get_nowait().
+            poll_interval_ms (int, optional): How often the flag is checked where Tk has no
+                                              file handlers. Defaults to config.QUEUE_POLL_INTERVAL_MS.
+        """
+        self._widget = widget
+        self._handler = handler
+        if not hasattr(widget.tk, "createfilehandler"):
+            # Windows builds of Tk cannot watch file descriptors
+            self._poll_interval_ms = poll_interval_ms or config.QUEUE_POLL_INTERVAL_MS
+            self._poll_job = widget.after(self._poll_interval_ms, self._poll)
+            return
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._read_fd = read_fd
+        widget.tk.createfilehandler(read_fd, tkinter.READABLE, self._on_readable)
+        with self._wakeup_lock:
+            self._write_fd = write_fd
+            pending = self._wakeup_pending
+        if pending:
+            os.write(write_fd, b"\0")  # Deliver what was put before attaching
+
+    def detach(self):
+        """Stops waking the widget. Must be called on the Tk main thread."""
+        if self._widget is None:
+            return
+        if self._poll_job is not None:
+            self._widget.after_cancel(self._poll_job)
+            self._poll_job = None
+        if self._read_fd is not None:
+            with self._wakeup_lock:
+                write_fd, self._write_fd = self._write_fd, None
+            try:
+                self._widget.tk.deletefilehandler(self._read_fd)
+            except tkinter.TclError:
+                pass  # The interpreter is already gone
+            os.close(self._read_fd)
+            os.close(write_fd)
+            self._read_fd = None
+        self._widget = None
+        self._handler = None
+
+    def put(self, item, block=True, timeout=None):
+        """Queues an item and wakes the attached widget. Safe to call from any thread."""
+        super().put((time.perf_counter(), item), block, timeout)
+        self._wake()
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of delivered messages and wakeups, and the delivery
+                  latency from put() to get() in milliseconds (last, max and average).
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_latency_ms"] = stats["total_latency_ms"] / stats["delivered"] if stats["delivered"] else 0.0
+        return stats
+
+    def _get(self):
+        # Called by get()/get_nowait() with the queue's mutex held
+        queued_at, item = super()._get()
+        latency_ms = (time.perf_counter() - queued_at) * 1000
+        with self._stats_lock:
+            self._stats["delivered"] += 1
+            self._stats["last_latency_ms"] = latency_ms
+            self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+            self._stats["total_latency_ms"] += latency_ms
+        return item
+
+    def _wake(self):
+        """Signals the main loop unless a wakeup is already pending. Never blocks or calls into Tk."""
+        with self._wakeup_lock:
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+            write_fd = self._write_fd
+        if write_fd is None:
+            return  # Polled, or not attached yet; attach() delivers what is pending
+        try:
+            os.write(write_fd, b"\0")
+        except OSError:
+            pass  # The pipe is full (a wakeup is due anyway) or was just closed by detach()
+
+    def _on_readable(self, fd, mask):
+        try:
+            while os.read(self._read_fd, 512):
+                pass
+        except BlockingIOError:
+            pass  # Drained
+        self._on_wakeup()
+
+    def _poll(self):
+        self._poll_job = self._widget.after(self._poll_interval_ms, self._poll)
+        with self._wakeup_lock:
+            pending = self._wakeup_pending
+        if pending:
+            self._on_wakeup()
+
+    def _on_wakeup(self):
+        with self._wakeup_lock:
+            # Cleared before draining, so a put during the drain sends a fresh wakeup
+            self._wakeup_pending = False
+        if self._handler is None:
+            return  # Not attached; the items stay queued until attach()
+        with self._stats_lock:
+            self._stats["wakeups"] += 1
+        self._handler()
@@ -0,0 +1,168 @@
+# app/services/fanout.py
+
+"""
+This module provides SinkFanout, which delivers every reminder to all the
+configured notification sinks at once. Each sink gets its own worker thread
+and a bounded queue: publish() only enqueues and never blocks, so a slow or
+unreachable sink cannot delay the popup, the scheduler thread or the other
+sinks. When a sink falls so far behind that its queue is full, new reminders
+for that sink are dropped and counted rather than blocking the caller.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+from app.utils import config
+
+
+class _SinkWorker(threading.Thread):
+    """Delivers events to one sink, in order, and records its latency."""
+
+    _STOP = object()
+
+    def __init__(self, sink, max_queue):
+        super().__init__(daemon=True, name=f"Sink-{sink.name}")
+        self.sink = sink
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "delivered": 0,
+            "failed": 0,
+            "dropped": 0,
+            "last_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+            "total_latency_ms": 0.0,
+            "max_duration_ms": 0.0,
+        }
+
+    def offer(self, event, published_at):
+        """Queues an event without blocking; returns False if the queue was full."""
+        try:
+            self._queue.put_nowait((event, published_at))
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+            logging.warning(f"Notification sink '{self.sink.name}' is falling behind; dropped a reminder.")
+            return False
+        return True
+
+    def stop(self, timeout=None):
+        """Delivers what is queued, then stops the thread."""
+        if not self.is_alive():
+            return
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self.join(timeout)
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        completed = stats["delivered"] + stats["failed"]
+        stats["avg_latency_ms"] = stats["total_latency_ms"] / completed if completed else 0.0
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            event, published_at = item
+            started = time.perf_counter()
+            try:
+                self.sink.notify(event)
+                outcome = "delivered"
+            except Exception as e:
+                logging.error(f"Notification sink '{self.sink.name}' failed: {e}")
+                outcome = "failed"
+            finished = time.perf_counter()
+            latency_ms = (finished - published_at) * 1000
+            with self._stats_lock:
+                self._stats[outcome] += 1
+                self._stats["last_latency_ms"] = latency_ms
+                self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+                self._stats["total_latency_ms"] += latency_ms
+                self._stats["max_duration_ms"] = max(self._stats["max_duration_ms"], (finished - started) * 1000)
+
+
+class SinkFanout:
+    """
+    Delivers each published event to every sink concurrently.
+    """
+
+    def __init__(self, sinks, max_queue=None):
+        """
+        Args:
+            sinks (list): The NotificationSink instances. Each sink enforces its own
+                          timeout (e.g. config.SINK_TIMEOUT_SECONDS for webhooks).
+            max_queue (int, optional): Events buffered per sink. Defaults to config.SINK_QUEUE_SIZE.
+        """
+        self.sinks = list(sinks)
+        max_queue = max_queue or config.SINK_QUEUE_SIZE
+        self._workers = [_SinkWorker(sink, max_queue) for sink in self.sinks]
+
+    def start(self, scheduler):
+        """
+        Opens every sink and starts its worker. A sink that fails to open is logged and still started.
+
+        Args:
+            scheduler (ReminderScheduler): The scheduler whose reminders will be published.
+        """
+        for worker in self._workers:
+            try:
+                worker.sink.open(scheduler)
+            except Exception as e:
+                logging.error(f"Failed to open notification sink '{worker.sink.name}': {e}")
+            worker.start()
+
+    def publish(self, event):
+        """
+        Hands an event to every sink without blocking. Safe to call from any thread.
+
+        Args:
+            event (NotificationEvent): The reminder to deliver.
+
+        Returns:
+            int: The number of sinks that accepted the event.
+        """
+        published_at = time.perf_counter()
+        return sum(worker.offer(event, published_at) for worker in self._workers)
+
+    def stop(self, timeout=None):
+        """
+        Delivers what is still queued, stops the workers and closes the sinks.
+
+        Args:
+            timeout (float, optional): The longest to wait for each sink's worker.
+                                       Defaults to config.SINK_TIMEOUT_SECONDS.
+        """
+        timeout = config.SINK_TIMEOUT_SECONDS if timeout is None else timeout
+        for worker in self._workers:
+            worker.stop(timeout)
+        for worker in self._workers:
+            try:
+                worker.sink.close()
+            except Exception as e:
+                logging.error(f"Failed to close notification sink '{worker.sink.name}': {e}")
+
+    def stats(self):
+        """
+        Returns:
+            dict: Per sink (keyed by name, numbered when a name repeats): events
+                  delivered, failed and dropped, the current queue depth, the latency
+                  from publish() to delivery in milliseconds (last, max and average)
+                  and the longest single delivery.
+        """
+        stats = {}
+        for worker in self._workers:
+            key = worker.sink.name
+            counter = 2
+            while key in stats:
+                key = f"{worker.sink.name}#{counter}"
+                counter += 1
+            stats[key] = worker.stats()
+        return stats
@@ -3,13 +3,45 @@
 This service module handles all communication with the Google Gemini AI.
 It is responsible for initializing the client with the proper system
 instructions and for fetching responses to user prompts.
+
+The Gemini SDK is imported lazily and the model is only initialized when the
+first prompt is sent, so importing this module costs nothing at startup.
+Answers are kept in a ResponseCache, so a question that was asked before is
+answered without contacting the API.
 """
 
+import atexit
+import hashlib
 import os
+import threading
 from dotenv import load_dotenv
-import google.generativeai as genai
 
+from app.utils import config
 from app.utils import utils
+from app.utils.lazy_import import lazy_import
+from app.utils.response_cache import ResponseCache
+
+genai = lazy_import("google.generativeai")
+
+MODEL_NAME = "gemini-1.5-flash"
+
+# Define the persona and rules for the AI assistant
+SYSTEM_INSTRUCTION = """
+        You are a helpful and knowledgeable Islamic assistant.
+        Your purpose is to provide accurate and respectful answers based on the Quran and Sunnah.
+
+        Guidelines:
+        1. Always be polite, respectful, and encouraging.
+        2. For complex Fiqh (jurisprudence) issues, provide a general answer and strongly advise the user to consult a qualified local scholar for specific rulings.
+        3. Politely decline to engage in sectarian debates or controversial topics.
+        4. Base your knowledge on mainstream, orthodox Islamic teachings.
+        5. If you do not know an answer, admit it honestly rather than fabricating information.
+        6. Keep answers concise, clear, and easy to understand for a general audience.
+        """
+
+# Cached answers are only reused for the same model and instructions
+CACHE_VERSION = hashlib.sha256(f"{MODEL_NAME}\0{SYSTEM_INSTRUCTION}".encode("utf-8")).hexdigest()[:16]
+
 
 def _initialize_ai_model():
     """
@@ -33,24 +65,10 @@ def _initialize_ai_model():
     try:
         genai.configure(api_key=api_key)
 
-        # Define the persona and rules for the AI assistant
-        system_instruction = """
-        You are a helpful and knowledgeable Islamic assistant.
-        Your purpose is to provide accurate and respectful answers based on the Quran and Sunnah.
-
-        Guidelines:
-        1. Always be polite, respectful, and encouraging.
-        2. For complex Fiqh (jurisprudence) issues, provide a general answer and strongly advise the user to consult a qualified local scholar for specific rulings.
-        3. Politely decline to engage in sectarian debates or controversial topics.
-        4. Base your knowledge on mainstream, orthodox Islamic teachings.
-        5. If you do not know an answer, admit it honestly rather than fabricating information.
-        6. Keep answers concise, clear, and easy to understand for a general audience.
-        """
-
         # Create and return the model instance
         model = genai.GenerativeModel(
-            model_name="gemini-1.5-flash",
-            system_instruction=system_instruction
+            model_name=MODEL_NAME,
+            system_instruction=SYSTEM_INSTRUCTION
         )
         utils.logging.info("Gemini AI model initialized successfully.")
         return model
@@ -59,14 +77,49 @@ def _initialize_ai_model():
         utils.logging.error(f"Failed to initialize Gemini AI model: {e}")
         return None
 
-# --- Module-level Initialization ---
-# The model is initialized once when the module is first imported.
-model = _initialize_ai_model()
+# --- Lazy Initialization ---
+# The model is initialized once, when the first response is requested.
+_UNSET = object()
+model = _UNSET
+_model_lock = threading.Lock()
+_response_cache = _UNSET
+_cache_lock = threading.Lock()
+
+
+def get_model():
+    """
+    Returns the shared Gemini model, initializing it on first use.
+
+    Returns:
+        genai.GenerativeModel: The model, or None if setup failed.
+    """
+    global model
+    with _model_lock:
+        if model is _UNSET:
+            model = _initialize_ai_model()
+        return model
+
+
+def get_response_cache():
+    """
+    Returns the shared response cache, opening its database on first use.
+
+    Returns:
+        ResponseCache: The cache of Gemini answers.
+    """
+    global _response_cache
+    with _cache_lock:
+        if _response_cache is _UNSET:
+            _response_cache = ResponseCache(config.AI_RESPONSE_CACHE_FILE)
+            # Access times are written in batches; save the last ones on exit
+            atexit.register(_response_cache.close)
+        return _response_cache
 
 
 def get_ai_response(user_prompt: str) -> str:
     """
-    Generates a response from the Gemini AI based on the user's input.
+    Generates a response from the Gemini AI based on the user's input, or
+    returns the cached answer if the same question was asked before.
 
     Args:
         user_prompt (str): The question or message from the user.
@@ -74,7 +127,14 @@ def get_ai_response(user_prompt: str) -> str:
     Returns:
         str: The text response from the AI, or an error message if something goes wrong.
     """
+    cache = get_response_cache()
+    cached = cache.get(user_prompt, CACHE_VERSION)
+    if cached is not None:
+        utils.logging.info(f"Answered from the response cache: '{user_prompt[:40]}...'")
+        return cached
+
     # Check if the model was initialized successfully
+    model = get_model()
     if not model:
         return "The AI assistant is not configured. Please verify the API key and setup."
 
@@ -82,7 +142,11 @@ def get_ai_response(user_prompt: str) -> str:
         utils.logging.info(f"Sending prompt to Gemini: '{user_prompt[:40]}...'")
         response = model.generate_content(user_prompt)
         utils.logging.info("Received response from Gemini.")
-        return response.text
+        text = response.text
+        if text and text.strip():
+            # Only real answers are cached; errors and empty replies are asked again
+            cache.put(user_prompt, CACHE_VERSION, text)
+        return text
 
     except Exception as e:
         utils.logging.error(f"An error occurred during Gemini API call: {e}")
@@ -0,0 +1,76 @@
+# app/services/headless.py
+
+"""
+This module runs the app without a GUI: the ReminderScheduler thread plus a
+set of notification sinks fed through a SinkFanout, for always-on machines
+that need the reminders but not the window or the tray icon. Nothing here
+imports a GUI toolkit.
+"""
+
+import queue
+import signal
+import threading
+
+from app.services.fanout import SinkFanout
+from app.services.scheduler import ReminderScheduler
+from app.services.sinks import NotificationEvent
+from app.utils import utils
+
+# Put into the notification queue to wake the loop once a stop is requested
+_STOP = object()
+
+
+def run_headless(sinks, stop_event=None, scheduler=None):
+    """
+    Runs the scheduler and delivers its notifications to the sinks until stopped.
+
+    Args:
+        sinks (list): The NotificationSink instances to deliver reminders to.
+        stop_event (threading.Event, optional): Set it to stop. SIGINT and SIGTERM
+            also stop the loop when running on the main thread.
+        scheduler (ReminderScheduler, optional): A scheduler to use instead of a new one.
+    """
+    stop_event = stop_event or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop_event.set())
+
+    if scheduler is None:
+        scheduler = ReminderScheduler(queue.Queue())
+    fanout = SinkFanout(sinks)
+    fanout.start(scheduler)
+    notification_queue = scheduler.notification_queue
+    if not scheduler.is_alive():
+        scheduler.start()
+    # The signal handler only sets the event: putting from it could deadlock on
+    # the queue's lock if the signal arrives while this thread holds it
+    threading.Thread(
+        target=_wake_on_stop, args=(stop_event, notification_queue), name="headless-stop", daemon=True
+    ).start()
+    utils.logging.info(f"Headless mode started with sinks: {', '.join(sink.name for sink in sinks)}")
+
+    try:
+        while not stop_event.is_set():
+            message = notification_queue.get()
+            if message is _STOP:
+                break
+            if message[0] == "show_notification":
+                event = NotificationEvent.from_message(message)
+                utils.logging.info(f"Delivering {event.prayer_name} reminder to {len(sinks)} sink(s)")
+                fanout.publish(event)
+    finally:
+        scheduler.stop()
+        fanout.stop()
+        for name, stats in fanout.stats().items():
+            utils.logging.info(
+                f"Sink '{name}': {stats['delivered']} delivered, {stats['failed']} failed, "
+                f"{stats['dropped']} dropped, avg latency {stats['avg_latency_ms']:.1f} ms"
+            )
+        utils.shutdown_action_logger()
+        utils.logging.info("Headless mode stopped.")
+
+
+def _wake_on_stop(stop_event, notification_queue):
+    """Waits for a stop request, then wakes the loop blocked on the notification queue."""
+    stop_event.wait()
+    notification_queue.put(_STOP)
@@ -0,0 +1,258 @@
+# app/services/multi_scheduler.py
+
+"""
+This module contains the MultiProfileScheduler class, a variant of the
+ReminderScheduler that serves many user profiles from a single thread.
+
+Every profile contributes exactly one entry (its next prayer) to a shared
+min-heap of deadlines, plus one entry per active snooze. Firing a reminder
+pops that entry and pushes the profile's following prayer, so memory and CPU
+per profile stay constant no matter how many profiles are registered.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app.utils import utils
+from app.utils import config
+
+# A reminder reached more than this many seconds late (e.g. after the machine
+# slept) is skipped, matching the single-profile scheduler's one-minute window.
+MISSED_REMINDER_GRACE_SECONDS = 60
+
+
+class MultiProfileScheduler(threading.Thread):
+    """
+    A thread-based scheduler that dispatches prayer reminders for many profiles.
+    """
+
+    def __init__(self, notification_queue):
+        """
+        Initializes the scheduler thread.
+
+        Args:
+            notification_queue (queue.Queue): A thread-safe queue that receives
+                ('show_notification', (profile_id, prayer_name)) events.
+        """
+        super().__init__(daemon=True)
+        self.notification_queue = notification_queue
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Condition()
+
+        # profile_id -> tuple of (seconds_after_midnight, prayer_name), sorted
+        self._profiles = {}
+        # profile_id -> generation; replaced on update so old heap entries go stale.
+        # Generations come from one counter, so a removed and re-added profile
+        # never reuses a generation that still has entries in the heap.
+        self._generations = {}
+        self._generation_counter = itertools.count(1)
+        # profile_id -> {prayer_name: snooze deadline (epoch seconds)}
+        self._snoozes = {}
+        # Heap of (deadline, seq, profile_id, generation, slot, prayer_name).
+        # slot is an index into the profile's times, or -1 for a snooze (whose
+        # validity is checked against _snoozes instead of the generation).
+        self._heap = []
+        self._seq = itertools.count()
+
+    # --- Profile Management ---
+
+    def set_profile(self, profile_id, prayer_times, now=None):
+        """
+        Registers or replaces the daily prayer times of a profile.
+
+        Args:
+            profile_id (str): A unique identifier for the profile.
+            prayer_times (dict): A dictionary of prayer names to times (HH:MM).
+            now (float, optional): The current epoch time. Defaults to time.time().
+        """
+        now = time.time() if now is None else now
+        schedule = _compile_times(prayer_times)
+        with self._wakeup:
+            generation = next(self._generation_counter)
+            self._generations[profile_id] = generation
+            self._profiles[profile_id] = schedule
+            if schedule:
+                slot, deadline = _first_slot_after(schedule, now - MISSED_REMINDER_GRACE_SECONDS)
+                self._push(deadline, profile_id, generation, slot, schedule[slot][1])
+            self._wakeup.notify()
+
+    def remove_profile(self, profile_id):
+        """
+        Removes a profile and cancels all of its pending reminders.
+
+        Args:
+            profile_id (str): The profile to remove.
+        """
+        with self._wakeup:
+            self._profiles.pop(profile_id, None)
+            self._generations.pop(profile_id, None)
+            self._snoozes.pop(profile_id, None)
+
+    def snooze_prayer(self, profile_id, prayer_name, now=None):
+        """
+        Snoozes a prayer of one profile for the default duration defined in config.
+
+        Args:
+            profile_id (str): The profile that snoozed the reminder.
+            prayer_name (str): The name of the prayer to snooze.
+            now (float, optional): The current epoch time. Defaults to time.time().
+        """
+        now = time.time() if now is None else now
+        deadline = now + config.DEFAULT_SNOOZE_MINUTES * 60
+        with self._wakeup:
+            if profile_id not in self._profiles:
+                return
+            self._snoozes.setdefault(profile_id, {})[prayer_name] = deadline
+            self._push(deadline, profile_id, 0, -1, prayer_name)
+            self._wakeup.notify()
+
+    def profile_count(self):
+        """
+        Returns:
+            int: The number of registered profiles.
+        """
+        return len(self._profiles)
+
+    # --- Dispatching ---
+
+    def run(self):
+        """
+        The main background loop. It sleeps until the earliest deadline of any
+        profile and is woken early whenever a profile or snooze changes.
+        """
+        utils.logging.info("Multi-profile scheduler thread started.")
+        while not self._stop_event.is_set():
+            self.dispatch_due(time.time())
+            with self._wakeup:
+                if self._stop_event.is_set():
+                    break
+                # Measured under the lock, so a change made while notifications
+                # were being sent is not slept through
+                timeout = config.SCHEDULER_MAX_SLEEP_SECONDS
+                if self._heap:
+                    timeout = min(timeout, self._heap[0][0] - time.time())
+                self._wakeup.wait(max(0.0, timeout))
+        utils.logging.info("Multi-profile scheduler thread has stopped.")
+
+    def dispatch_due(self, now):
+        """
+        Fires every reminder whose deadline is at or before `now` and schedules
+        each profile's following prayer.
+
+        Due reminders are collected under the lock and sent after releasing it,
+        because putting into the queue may wait for a consumer that is itself
+        waiting for the lock to update a profile or snooze.
+
+        Args:
+            now (float): The current epoch time.
+
+        Returns:
+            int: The number of notifications sent.
+        """
+        due = []
+        with self._wakeup:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                deadline, _, profile_id, generation, slot, prayer_name = heapq.heappop(heap)
+                if slot < 0:
+                    snoozes = self._snoozes.get(profile_id)
+                    if not snoozes or snoozes.get(prayer_name) != deadline:
+                        continue  # Superseded by a later snooze or profile removed
+                    del snoozes[prayer_name]
+                    if not snoozes:
+                        del self._snoozes[profile_id]
+                else:
+                    if self._generations.get(profile_id) != generation:
+                        continue  # Profile was updated or removed since this was queued
+                    schedule = self._profiles[profile_id]
+                    next_slot, next_deadline = _next_slot(schedule, slot, deadline)
+                    self._push(next_deadline, profile_id, generation, next_slot, schedule[next_slot][1])
+                    if now - deadline > MISSED_REMINDER_GRACE_SECONDS:
+                        continue  # Too late to be useful; the next prayer is already queued
+
+                due.append((profile_id, prayer_name))
+
+        for profile_id, prayer_name in due:
+            self.notification_queue.put(('show_notification', (profile_id, prayer_name)))
+        return len(due)
+
+    def next_deadline(self):
+        """
+        Returns:
+            float or None: The epoch time of the earliest pending entry, if any.
+        """
+        with self._wakeup:
+            return self._heap[0][0] if self._heap else None
+
+    def stop(self):
+        """
+        Signals the scheduler thread to stop its execution loop gracefully.
+        """
+        self._stop_event.set()
+        with self._wakeup:
+            self._wakeup.notify()
+
+    def _push(self, deadline, profile_id, generation, slot, prayer_name):
+        """Pushes a deadline onto the shared heap. The caller must hold the lock."""
+        heapq.heappush(self._heap, (deadline, next(self._seq), profile_id, generation, slot, prayer_name))
+
+
+# --- Schedule Helpers ---
+
+def _compile_times(prayer_times):
+    """
+    Converts a dictionary of "HH:MM" strings into a sorted tuple of
+    (seconds_after_midnight, prayer_name), skipping empty or invalid entries.
+    """
+    compiled = []
+    for name, time_str in prayer_times.items():
+        try:
+            parsed = datetime.strptime(time_str, '%H:%M')
+        except (ValueError, TypeError):
+            continue
+        compiled.append((parsed.hour * 3600 + parsed.minute * 60, name))
+    return tuple(sorted(compiled))
+
+
+def _midnight(timestamp):
+    """Returns the epoch time of local midnight on the day containing `timestamp`."""
+    day = datetime.fromtimestamp(timestamp).date()
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+def _at(day_start, offset):
+    """
+    Returns the epoch time `offset` wall-clock seconds after the local midnight
+    `day_start`, computed through datetime so DST changes are respected.
+    """
+    return (datetime.fromtimestamp(day_start) + timedelta(seconds=offset)).timestamp()
+
+
+def _first_slot_after(schedule, timestamp):
+    """
+    Finds the first prayer of `schedule` strictly after `timestamp`.
+
+    Returns:
+        tuple: (slot, deadline) where deadline is an epoch time.
+    """
+    day_start = _midnight(timestamp)
+    for slot, (offset, _) in enumerate(schedule):
+        deadline = _at(day_start, offset)
+        if deadline > timestamp:
+            return slot, deadline
+    tomorrow = _midnight(day_start + 36 * 3600)
+    return 0, _at(tomorrow, schedule[0][0])
+
+
+def _next_slot(schedule, slot, deadline):
+    """
+    Returns the (slot, deadline) of the prayer following `slot`, which fired at `deadline`.
+    """
+    day_start = _midnight(deadline)
+    if slot + 1 < len(schedule):
+        return slot + 1, _at(day_start, schedule[slot + 1][0])
+    tomorrow = _midnight(day_start + 36 * 3600)
+    return 0, _at(tomorrow, schedule[0][0])
@@ -3,139 +3,268 @@
 """
 This module handles all user-facing notifications, including the
 display of the prayer time popup and the playback of the Azan sound.
+Playback is handed to the shared AudioEngine, which keeps the Azan decoded in
+memory. customtkinter is imported lazily, so the audio functions work in
+headless mode without loading (or even installing) the GUI toolkit.
+
+The GUI shows reminders through NotificationPopup, a window built once and
+kept withdrawn that lists every pending prayer with its own actions, so
+showing a reminder costs a relabel and a deiconify.
 """
 
-import customtkinter as ctk
-import pygame
-import threading
-import os
+import time
 
-from app.utils import config
+from app.services.audio import get_audio_engine
 from app.utils import utils
+from app.utils.lazy_import import lazy_import
+
+try:
+    ctk = lazy_import("customtkinter")
+except ModuleNotFoundError:
+    ctk = None  # Headless installs only need the audio functions
 
 
 # --- Sound Management Functions ---
 
-def play_azan_sound():
-    """
-    Initializes pygame mixer and plays the Azan sound in a background thread.
-    This function handles errors gracefully if the sound file is missing or corrupt.
+def play_azan_sound(prayer_name=None):
     """
-    if not os.path.exists(config.AZAN_SOUND_FILE):
-        utils.logging.warning(f"Audio file not found at: {config.AZAN_SOUND_FILE}")
-        return
+    Starts the Azan on the shared audio engine. Returns immediately; the
+    engine's worker thread starts the pre-decoded sound.
 
-    try:
-        # Initialize the mixer if it's not already
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-
-        pygame.mixer.music.load(config.AZAN_SOUND_FILE)
-        pygame.mixer.music.play()
-        utils.logging.info("Azan sound started playing.")
-    except Exception as e:
-        utils.logging.error(f"Failed to play Azan sound: {e}")
+    Args:
+        prayer_name (str, optional): The prayer, for prayers with their own Azan
+                                     (config.PRAYER_AZAN_FILES).
+    """
+    get_audio_engine().play(prayer_name)
 
 
 def stop_azan_sound():
     """
-    Stops any currently playing sound via the pygame mixer.
+    Stops the Azan immediately.
     """
-    try:
-        # Check if the mixer is initialized and if music is playing
-        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
-            pygame.mixer.music.stop()
-            utils.logging.info("Azan sound stopped.")
-    except Exception as e:
-        utils.logging.error(f"Failed to stop Azan sound: {e}")
+    get_audio_engine().stop()
 
 
-# --- Notification Popup Window ---
-
-def show_notification_popup(prayer_name, offered_callback, snooze_callback):
-    """
-    The main function to create and display a popup notification for a specific prayer.
-
-    Args:
-        prayer_name (str): The name of the prayer (e.g., 'Fajr', 'Isha').
-        offered_callback (callable): The function to call when 'Offered' is clicked.
-        snooze_callback (callable): The function to call when 'Snooze' is clicked or the window is closed.
+def fade_azan_sound():
     """
-    # Start the Azan sound in a separate thread to not block the UI
-    threading.Thread(target=play_azan_sound, daemon=True).start()
-
-    # Create the top-level window for the popup
-    popup = ctk.CTkToplevel()
-    popup.title(f"{prayer_name} Reminder")
-    popup.geometry("350x180")
-    popup.resizable(False, False)
-    popup.attributes("-topmost", True)  # Keep the popup on top of all other windows
-
-    # --- Event Handlers ---
-    # These functions are defined here to have access to the popup and callback variables.
-    def on_offered():
-        """Handles the 'Offered' button click event."""
-        stop_azan_sound()
-        if offered_callback:
-            offered_callback()
-        popup.destroy()
-
-    def on_snooze():
-        """Handles the 'Snooze' button click and the window close event."""
-        stop_azan_sound()
-        if snooze_callback:
-            snooze_callback()
-        popup.destroy()
-
-    # Assign the handler to the window's close ('X') button
-    popup.protocol("WM_DELETE_WINDOW", on_snooze)
-
-    # --- UI Construction ---
-    _create_popup_widgets(popup, prayer_name, on_offered, on_snooze)
-    _center_popup_window(popup)
-    popup.focus_force()  # Grab the user's attention
-
-
-def _create_popup_widgets(parent, prayer_name, offered_command, snooze_command):
+    Fades the Azan out over config.AUDIO_FADE_OUT_MS.
     """
-    Creates and packs all the widgets (labels, buttons) inside the popup window.
+    get_audio_engine().fade()
 
-    Args:
-        parent (ctk.CTkToplevel): The popup window to place widgets in.
-        prayer_name (str): The name of the prayer to display.
-        offered_command (callable): The command for the 'Offered' button.
-        snooze_command (callable): The command for the 'Snooze' button.
-    """
-    main_label = ctk.CTkLabel(parent, text=f"It's time for {prayer_name} prayer!", font=ctk.CTkFont(size=18))
-    main_label.pack(pady=20, padx=20)
-
-    button_frame = ctk.CTkFrame(parent, fg_color="transparent")
-    button_frame.pack(pady=20, padx=20, fill="x")
 
-    offered_button = ctk.CTkButton(button_frame, text="Offered", command=offered_command, height=40)
-    offered_button.pack(side="left", expand=True, padx=(0, 5))
+# --- Notification Popup Window ---
 
-    snooze_button = ctk.CTkButton(button_frame, text="Not Yet (Snooze)", command=snooze_command, height=40)
-    snooze_button.pack(side="right", expand=True, padx=(5, 0))
+POPUP_WIDTH = 350
+POPUP_HEIGHT = 180      # The window with a single prayer
+POPUP_ROW_HEIGHT = 50   # Added for every further prayer shown at once
 
 
-def _center_popup_window(popup):
+class _PrayerRow:
     """
-    Calculates the correct coordinates to center the popup on the screen.
-
-    Args:
-        popup (ctk.CTkToplevel): The window to be centered.
+    One prayer's line in the combined popup: its name and its own actions.
+    Rows are pooled and rebound, so a burst never creates more widgets than
+    there are prayers.
     """
-    # Ensure window size is calculated before positioning
-    popup.update_idletasks()
-
-    screen_width = popup.winfo_screenwidth()
-    screen_height = popup.winfo_screenheight()
-
-    popup_width = popup.winfo_width()
-    popup_height = popup.winfo_height()
 
-    x = (screen_width / 2) - (popup_width / 2)
-    y = (screen_height / 2) - (popup_height / 2)
+    def __init__(self, parent):
+        self.prayer_name = None
+        self.frame = ctk.CTkFrame(parent, fg_color="transparent")
+        self.label = ctk.CTkLabel(self.frame, text="", width=80, anchor="w")
+        self.label.pack(side="left", padx=(0, 5))
+        self.offered_button = ctk.CTkButton(self.frame, text="Offered", height=36, width=100)
+        self.offered_button.pack(side="left", expand=True, padx=5)
+        self.snooze_button = ctk.CTkButton(self.frame, text="Not Yet (Snooze)", height=36, width=120)
+        self.snooze_button.pack(side="left", expand=True, padx=(5, 0))
+
+    def bind(self, prayer_name, offered_command, snooze_command):
+        """Shows the row for a prayer."""
+        self.prayer_name = prayer_name
+        self.label.configure(text=prayer_name)
+        self.offered_button.configure(command=offered_command)
+        self.snooze_button.configure(command=snooze_command)
+        self.frame.pack(pady=5, padx=20, fill="x")
+
+    def release(self):
+        """Hides the row so it can be reused."""
+        self.prayer_name = None
+        self.frame.pack_forget()
+
+
+class NotificationPopup:
+    """
+    A reusable reminder window that shows every pending prayer at once, each
+    with its own 'Offered' and 'Snooze' actions. The window is built and
+    positioned once, then withdrawn; show() only fills in rows and
+    deiconifies it. The Azan starts when the window appears, not for each
+    prayer added to it. The time from the GUI receiving a reminder to the
+    window's first drawn frame is recorded for stats().
+    """
 
-    popup.geometry(f"+{int(x)}+{int(y)}")
\ No newline at end of file
+    def __init__(self, master=None):
+        """
+        Builds the window, withdrawn. Must be called on the Tk main thread.
+
+        Args:
+            master (tkinter.Misc, optional): The parent window, usually the application root.
+        """
+        self.master = master
+        self.window = None
+        self._label = None
+        self._rows_frame = None
+        self._rows = []  # The pool; bound rows first, in the order they were shown
+        self._offered_callback = None
+        self._snooze_callback = None
+        self._screen_size = (0, 0)
+        self._shown_at = None  # time.perf_counter() of the reminder waiting for its first frame
+        self._stats = {"shown": 0, "last_latency_ms": 0.0, "max_latency_ms": 0.0, "total_latency_ms": 0.0}
+        self._build()
+
+    @property
+    def prayers(self):
+        """The prayers on screen, in the order they were shown."""
+        return [row.prayer_name for row in self._rows if row.prayer_name is not None]
+
+    @property
+    def is_showing(self):
+        """True while at least one reminder is on screen and has not been answered."""
+        return bool(self.prayers)
+
+    def show(self, prayer_names, offered_callback, snooze_callback, received_at=None):
+        """
+        Adds reminders to the window, showing it and starting the Azan if it was hidden.
+
+        Args:
+            prayer_names (list): The prayers to remind about (e.g. ['Maghrib']).
+                                 Prayers already on screen are skipped.
+            offered_callback (callable): Called with a prayer name when its 'Offered' is clicked.
+            snooze_callback (callable): Called with a prayer name when its 'Snooze' is clicked,
+                                        and for every prayer left when the window is closed.
+            received_at (float, optional): The time.perf_counter() at which the GUI received
+                                           the reminder; the show latency is measured from it.
+        """
+        if not self.window.winfo_exists():
+            self._build()  # The window was destroyed behind our back, e.g. by the root closing
+        was_showing = self.is_showing
+        self._offered_callback = offered_callback
+        self._snooze_callback = snooze_callback
+        for prayer_name in prayer_names:
+            if prayer_name not in self.prayers:
+                self._acquire_row().bind(
+                    prayer_name,
+                    lambda p=prayer_name: self._answer(p, self._offered_callback),
+                    lambda p=prayer_name: self._answer(p, self._snooze_callback),
+                )
+        self._refresh_header()
+
+        if was_showing:
+            self.window.lift()  # Already on screen with the Azan playing; just add the rows
+            return
+        self._shown_at = time.perf_counter() if received_at is None else received_at
+        play_azan_sound(self.prayers[0])
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()  # Grab the user's attention
+
+    def hide(self):
+        """Withdraws the window and clears its rows, keeping them for the next reminder."""
+        for row in self._rows:
+            row.release()
+        self._offered_callback = None
+        self._snooze_callback = None
+        self._shown_at = None
+        self.window.withdraw()
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of times the window was shown and the latency from receipt
+                  to the first drawn frame in milliseconds (last, max and average).
+        """
+        stats = dict(self._stats)
+        stats["avg_latency_ms"] = stats["total_latency_ms"] / stats["shown"] if stats["shown"] else 0.0
+        return stats
+
+    def _build(self):
+        """Creates the window and its header, centered and withdrawn."""
+        popup = ctk.CTkToplevel(self.master)
+        popup.withdraw()  # Withdrawn straight away so it never flashes on screen
+        popup.title("Prayer Reminder")
+        popup.resizable(False, False)
+        popup.attributes("-topmost", True)  # Keep the popup on top of all other windows
+        popup.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._screen_size = (popup.winfo_screenwidth(), popup.winfo_screenheight())
+
+        self._label = ctk.CTkLabel(popup, text="", font=ctk.CTkFont(size=18))
+        self._label.pack(pady=(20, 10), padx=20)
+        self._rows_frame = ctk.CTkFrame(popup, fg_color="transparent")
+        self._rows_frame.pack(fill="x")
+        self._rows = []
+        popup.bind("<Expose>", self._on_expose, add="+")
+        self.window = popup
+        self._resize(1)
+
+    def _acquire_row(self):
+        """Returns a free row from the pool, creating one only if all are in use."""
+        for row in self._rows:
+            if row.prayer_name is None:
+                # Keep bound rows first, so `prayers` stays in display order
+                self._rows.remove(row)
+                self._rows.insert(len(self.prayers), row)
+                return row
+        row = _PrayerRow(self._rows_frame)
+        self._rows.append(row)
+        return row
+
+    def _refresh_header(self):
+        prayers = self.prayers
+        if len(prayers) == 1:
+            self.window.title(f"{prayers[0]} Reminder")
+            self._label.configure(text=f"It's time for {prayers[0]} prayer!")
+        else:
+            self.window.title("Prayer Reminders")
+            self._label.configure(text=f"It's time for {', '.join(prayers[:-1])} and {prayers[-1]} prayers!")
+        self._resize(len(prayers))
+
+    def _resize(self, rows):
+        """Sizes the window for a number of rows, keeping it centered. The size is
+        computed, so the window never has to be measured."""
+        height = POPUP_HEIGHT + POPUP_ROW_HEIGHT * (max(rows, 1) - 1)
+        screen_width, screen_height = self._screen_size
+        x = (screen_width - POPUP_WIDTH) // 2
+        y = (screen_height - height) // 2
+        self.window.geometry(f"{POPUP_WIDTH}x{height}+{x}+{y}")
+
+    def _answer(self, prayer_name, callback):
+        """Removes a prayer's row and reports the answer; the window goes once it is empty."""
+        for row in self._rows:
+            if row.prayer_name == prayer_name:
+                row.release()
+        if self.is_showing:
+            self._refresh_header()
+        else:
+            fade_azan_sound()
+            self.hide()
+        if callback:
+            callback(prayer_name)
+
+    def _on_close(self):
+        """Closing the window snoozes every prayer still on it."""
+        callback = self._snooze_callback
+        prayers = self.prayers
+        fade_azan_sound()
+        self.hide()
+        if callback:
+            for prayer_name in prayers:
+                callback(prayer_name)
+
+    def _on_expose(self, event=None):
+        """Records the show latency when the window draws its first frame."""
+        if self._shown_at is None:
+            return
+        latency_ms = (time.perf_counter() - self._shown_at) * 1000
+        self._shown_at = None
+        self._stats["shown"] += 1
+        self._stats["last_latency_ms"] = latency_ms
+        self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+        self._stats["total_latency_ms"] += latency_ms
+        utils.logging.info(f"Reminder for {', '.join(self.prayers)} drawn {latency_ms:.1f} ms after it was received.")
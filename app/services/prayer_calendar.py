@@ -5,117 +5,218 @@ data operations (loading/saving status) and orchestrates the UI rendering.
 """
 
 import customtkinter as ctk
-import json
-import os
+import sqlite3
 from datetime import datetime, timedelta
 
 from app.utils import config
 from app.utils.utils import logging
+from app.utils.storage import get_storage, make_status_key
+from app.utils.status_history import StatusHistory
+from app.utils.prayer_schedule import get_schedule
 from app.views import calendar_view  # Import the new view module
 
 
 # --- Data Handling Functions ---
 
-def _load_status_data():
+def _load_status_data(start=None, end=None):
     """
-    Loads the prayer status data from its JSON file in the models directory.
+    Loads prayer statuses from the configured storage backend.
+
+    Args:
+        start (str, optional): The first date (YYYY-MM-DD) to include.
+        end (str, optional): The last date (YYYY-MM-DD) to include.
     """
-    if os.path.exists(config.PRAYER_STATUS_FILE):
-        try:
-            with open(config.PRAYER_STATUS_FILE, "r") as f:
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
-            logging.error(f"Failed to read prayer status file: {e}")
+    try:
+        return get_storage().load_statuses(start, end)
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read prayer status data: {e}")
     return {}
 
 
+def _load_status_history():
+    """
+    Loads the whole prayer status history as a bit-packed StatusHistory.
+    """
+    try:
+        return get_storage().load_status_history()
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read prayer status history: {e}")
+    return StatusHistory()
+
+
 def _save_status_data(data):
     """
-    Saves the provided prayer status data to its JSON file.
+    Saves the provided prayer statuses, leaving all other stored statuses untouched.
+    Statuses mapped to None are removed.
     """
     try:
-        with open(config.PRAYER_STATUS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-        logging.info("Prayer status data saved successfully.")
-    except IOError as e:
+        changed = get_storage().patch_statuses(data)
+        logging.info(f"Prayer status data saved successfully ({changed} changed).")
+    except (IOError, sqlite3.Error) as e:
         logging.error(f"Failed to save prayer status data: {e}")
 
 
+class StatusChangeTracker:
+    """
+    Remembers which calendar statuses the user actually changed, so saving
+    only has to persist those keys.
+    """
+
+    def __init__(self):
+        self._initial = {}
+        self._changed = {}
+
+    def update(self, key, value, initial):
+        """
+        Records a new value for a status.
+
+        Args:
+            key (str): The status key, e.g. "2025-06-20_Fajr".
+            value (str): The value the user selected.
+            initial (str): The value before the change; only used the first time a key is seen.
+        """
+        initial = self._initial.setdefault(key, initial)
+        if value == initial:
+            self._changed.pop(key, None)  # Changed back to what is stored
+        else:
+            self._changed[key] = value
+
+    def changes(self):
+        """
+        Returns:
+            dict: The status keys whose value differs from what was loaded.
+        """
+        return dict(self._changed)
+
+
 # --- Logic Helper Functions ---
 
-def _should_disable_button(date, today, prayer_time_str):
+def _should_disable_button(date, today, schedule, prayer):
     """
     Determines if a prayer status button should be disabled (i.e., is in the future).
+
+    Args:
+        date (datetime.date): The calendar day of the button.
+        today (datetime.date): The current day.
+        schedule (CompiledSchedule): Today's compiled prayer schedule.
+        prayer (str): The name of the prayer the button belongs to.
     """
     if date > today:
         return True
     if date == today:
-        if not prayer_time_str:  # If no time is set for today, disable
-            return True
-        now_time = datetime.now().time()
-        prayer_time = datetime.strptime(prayer_time_str, "%H:%M").time()
-        return now_time < prayer_time
+        # Disabled until the prayer time is reached, or if no time is set for today
+        return not schedule.has_passed(prayer)
     return False  # For all past dates
 
 
-# --- Main Service Function ---
+# --- Main Service Class ---
 
-def open_calendar_view(root_frame, get_today_times_callback, switch_to_dashboard):
+class CalendarPage:
     """
-    Creates and displays the 7-day prayer calendar view.
-
-    Args:
-        root_frame (ctk.CTk): The main application window.
-        get_today_times_callback (function): A function that returns today's prayer times.
-        switch_to_dashboard (function): A function to call to return to the dashboard.
-
-    Returns:
-        ctk.CTkFrame: The main frame for the calendar view.
+    The prayer calendar page. It is built once and kept alive: showing it
+    again refreshes only the cells whose status, disabled state or date
+    changed, and at midnight the visible range rolls forward without a
+    rebuild. The calendar opens on today and can be scrolled back through
+    the whole recorded history (at least config.CALENDAR_HISTORY_DAYS) and
+    forward config.CALENDAR_FUTURE_DAYS.
     """
-    frame = ctk.CTkFrame(root_frame, fg_color="transparent")
-
-    title = ctk.CTkLabel(frame, text="7-Day Prayer Calendar", font=ctk.CTkFont(size=22, weight="bold"))
-    title.pack(pady=10)
-
-    # --- Prepare data for the view ---
-    today = datetime.now().date()
-    all_statuses = _load_status_data()
-    today_times = get_today_times_callback()
-    dates_data = []
-    for i in range(7):
-        date = today + timedelta(days=i)
-        dates_data.append({
-            "date": date,
-            "is_today": date == today,
-            "statuses": all_statuses,
-            "prayer_disabled_status": {
-                prayer: _should_disable_button(date, today, today_times.get(prayer))
-                for prayer in config.PRAYER_NAMES
-            }
-        })
-
-    status_vars = {}  # This will be populated by the view
-
-    # --- Build the UI using the view module ---
-    def show_dropdown_callback(var, btn):
-        """Wrapper to call the dropdown display function from the view."""
-        calendar_view.display_status_dropdown(root_frame, var, btn)
-
-    calendar_view.build_calendar_frame(frame, dates_data, status_vars, show_dropdown_callback)
-
-    # --- Save and Back Button ---
-    def save_and_back():
-        """Saves all current statuses and switches back to the dashboard."""
-        updated_data = {key: var.get() for key, var in status_vars.items()}
-        # Merge with existing data to preserve history
-        final_data = all_statuses
-        final_data.update(updated_data)
-        _save_status_data(final_data)
-
-        frame.destroy()  # Destroy the frame to ensure it's fresh next time
-        switch_to_dashboard()
-
-    back_btn = ctk.CTkButton(frame, text="Back to Dashboard", command=save_and_back)
-    back_btn.pack(pady=15)
-
-    return frame
\ No newline at end of file
+
+    def __init__(self, root_frame, get_schedule_callback, switch_to_dashboard):
+        """
+        Args:
+            root_frame (ctk.CTk): The main application window.
+            get_schedule_callback (function): A function that returns today's CompiledSchedule.
+            switch_to_dashboard (function): A function to call to return to the dashboard.
+        """
+        self._get_schedule_callback = get_schedule_callback
+        self._switch_to_dashboard = switch_to_dashboard
+
+        self.frame = ctk.CTkFrame(root_frame, fg_color="transparent")
+        title = ctk.CTkLabel(self.frame, text="Prayer Calendar", font=ctk.CTkFont(size=22, weight="bold"))
+        title.pack(pady=10)
+
+        # --- Prepare data for the view ---
+        self.today = datetime.now().date()
+        self.history = _load_status_history()  # A private copy, so edits stay local until saved
+        self.schedule = get_schedule_callback()
+        self.tracker = StatusChangeTracker()
+
+        # --- Build the UI using the view module ---
+        def show_dropdown_callback(var, btn):
+            """Wrapper to call the dropdown display function from the view."""
+            calendar_view.display_status_dropdown(root_frame, var, btn)
+
+        self.calendar = calendar_view.VirtualCalendar(
+            self.frame, *self._day_range(), self._get_day, show_dropdown_callback, self._on_status_change
+        )
+        self.calendar.scroll_to(self.today)
+
+        back_btn = ctk.CTkButton(self.frame, text="Back to Dashboard", command=self.save_and_back)
+        back_btn.pack(pady=15)
+
+        self._schedule_rollover()
+
+    def refresh(self):
+        """
+        Brings the page up to date before it is shown again. Statuses come from
+        the storage cache, and only cells whose content changed are reconfigured.
+        """
+        self.history = _load_status_history()
+        self.schedule = self._get_schedule_callback()
+        today = datetime.now().date()
+        if today != self.today:
+            self._roll_forward(today)
+        else:
+            self.calendar.refresh()
+
+    def save_and_back(self):
+        """Saves the statuses the user changed and switches back to the dashboard."""
+        changes = self.tracker.changes()
+        if changes:
+            # The storage backend merges these into the existing history
+            _save_status_data(changes)
+            self.tracker = StatusChangeTracker()
+        self._switch_to_dashboard()
+
+    def _day_range(self):
+        """Returns the (first_day, last_day) the calendar can scroll between."""
+        first_day = self.today - timedelta(days=config.CALENDAR_HISTORY_DAYS)
+        if self.history.first_day and self.history.first_day < first_day:
+            first_day = self.history.first_day
+        return first_day, self.today + timedelta(days=config.CALENDAR_FUTURE_DAYS)
+
+    def _get_day(self, date):
+        """Returns the view data for one day, read from the history on demand."""
+        schedule = self.schedule
+        if schedule.day != self.today:
+            # The scheduler may not have rolled over yet; today's deadlines must be today's
+            schedule = get_schedule(schedule.prayer_times, self.today)
+        statuses = tuple(status or config.DEFAULT_PRAYER_STATUS for status in self.history.get_day(date))
+        disabled = tuple(_should_disable_button(date, self.today, schedule, prayer) for prayer in self.history.prayers)
+        return date == self.today, statuses, disabled
+
+    def _on_status_change(self, date, prayer, status):
+        """Keeps the history in sync with the view and records the change for saving."""
+        initial = self.history.get(date, prayer) or config.DEFAULT_PRAYER_STATUS
+        self.tracker.update(make_status_key(date.isoformat(), prayer), status, initial)
+        self.history.set(date, prayer, status)
+
+    def _roll_forward(self, today):
+        """Moves the page to a new day, keeping the widgets and any unsaved edits."""
+        self.today = today
+        self.calendar.set_range(*self._day_range())
+        self.calendar.scroll_to(today)
+        logging.info(f"Prayer calendar rolled forward to {today}.")
+
+    def _schedule_rollover(self):
+        """Arms a timer that rolls the calendar forward just after the next midnight."""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay_ms = int((midnight - now).total_seconds() * 1000) + 1000
+        self.frame.after(delay_ms, self._on_midnight)
+
+    def _on_midnight(self):
+        today = datetime.now().date()
+        if today != self.today:
+            self._roll_forward(today)
+        self._schedule_rollover()
@@ -3,66 +3,173 @@
 """
 This module contains the ReminderScheduler class, which runs in a separate
 thread to monitor prayer times and manage notifications without blocking the UI.
+
+Instead of polling on a fixed interval, the scheduler keeps priority queues
+(heaps) of absolute deadlines and sleeps until the earliest one is due.
 """
 
+import heapq
 import threading
-import time
 from datetime import datetime, timedelta
 
 # Import the refactored utility and configuration modules
 from app.utils import utils
 from app.utils import config
+from app.utils.clock import SystemClock
+from app.utils.prayer_schedule import get_schedule
 
 class ReminderScheduler(threading.Thread):
     """
     A thread-based scheduler for managing prayer time reminders and snoozes.
     """
 
-    def __init__(self, notification_queue):
+    def __init__(self, notification_queue, clock=None):
         """
         Initializes the scheduler thread.
 
         Args:
             notification_queue (queue.Queue): A thread-safe queue for sending
                                               notification events to the GUI thread.
+            clock (optional): The time source used for reading the time and sleeping.
+                              Defaults to the real system clock.
         """
         super().__init__(daemon=True)
         self.notification_queue = notification_queue
+        self.clock = clock or SystemClock()
         self._stop_event = threading.Event()
+        # Guards the schedule below and wakes the run loop early when it changes
+        self._wakeup = threading.Condition()
 
         self.reminders_today = {}       # Dict of active prayer times for the current day
         self.snoozed_reminders = {}     # Dict of prayers currently in a snoozed state
         self.last_checked_date = None   # The date of the last prayer time refresh
+        self.schedule = None            # The shared CompiledSchedule for the current day
+
+        # Min-heaps of (deadline, prayer_name). Entries that no longer match the
+        # dicts above are stale and are discarded lazily when they reach the top.
+        self._regular_deadlines = []
+        self._snooze_deadlines = []
 
         self.reload_times()
 
-    def reload_times(self):
+    def reload_times(self, now=None):
         """
         Refreshes prayer times from the user's file and resets the daily schedule.
+
+        Args:
+            now (datetime, optional): The moment to build the schedule for. Defaults to now.
         """
-        all_times = utils.load_prayer_times()
-        self.reminders_today = {
-            name: time_str for name, time_str in all_times.items() if time_str
-        }
-        self.last_checked_date = datetime.now().date()
+        now = now or self.clock.now()
+        all_times = self._load_times()
+        with self._wakeup:
+            self.reminders_today = {
+                name: time_str for name, time_str in all_times.items() if time_str
+            }
+            self.last_checked_date = now.date()
+            self.schedule = get_schedule(all_times, self.last_checked_date)
+            self._regular_deadlines = self._build_regular_deadlines(now)
+            self._wakeup.notify()
         utils.logging.info(f"Scheduler reloaded times for {self.last_checked_date}: {self.reminders_today}")
 
+    def _load_times(self):
+        """
+        Reads the prayer times the daily schedule is built from.
+
+        Returns:
+            dict: A dictionary of prayer names to times (HH:MM).
+        """
+        return utils.load_prayer_times()
+
+    def _build_regular_deadlines(self, now):
+        """
+        Builds a heap of today's absolute deadlines from the compiled schedule.
+
+        A prayer is still scheduled if its minute has not fully passed yet, which
+        matches the old behaviour of firing anywhere within the matching minute.
+
+        Args:
+            now (datetime): The current datetime.
+
+        Returns:
+            list: A heapified list of (deadline, prayer_name) tuples.
+        """
+        # Already in chronological order, which satisfies the heap invariant
+        return [
+            (deadline, prayer_name) for deadline, prayer_name in self.schedule.deadlines()
+            if deadline + timedelta(minutes=1) > now
+        ]
+
     def run(self):
         """
-        The main background loop that continuously monitors for prayer times.
+        The main background loop. It sleeps until the next deadline (a reminder,
+        a snooze expiry or midnight) and is woken early whenever the schedule changes.
         This method is executed when the thread starts.
         """
         utils.logging.info("Reminder scheduler thread started.")
         while not self._stop_event.is_set():
-            now = datetime.now()
+            self.run_pending(self.clock.now())
+            with self._wakeup:
+                if self._stop_event.is_set():
+                    break
+                # Measured under the lock, so a snooze made while notifications
+                # were being sent is not slept through
+                self.clock.wait(self._wakeup, self._sleep_seconds(self.clock.now()))
+
+        utils.logging.info("Scheduler thread has stopped.")
+
+    def run_pending(self, now):
+        """
+        Performs one pass of the scheduling loop: handles a day change and fires
+        every due reminder and snooze.
 
+        Due reminders are collected under the lock and sent after releasing it,
+        because putting into the queue may wait for the GUI thread, which in
+        turn may be waiting for the lock to snooze a prayer or reload times.
+
+        Args:
+            now (datetime): The current datetime.
+
+        Returns:
+            float: The number of seconds the loop should sleep before the next pass.
+        """
+        with self._wakeup:
             self._check_for_day_change(now)
-            self._check_regular_reminders(now)
-            self._check_snoozed_reminders(now)
+            due = self._check_regular_reminders(now) + self._check_snoozed_reminders(now)
+            timeout = self._sleep_seconds(now)
 
-            time.sleep(config.SCHEDULER_CHECK_INTERVAL_SECONDS)
+        for prayer_name, due_at in due:
+            self._trigger_notification(prayer_name, due_at)
+        return timeout
 
-        utils.logging.info("Scheduler thread has stopped.")
+    def _sleep_seconds(self, now):
+        """Returns how long to sleep until the next deadline; the caller must hold the lock."""
+        timeout = (self._earliest_deadline(now) - now).total_seconds()
+        # Cap the sleep so wall-clock jumps (suspend, DST) are noticed
+        return max(0.0, min(timeout, config.SCHEDULER_MAX_SLEEP_SECONDS))
+
+    def next_deadline(self, now=None):
+        """
+        Finds the earliest moment the run loop has any work to do.
+
+        Args:
+            now (datetime, optional): The current datetime. Defaults to the clock's time.
+
+        Returns:
+            datetime: The earliest pending reminder, snooze expiry or the next midnight.
+        """
+        now = now or self.clock.now()
+        with self._wakeup:
+            return self._earliest_deadline(now)
+
+    def _earliest_deadline(self, now):
+        """Returns next_deadline(now); the caller must hold the lock."""
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        candidates = [next_midnight]
+        if self._regular_deadlines:
+            candidates.append(self._regular_deadlines[0][0])
+        if self._snooze_deadlines:
+            candidates.append(self._snooze_deadlines[0][0])
+        return min(candidates)
 
     def _check_for_day_change(self, now):
         """
@@ -73,46 +180,69 @@ class ReminderScheduler(threading.Thread):
         """
         if now.date() > self.last_checked_date:
             utils.logging.info("Midnight passed. Resetting reminders for new day.")
-            self.reload_times()
+            self.reload_times(now)
 
     def _check_regular_reminders(self, now):
         """
-        Iterates through today's prayer times and triggers a notification if the time matches.
+        Pops every regular reminder whose deadline has been reached. The caller must hold the lock.
 
         Args:
             now (datetime): The current datetime.
+
+        Returns:
+            list: (prayer_name, deadline) tuples to notify about.
         """
-        current_time_str = now.strftime('%H:%M')
-        # Iterate over a copy of the items to allow for safe deletion
-        for prayer_name, time_str in list(self.reminders_today.items()):
-            if time_str == current_time_str:
-                self._trigger_notification(prayer_name)
-                # Remove the prayer from the list to prevent multiple notifications
-                del self.reminders_today[prayer_name]
+        due = []
+        while self._regular_deadlines and self._regular_deadlines[0][0] <= now:
+            deadline, prayer_name = heapq.heappop(self._regular_deadlines)
+            # Skip entries left over from a previous schedule
+            if prayer_name not in self.reminders_today:
+                continue
+            due.append((prayer_name, deadline))
+            # Remove the prayer from the list to prevent multiple notifications
+            del self.reminders_today[prayer_name]
+        return due
 
     def _check_snoozed_reminders(self, now):
         """
-        Checks if any snoozed reminders have expired and re-triggers them.
+        Pops every snoozed reminder that has expired. The caller must hold the lock.
 
         Args:
             now (datetime): The current datetime.
+
+        Returns:
+            list: (prayer_name, snooze deadline) tuples to notify about again.
         """
-        # Iterate over a copy of the items to allow for safe deletion
-        for prayer_name, snooze_until_dt in list(self.snoozed_reminders.items()):
-            if now >= snooze_until_dt:
-                self._trigger_notification(prayer_name)
-                del self.snoozed_reminders[prayer_name]
+        due = []
+        while self._snooze_deadlines and self._snooze_deadlines[0][0] <= now:
+            snooze_until_dt, prayer_name = heapq.heappop(self._snooze_deadlines)
+            # A prayer snoozed twice leaves an older, stale entry behind
+            if self.snoozed_reminders.get(prayer_name) != snooze_until_dt:
+                continue
+            due.append((prayer_name, snooze_until_dt))
+            del self.snoozed_reminders[prayer_name]
+        return due
 
-    def _trigger_notification(self, prayer_name):
+    def _trigger_notification(self, prayer_name, due_at=None):
         """
         Places a notification request into the queue for the GUI to process.
 
         Args:
             prayer_name (str): The name of the prayer to notify about.
+            due_at (datetime, optional): The deadline the notification was scheduled for.
         """
-        utils.logging.info(f"Time for {prayer_name}. Sending notification request.")
+        if due_at is not None:
+            utils.logging.info(f"Time for {prayer_name} (due {due_at.strftime('%H:%M:%S')}). Sending notification request.")
+        else:
+            utils.logging.info(f"Time for {prayer_name}. Sending notification request.")
         self.notification_queue.put(('show_notification', prayer_name))
-        utils.log_user_action("notified", prayer_name)
+        self._log_action("notified", prayer_name)
+
+    def _log_action(self, *args):
+        """
+        Records a user-facing scheduler action; takes the same arguments as utils.log_user_action.
+        """
+        utils.log_user_action(*args)
 
     def snooze_prayer(self, prayer_name):
         """
@@ -121,10 +251,13 @@ class ReminderScheduler(threading.Thread):
         Args:
             prayer_name (str): The name of the prayer to snooze.
         """
-        snooze_until = datetime.now() + timedelta(minutes=config.DEFAULT_SNOOZE_MINUTES)
-        self.snoozed_reminders[prayer_name] = snooze_until
+        snooze_until = self.clock.now() + timedelta(minutes=config.DEFAULT_SNOOZE_MINUTES)
+        with self._wakeup:
+            self.snoozed_reminders[prayer_name] = snooze_until
+            heapq.heappush(self._snooze_deadlines, (snooze_until, prayer_name))
+            self._wakeup.notify()
         utils.logging.info(f"{prayer_name} snoozed until {snooze_until.strftime('%H:%M:%S')}")
-        utils.log_user_action("snoozed", prayer_name, {"snooze_until": snooze_until.strftime('%H:%M')})
+        self._log_action("snoozed", prayer_name, {"snooze_until": snooze_until.strftime('%H:%M')})
 
     def acknowledge_prayer(self, prayer_name):
         """
@@ -134,13 +267,25 @@ class ReminderScheduler(threading.Thread):
             prayer_name (str): The name of the acknowledged prayer.
         """
         utils.logging.info(f"{prayer_name} acknowledged as 'Offered'.")
-        utils.log_user_action("offered", prayer_name)
+        self._log_action("offered", prayer_name)
 
     def stop(self):
         """
         Signals the scheduler thread to stop its execution loop gracefully.
         """
         self._stop_event.set()
+        with self._wakeup:
+            self._wakeup.notify()
+
+    def get_schedule(self):
+        """
+        Provides the compiled schedule of all prayer times for the current day,
+        including prayers that have already been notified.
+
+        Returns:
+            CompiledSchedule: The shared compiled schedule.
+        """
+        return self.schedule
 
     def get_today_times(self):
         """
@@ -149,4 +294,4 @@ class ReminderScheduler(threading.Thread):
         Returns:
             dict: A copy of the reminders_today dictionary.
         """
-        return self.reminders_today.copy()
\ No newline at end of file
+        return self.reminders_today.copy()
@@ -0,0 +1,142 @@
+# app/services/simulation.py
+
+"""
+This module replays the ReminderScheduler against a virtual clock. It drives
+the real scheduling loop through any date range as fast as the CPU allows and
+records every notification with its intended and actual fire time, which makes
+it usable both for regression tests and as a throughput benchmark.
+"""
+
+from datetime import datetime, timedelta
+
+from app.services.scheduler import ReminderScheduler
+from app.utils.clock import VirtualClock
+
+
+class FiredNotification:
+    """A single notification the scheduler queued during a simulation."""
+
+    def __init__(self, prayer_name, intended_at, fired_at):
+        self.prayer_name = prayer_name
+        self.intended_at = intended_at
+        self.fired_at = fired_at
+
+    @property
+    def latency_seconds(self):
+        """The delay between the scheduled deadline and the actual dispatch."""
+        return (self.fired_at - self.intended_at).total_seconds()
+
+    def __repr__(self):
+        return f"FiredNotification({self.prayer_name!r}, {self.intended_at}, {self.fired_at})"
+
+
+class SimulationResult:
+    """The outcome of a simulation run."""
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+        self.notifications = []  # FiredNotification objects, in dispatch order
+        self.actions = []        # (time, action_type, prayer_name) tuples
+        self.wakeups = 0         # Passes made through the scheduling loop
+
+    def max_latency_seconds(self):
+        """Returns the worst dispatch latency observed, or 0.0 if nothing fired."""
+        return max((n.latency_seconds for n in self.notifications), default=0.0)
+
+    def missed(self, times_for_date):
+        """
+        Lists every scheduled prayer in the simulated range that never fired.
+
+        Args:
+            times_for_date (callable): Returns the prayer times dict for a given date.
+
+        Returns:
+            list: (date, prayer_name) tuples for reminders that were never sent.
+        """
+        fired = {(n.intended_at.date(), n.prayer_name) for n in self.notifications}
+        missing = []
+        day = self.start.date()
+        while day <= self.end.date():
+            for prayer_name, time_str in times_for_date(day).items():
+                if not time_str:
+                    continue
+                due = datetime.combine(day, datetime.strptime(time_str, '%H:%M').time())
+                if self.start <= due < self.end and (day, prayer_name) not in fired:
+                    missing.append((day, prayer_name))
+            day += timedelta(days=1)
+        return missing
+
+
+class SimulatedScheduler(ReminderScheduler):
+    """
+    A ReminderScheduler whose prayer times come from a callable and whose
+    notifications and user actions are recorded in memory instead of being
+    sent to the GUI or written to the action log.
+    """
+
+    def __init__(self, clock, times_for_date, result):
+        """
+        Args:
+            clock (VirtualClock): The virtual clock driving the simulation.
+            times_for_date (callable): Returns the prayer times dict for a given date.
+            result (SimulationResult): The result object notifications are recorded into.
+        """
+        self._times_for_date = times_for_date
+        self._result = result
+        super().__init__(_DiscardingQueue(), clock=clock)
+
+    def _load_times(self):
+        return self._times_for_date(self.clock.now().date())
+
+    def _trigger_notification(self, prayer_name, due_at=None):
+        self._result.notifications.append(
+            FiredNotification(prayer_name, due_at or self.clock.now(), self.clock.now())
+        )
+        super()._trigger_notification(prayer_name, due_at)
+
+    def _log_action(self, action_type, prayer_name=None, extra_info=None):
+        self._result.actions.append((self.clock.now(), action_type, prayer_name))
+
+
+class _DiscardingQueue:
+    """A queue stand-in that drops messages; the simulation records them itself."""
+
+    def put(self, item):
+        pass
+
+
+def simulate(start, end, times_for_date, on_notification=None):
+    """
+    Runs the scheduler from `start` until `end` on a virtual clock.
+
+    Args:
+        start (datetime): The first simulated moment.
+        end (datetime): The moment the simulation stops (exclusive).
+        times_for_date (callable): Returns the prayer times dict (HH:MM) for a
+            date; pass `lambda day: times` for a fixed schedule.
+        on_notification (callable, optional): Called as
+            on_notification(scheduler, fired_notification) right after each
+            notification, e.g. to simulate the user snoozing or acknowledging it.
+
+    Returns:
+        SimulationResult: Every notification and user action plus the wakeup count.
+    """
+    result = SimulationResult(start=start, end=end)
+    clock = VirtualClock(start)
+    scheduler = SimulatedScheduler(clock, times_for_date, result)
+
+    handled = 0
+    while clock.now() < end:
+        timeout = scheduler.run_pending(clock.now())
+        result.wakeups += 1
+
+        if on_notification:
+            # Reactions may snooze prayers, so they run before the next sleep is taken
+            while handled < len(result.notifications):
+                on_notification(scheduler, result.notifications[handled])
+                handled += 1
+            timeout = min(timeout, (scheduler.next_deadline(clock.now()) - clock.now()).total_seconds())
+
+        clock.advance_to(min(clock.now() + timedelta(seconds=timeout), end))
+    return result
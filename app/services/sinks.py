@@ -0,0 +1,253 @@
+# app/services/sinks.py
+
+"""
+This module defines notification sinks: the places a reminder is delivered
+to besides the popup. Each sink receives a NotificationEvent and delivers it
+somewhere (the terminal, a log file, an external command, an HTTP webhook, a
+Unix socket, the Azan audio). None of them import a GUI toolkit. The
+SinkFanout in app/services/fanout.py runs each sink on its own thread.
+"""
+
+import json
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import threading
+import urllib.request
+from datetime import datetime
+
+from app.utils import config
+from app.utils import utils
+
+
+class NotificationEvent:
+    """A reminder produced by the scheduler, in a form sinks can render or serialize."""
+
+    def __init__(self, kind, prayer_name, timestamp=None):
+        """
+        Args:
+            kind (str): The scheduler message type, e.g. "show_notification".
+            prayer_name (str): The prayer the reminder is for.
+            timestamp (datetime, optional): When the reminder fired. Defaults to now.
+        """
+        self.kind = kind
+        self.prayer_name = prayer_name
+        self.timestamp = timestamp or datetime.now()
+
+    @classmethod
+    def from_message(cls, message):
+        """
+        Builds an event from a scheduler queue message such as ('show_notification', 'Asr').
+        """
+        kind, prayer_name = message
+        return cls(kind, prayer_name)
+
+    def describe(self):
+        """Returns a one-line, human-readable description of the event."""
+        return f"[{self.timestamp:%Y-%m-%d %H:%M:%S}] It's time for {self.prayer_name} prayer!"
+
+    def to_dict(self):
+        """Returns a JSON-serializable representation of the event."""
+        return {"type": self.kind, "prayer": self.prayer_name, "timestamp": self.timestamp.isoformat()}
+
+
+class NotificationSink:
+    """
+    The interface every sink implements.
+    """
+
+    name = "sink"
+
+    def notify(self, event):
+        """
+        Delivers one event. Exceptions are logged by the caller and do not stop other sinks.
+
+        Args:
+            event (NotificationEvent): The reminder to deliver.
+        """
+        raise NotImplementedError
+
+    def open(self, scheduler):
+        """
+        Prepares the sink before the first event, e.g. by warming up a device.
+
+        Args:
+            scheduler (ReminderScheduler): The scheduler whose reminders the sink will receive.
+        """
+
+    def close(self):
+        """Releases any resources held by the sink."""
+
+
+class StdoutSink(NotificationSink):
+    """Prints each reminder as a line on standard output (or another stream)."""
+
+    name = "stdout"
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def notify(self, event):
+        print(event.describe(), file=self.stream, flush=True)
+
+
+class LogFileSink(NotificationSink):
+    """Appends each reminder as a line to a text file."""
+
+    name = "log"
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str or Path, optional): The file to append to. Defaults to config.NOTIFICATION_LOG_FILE.
+        """
+        self.path = path or config.NOTIFICATION_LOG_FILE
+        self._lock = threading.Lock()
+
+    def notify(self, event):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(event.describe() + "\n")
+
+
+class CommandSink(NotificationSink):
+    """
+    Runs an external command for each reminder, e.g. `notify-send` or a home
+    automation script. The event is passed as the NAMAZ_EVENT and NAMAZ_PRAYER
+    environment variables, and any `{prayer}` placeholder in the command is replaced.
+    """
+
+    name = "command"
+
+    def __init__(self, command, timeout=None):
+        """
+        Args:
+            command (str): The command line, split like a POSIX shell would (no shell is used).
+            timeout (float, optional): Seconds before the command is killed.
+                                       Defaults to config.SINK_COMMAND_TIMEOUT_SECONDS.
+        """
+        self.command = shlex.split(command)
+        if not self.command:
+            raise ValueError("The command sink needs a command to run.")
+        self.timeout = timeout or config.SINK_COMMAND_TIMEOUT_SECONDS
+
+    def notify(self, event):
+        args = [part.replace("{prayer}", event.prayer_name) for part in self.command]
+        env = dict(os.environ, NAMAZ_EVENT=event.kind, NAMAZ_PRAYER=event.prayer_name)
+        result = subprocess.run(args, env=env, timeout=self.timeout, capture_output=True, text=True)
+        if result.returncode != 0:
+            utils.logging.warning(
+                f"Notification command exited with {result.returncode}: {result.stderr.strip()[:200]}"
+            )
+
+
+class WebhookSink(NotificationSink):
+    """POSTs each reminder as JSON (see NotificationEvent.to_dict) to an HTTP endpoint."""
+
+    name = "webhook"
+
+    def __init__(self, url, timeout=None):
+        """
+        Args:
+            url (str): The endpoint, e.g. "http://localhost:8123/api/webhook/namaz".
+            timeout (float, optional): Seconds to wait for the endpoint. Defaults to config.SINK_TIMEOUT_SECONDS.
+
+        Raises:
+            ValueError: If the URL is not an http(s) URL.
+        """
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"The webhook sink needs an http(s) URL, got {url!r}")
+        self.url = url
+        self.timeout = timeout or config.SINK_TIMEOUT_SECONDS
+
+    def notify(self, event):
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(event.to_dict()).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        # Error statuses raise HTTPError, which the fan-out counts as a failure
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class UnixSocketSink(NotificationSink):
+    """Writes each reminder as one JSON line to a Unix domain socket."""
+
+    name = "socket"
+
+    def __init__(self, path, timeout=None):
+        """
+        Args:
+            path (str): The socket to connect to.
+            timeout (float, optional): Seconds to wait for the connection and the write.
+                                       Defaults to config.SINK_TIMEOUT_SECONDS.
+
+        Raises:
+            ValueError: If the platform has no Unix domain sockets.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix socket sinks are not supported on this platform.")
+        self.path = path
+        self.timeout = timeout or config.SINK_TIMEOUT_SECONDS
+
+    def notify(self, event):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            sock.sendall(json.dumps(event.to_dict()).encode("utf-8") + b"\n")
+
+
+class AudioSink(NotificationSink):
+    """Plays the Azan on the shared audio engine, without any window."""
+
+    name = "audio"
+
+    def open(self, scheduler):
+        # Deferred so other sinks never load the audio stack; starting the
+        # engine here decodes the Azan before the first reminder is due.
+        from app.services.audio import get_audio_engine
+        get_audio_engine().follow_schedule(scheduler.get_schedule)
+
+    def notify(self, event):
+        from app.services.audio import get_audio_engine
+        get_audio_engine().play(event.prayer_name)
+
+    def close(self):
+        from app.services.audio import shutdown_audio_engine
+        shutdown_audio_engine()
+
+
+def build_sink(spec):
+    """
+    Creates a sink from a command line specification.
+
+    Args:
+        spec (str): One of "stdout", "log", "log:PATH", "command:COMMAND",
+                    "webhook:URL", "socket:PATH" or "audio".
+
+    Returns:
+        NotificationSink: The configured sink.
+
+    Raises:
+        ValueError: If the specification is not recognized.
+    """
+    kind, _, argument = spec.partition(":")
+    if kind == "stdout" and not argument:
+        return StdoutSink()
+    if kind == "log":
+        return LogFileSink(argument or None)
+    if kind == "command" and argument:
+        return CommandSink(argument)
+    if kind == "webhook" and argument:
+        return WebhookSink(argument)
+    if kind == "socket" and argument:
+        return UnixSocketSink(argument)
+    if kind == "audio" and not argument:
+        return AudioSink()
+    raise ValueError(f"Unknown notification sink: {spec!r}")
@@ -0,0 +1,353 @@
+# app/utils/action_log.py
+
+"""
+This module implements the user action log as an append-only, line-delimited
+JSON (JSONL) file. Each action costs one small append instead of re-reading
+and rewriting the whole history. The active file is rotated by size and by
+calendar day, and readers stream entries one line at a time.
+
+BufferedActionLogger sits in front of any writer so that callers on the
+scheduler or GUI thread never wait on disk I/O.
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+class ActionLogWriter:
+    """
+    Appends JSON entries to a log file, rotating it by size and by day.
+
+    Rotated files sit next to the active one as `<stem>.<YYYY-MM-DD>.jsonl`,
+    with a `.<n>` counter added when a day rotates more than once.
+    """
+
+    def __init__(self, path, max_bytes, rotate_daily=True):
+        """
+        Args:
+            path (str or Path): The active log file (e.g. user_logs.jsonl).
+            max_bytes (int): Rotate before an append would grow the file past this size.
+            rotate_daily (bool): Rotate when the first entry of a new day is written.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._day = None  # The day of the entries in the active file
+
+    def append(self, entry):
+        """
+        Appends one entry as a single JSON line.
+
+        Args:
+            entry (dict): A JSON-serializable log entry.
+        """
+        self.append_many([entry])
+
+    def append_many(self, entries):
+        """
+        Appends several entries with a single write.
+
+        Args:
+            entries (list): JSON-serializable log entries.
+        """
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+        if not data:
+            return
+        with self._lock:
+            self._open()
+            today = datetime.now().date()
+            if self._size and (
+                self._size + len(data) > self.max_bytes or (self.rotate_daily and today != self._day)
+            ):
+                self._rotate()
+                self._open()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+            self._day = today
+
+    def close(self):
+        """Closes the active file handle; the next append reopens it."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _open(self):
+        """Opens the active file for appending if it is not already open."""
+        if self._file:
+            return
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        if self._size:
+            self._day = datetime.fromtimestamp(os.path.getmtime(self.path)).date()
+
+    def _rotate(self):
+        """Moves the active file aside under a dated name."""
+        self._file.close()
+        self._file = None
+        day = (self._day or datetime.now().date()).isoformat()
+        target = self.path.with_name(f"{self.path.stem}.{day}{self.path.suffix}")
+        counter = 1
+        while target.exists():
+            target = self.path.with_name(f"{self.path.stem}.{day}.{counter}{self.path.suffix}")
+            counter += 1
+        os.replace(self.path, target)
+        logging.info(f"Rotated action log to {target.name}")
+
+
+def rotated_files(path):
+    """
+    Lists the rotated siblings of a log file, oldest first.
+
+    Args:
+        path (str or Path): The active log file.
+
+    Returns:
+        list: Paths of the rotated files in chronological order.
+    """
+    path = Path(path)
+    pattern = re.compile(
+        rf"^{re.escape(path.stem)}\.(\d{{4}}-\d{{2}}-\d{{2}})(?:\.(\d+))?{re.escape(path.suffix)}$"
+    )
+    found = []
+    if path.parent.is_dir():
+        for candidate in path.parent.iterdir():
+            match = pattern.match(candidate.name)
+            if match:
+                found.append(((match.group(1), int(match.group(2) or 0)), candidate))
+    return [candidate for _, candidate in sorted(found)]
+
+
+def iter_actions(path):
+    """
+    Streams every entry of a log, rotated files first, without loading whole files.
+
+    Args:
+        path (str or Path): The active log file.
+
+    Yields:
+        dict: Log entries in the order they were written. Malformed lines are skipped.
+    """
+    for file_path in rotated_files(path) + [Path(path)]:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logging.warning(f"Skipping malformed line {line_number} in {file_path.name}")
+        except FileNotFoundError:
+            continue
+
+
+def migrate_legacy_log(legacy_path, path):
+    """
+    Converts a legacy JSON-array log into the JSONL log, once.
+
+    The legacy entries are placed before anything already in the JSONL file,
+    and the legacy file is renamed to `<name>.migrated` so this never runs again.
+
+    Args:
+        legacy_path (str or Path): The old user_logs.json file.
+        path (str or Path): The active JSONL log file.
+
+    Returns:
+        int: The number of entries migrated.
+    """
+    legacy_path, path = Path(legacy_path), Path(path)
+    if not legacy_path.exists():
+        return 0
+    try:
+        with open(legacy_path, "r") as f:
+            entries = json.load(f)
+    except (IOError, json.JSONDecodeError) as e:
+        logging.error(f"Could not migrate legacy log {legacy_path}: {e}")
+        return 0
+    if not isinstance(entries, list):
+        entries = []
+
+    os.makedirs(path.parent, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as out:
+        for entry in entries:
+            out.write(json.dumps(entry) + "\n")
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as existing:
+                for line in existing:
+                    out.write(line)
+    os.replace(temp_path, path)
+    os.replace(legacy_path, legacy_path.with_name(legacy_path.name + ".migrated"))
+    logging.info(f"Migrated {len(entries)} entries from {legacy_path.name} to {path.name}")
+    return len(entries)
+
+
+class BufferedActionLogger(threading.Thread):
+    """
+    A write-behind logger. Callers enqueue entries into a bounded in-memory
+    buffer and return immediately; a background thread hands them to `sink`
+    in batches once `batch_size` entries are waiting or `flush_interval`
+    seconds have passed since the oldest unwritten entry. When the buffer is
+    full, new entries are dropped and counted rather than blocking the caller.
+    """
+
+    _FLUSH = "flush"
+    _STOP = "stop"
+
+    def __init__(self, sink, max_queue, batch_size, flush_interval):
+        """
+        Args:
+            sink (callable): Called with a list of entries to persist them.
+            max_queue (int): The maximum number of entries held in memory.
+            batch_size (int): Flush as soon as this many entries are waiting.
+            flush_interval (float): The longest an entry waits before being flushed, in seconds.
+        """
+        super().__init__(daemon=True, name="ActionLogWriter")
+        self._sink = sink
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "flushes": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def enqueue(self, entry):
+        """
+        Buffers an entry without blocking.
+
+        Args:
+            entry (dict): A JSON-serializable log entry.
+
+        Returns:
+            bool: True if the entry was buffered, False if it was dropped.
+        """
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("enqueued")
+        return True
+
+    def flush(self, timeout=None):
+        """
+        Blocks until everything enqueued so far has been written.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+
+        Returns:
+            bool: True if the flush completed within the timeout.
+        """
+        return self._send_control(self._FLUSH, timeout)
+
+    def stop(self, timeout=None):
+        """
+        Writes any buffered entries and stops the writer thread.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+
+        Returns:
+            bool: True if the final flush completed within the timeout.
+        """
+        if not self.is_alive():
+            return True
+        done = self._send_control(self._STOP, timeout)
+        self.join(timeout)
+        return done
+
+    def stats(self):
+        """
+        Returns:
+            dict: Counters for enqueued, written, dropped and failed entries, the
+                  current queue depth, and flush count and latency in milliseconds.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["avg_flush_ms"] = stats["total_flush_ms"] / stats["flushes"] if stats["flushes"] else 0.0
+        return stats
+
+    def run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # The oldest buffered entry has waited long enough
+
+            if item is None:
+                self._write(batch)
+                batch = []
+            elif isinstance(item, tuple) and item[0] in (self._FLUSH, self._STOP):
+                self._write(batch)
+                batch = []
+                item[1].set()
+                if item[0] == self._STOP:
+                    return
+            else:
+                batch.append(item)
+                if len(batch) == 1:
+                    deadline = time.monotonic() + self._flush_interval
+                if len(batch) >= self._batch_size:
+                    self._write(batch)
+                    batch = []
+
+    def _send_control(self, command, timeout):
+        """Queues a flush/stop marker behind all pending entries and waits for it."""
+        if not self.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self._queue.put((command, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def _write(self, batch):
+        """Hands a batch to the sink and records its latency."""
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            self._sink(batch)
+            written, failed = len(batch), 0
+        except Exception as e:
+            logging.error(f"Failed to write {len(batch)} action log entries: {e}")
+            written, failed = 0, len(batch)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._stats["written"] += written
+            self._stats["failed"] += failed
+            self._stats["flushes"] += 1
+            self._stats["last_flush_ms"] = elapsed_ms
+            self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], elapsed_ms)
+            self._stats["total_flush_ms"] += elapsed_ms
+
+    def _count(self, key):
+        with self._stats_lock:
+            self._stats[key] += 1
@@ -0,0 +1,79 @@
+# app/utils/clock.py
+
+"""
+This module provides the clock abstraction used by the scheduler. Services
+read the time and sleep only through a clock object, so tests and the
+simulation runner can substitute a virtual clock that never really waits.
+"""
+
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """
+    The real wall clock. Waiting blocks on the given condition variable.
+    """
+
+    def now(self):
+        """
+        Returns:
+            datetime: The current local time.
+        """
+        return datetime.now()
+
+    def wait(self, condition, timeout):
+        """
+        Blocks on `condition` for up to `timeout` seconds. The caller must hold it.
+
+        Args:
+            condition (threading.Condition): The condition that signals early wakeups.
+            timeout (float): The maximum number of seconds to wait.
+        """
+        condition.wait(timeout)
+
+
+class VirtualClock:
+    """
+    A manually driven clock. Waiting advances virtual time instantly, so a
+    scheduler loop runs as fast as the CPU allows.
+    """
+
+    def __init__(self, start):
+        """
+        Args:
+            start (datetime): The initial virtual time.
+        """
+        self._now = start
+
+    def now(self):
+        """
+        Returns:
+            datetime: The current virtual time.
+        """
+        return self._now
+
+    def advance(self, seconds):
+        """
+        Moves virtual time forward.
+
+        Args:
+            seconds (float): The number of seconds to advance. Negative values are ignored.
+        """
+        if seconds > 0:
+            self._now += timedelta(seconds=seconds)
+
+    def advance_to(self, moment):
+        """
+        Moves virtual time forward to `moment`; time never runs backwards.
+
+        Args:
+            moment (datetime): The target virtual time.
+        """
+        if moment > self._now:
+            self._now = moment
+
+    def wait(self, condition, timeout):
+        """
+        Returns immediately after advancing virtual time by `timeout` seconds.
+        """
+        self.advance(timeout)
@@ -26,8 +26,15 @@ DATA_DIR = BASE_DIR / "data" # For runtime data if needed
 
 # --- Model File Paths ---
 USER_TIMES_FILE = MODELS_DIR / "user_times.json"
-USER_LOG_FILE = MODELS_DIR / "user_logs.json"
+USER_LOG_FILE = MODELS_DIR / "user_logs.json" # Legacy JSON array, migrated on first use
+USER_ACTION_LOG_FILE = MODELS_DIR / "user_logs.jsonl"
 PRAYER_STATUS_FILE = MODELS_DIR / "prayer_status.json"
+DATABASE_FILE = MODELS_DIR / "namaz_reminder.db"
+
+# --- Storage Settings ---
+# "json" keeps the legacy whole-file JSON documents above; "sqlite" stores
+# everything in DATABASE_FILE (seeded from the JSON files on first use).
+STORAGE_BACKEND = "json"
 
 # --- Asset File Paths ---
 AZAN_SOUND_FILE = ASSETS_DIR / "azan.mp3"
@@ -36,7 +43,46 @@ APP_ICON_PNG = ASSETS_DIR / "icon.png"
 
 # --- Scheduler Settings ---
 DEFAULT_SNOOZE_MINUTES = 1
-SCHEDULER_CHECK_INTERVAL_SECONDS = 30
+# Upper bound on a single scheduler sleep; the loop normally wakes exactly at the
+# next deadline, this only guards against wall-clock jumps (suspend/resume, DST).
+SCHEDULER_MAX_SLEEP_SECONDS = 300
+
+# --- Action Log Settings ---
+ACTION_LOG_MAX_BYTES = 1024 * 1024  # Rotate the action log once it reaches 1 MiB
+ACTION_LOG_ROTATE_DAILY = True      # Also start a new file for each calendar day
+ACTION_LOG_QUEUE_SIZE = 1000        # Entries buffered in memory before new ones are dropped
+ACTION_LOG_BATCH_SIZE = 50          # Write as soon as this many entries are buffered
+ACTION_LOG_FLUSH_INTERVAL_SECONDS = 2.0  # ...or once the oldest buffered entry is this old
+
+# --- Notification Settings ---
+NOTIFICATION_COALESCE_MS = 250  # Reminders arriving this close together share one popup update
+
+# --- Audio Settings ---
+AUDIO_MIXER_BUFFER = 512  # Mixer buffer in samples; smaller starts sooner (512 at 44.1 kHz is ~12 ms)
+AUDIO_FADE_OUT_MS = 500   # How long the Azan fades out once a reminder is answered
+PRAYER_AZAN_FILES = {}    # Per-prayer overrides of AZAN_SOUND_FILE, e.g. {"Fajr": ASSETS_DIR / "azan_fajr.mp3"}
+PRE_ALERT_SOUND_FILE = ASSETS_DIR / "pre_alert.mp3"  # Short chime; skipped if the file is missing
+AUDIO_CACHE_BUDGET_BYTES = 64 * 1024 * 1024  # Decoded clips kept in memory (a 3-minute Azan is ~30 MiB)
+AUDIO_PREFETCH_LEAD_SECONDS = 600  # Decode the next prayer's clip this long before it is due
+PRE_ALERT_LEAD_SECONDS = 300  # Play the pre-alert chime this long before each prayer; 0 turns it off
+
+# --- Notification Sink Settings ---
+NOTIFICATION_LOG_FILE = MODELS_DIR / "notifications.log"  # Default file for the "log" sink
+SINK_COMMAND_TIMEOUT_SECONDS = 30  # A "command" sink process is killed after this long
+SINK_TIMEOUT_SECONDS = 5  # How long "webhook" and "socket" sinks wait for the other end
+SINK_QUEUE_SIZE = 100     # Reminders buffered per sink before new ones are dropped
+NOTIFICATION_SINKS = []   # Sink specs used when --sink is not given, e.g. ["log", "webhook:http://..."]
+
+# --- AI Assistant Settings ---
+AI_RESPONSE_CACHE_FILE = MODELS_DIR / "ai_response_cache.db"  # None keeps answers in memory only
+AI_RESPONSE_CACHE_MEMORY_ENTRIES = 128  # Recent answers held in memory
+AI_RESPONSE_CACHE_TTL_SECONDS = 30 * 24 * 3600  # Cached answers are asked again after this long
+AI_RESPONSE_CACHE_MAX_BYTES = 5 * 1024 * 1024   # Answer text kept on disk; least recently used go first
+
+# --- Dashboard Settings ---
+DASHBOARD_TICK_MARGIN_MS = 5  # Fire each tick this long after the wall-clock second turns
+QUEUE_POLL_INTERVAL_MS = 100  # How often scheduler events are checked where they cannot wake Tk (Windows, plain queues)
+BACKGROUND_QUEUE_POLL_INTERVAL_MS = 1000  # ...and how often while hidden in the system tray
 
 # --- Calendar View Settings ---
 STATUS_OPTIONS = ["Completed", "Late", "Not Completed"]
@@ -44,4 +90,8 @@ STATUS_COLORS = {
     "Completed": "#228B22",  # ForestGreen
     "Late": "#FFA500",      # Orange
     "Not Completed": "#808080" # Gray
-}
\ No newline at end of file
+}
+DEFAULT_PRAYER_STATUS = "Not Completed"  # Shown for prayers with no recorded status
+CALENDAR_VISIBLE_DAYS = 2     # Day sections kept as widgets; scrolling rebinds them
+CALENDAR_HISTORY_DAYS = 365   # How far back the calendar scrolls when there is less history
+CALENDAR_FUTURE_DAYS = 6      # Upcoming days shown after today
\ No newline at end of file
@@ -0,0 +1,95 @@
+# app/utils/file_cache.py
+
+"""
+This module provides FileCache, an in-memory cache of parsed file contents.
+An entry stays valid while the file's inode, size and modification time are
+unchanged, so repeated loads cost a single os.stat() instead of a full read
+and parse. Writers push the object they just saved with put(), keeping the
+cache warm without re-reading the file.
+"""
+
+import os
+import threading
+
+
+class FileCache:
+    """
+    A thread-safe cache of parsed objects, revalidated against file metadata.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # path -> (signature, parsed object)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, path, loader):
+        """
+        Returns the parsed contents of `path`, calling `loader` only if the file
+        changed since it was last loaded or saved through this cache.
+
+        Args:
+            path (str or Path): The file to read.
+            loader (callable): Called as loader(path) to read and parse the file.
+
+        Returns:
+            The cached or freshly loaded object, or None if the file does not exist.
+        """
+        key = os.fspath(path)
+        signature = _signature(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if signature is not None and entry is not None and entry[0] == signature:
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        if signature is None:
+            return None
+
+        value = loader(path)
+        with self._lock:
+            self._entries[key] = (signature, value)
+        return value
+
+    def put(self, path, value):
+        """
+        Records `value` as the current contents of `path` right after it was written.
+
+        Args:
+            path (str or Path): The file that was just written.
+            value: The object that was serialized into it.
+        """
+        key = os.fspath(path)
+        signature = _signature(key)
+        with self._lock:
+            if signature is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (signature, value)
+
+    def invalidate(self, path=None):
+        """
+        Drops the cached entry for `path`, or every entry if no path is given.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.fspath(path), None)
+
+    def stats(self):
+        """
+        Returns:
+            dict: The number of cache 'hits' and 'misses' and cached 'entries'.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "entries": len(self._entries)}
+
+
+def _signature(path):
+    """Returns the metadata that identifies a file version, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
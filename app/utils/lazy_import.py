@@ -0,0 +1,53 @@
+# app/utils/lazy_import.py
+
+"""
+This module provides lazy_import(), which returns a module object whose code
+only runs the first time one of its attributes is used. Heavy optional
+dependencies (the Gemini SDK, pygame) are imported this way so that they
+cost nothing at startup and are only loaded if the feature is actually used.
+"""
+
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name):
+    """
+    Imports a module lazily. The module is located immediately, so a missing
+    package still fails at import time, but it is executed on first attribute access.
+
+    Args:
+        name (str): The absolute module name, e.g. "pygame" or "google.generativeai".
+
+    Returns:
+        module: The (possibly not yet executed) module, registered in sys.modules.
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(module):
+    """
+    Args:
+        module (module): A module, possibly returned by lazy_import().
+
+    Returns:
+        bool: False while a lazily imported module has not been executed yet.
+    """
+    # LazyLoader swaps the module's class back to ModuleType once it has loaded
+    return type(module) is types.ModuleType
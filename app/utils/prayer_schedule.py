@@ -0,0 +1,133 @@
+# app/utils/prayer_schedule.py
+
+"""
+This module provides the CompiledSchedule class: a day's prayer times parsed
+once into sorted epoch deadlines. The dashboard, the scheduler and the calendar
+share one instance per (times, day), so the "HH:MM" strings are parsed only
+when the times change or the day rolls over, and the next prayer is found with
+a binary search instead of re-parsing and sorting on every call.
+"""
+
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+
+class CompiledSchedule:
+    """
+    An immutable, pre-parsed view of one day's prayer times.
+    """
+
+    __slots__ = ("day", "prayer_times", "_names", "_deadlines", "_index", "_first_tomorrow")
+
+    def __init__(self, prayer_times, day):
+        """
+        Parses and sorts the prayer times for the given day.
+
+        Args:
+            prayer_times (dict): A dictionary of prayer names to times (HH:MM).
+                                 Empty or invalid entries are skipped.
+            day (datetime.date): The calendar day the times apply to.
+        """
+        self.day = day
+        self.prayer_times = dict(prayer_times)
+
+        parsed = []
+        for name, time_str in prayer_times.items():
+            try:
+                prayer_time = datetime.strptime(time_str, '%H:%M').time()
+            except (ValueError, TypeError):
+                continue  # Skip invalid time formats or None values
+            parsed.append((datetime.combine(day, prayer_time).timestamp(), name))
+        parsed.sort()
+
+        self._names = tuple(name for _, name in parsed)
+        self._deadlines = tuple(deadline for deadline, _ in parsed)
+        self._index = {name: i for i, name in enumerate(self._names)}
+        # The first prayer of tomorrow, assuming the same times; used once today's are over
+        self._first_tomorrow = None
+        if parsed:
+            first = datetime.fromtimestamp(self._deadlines[0])
+            self._first_tomorrow = datetime.combine(day + timedelta(days=1), first.time()).timestamp()
+
+    def __len__(self):
+        return len(self._names)
+
+    def next_prayer(self, now=None):
+        """
+        Finds the next upcoming prayer in O(log n).
+
+        Args:
+            now (float, optional): The current epoch time. Defaults to time.time().
+
+        Returns:
+            tuple: (prayer_name, remaining_seconds), or (None, None) if no times are set.
+                   Once today's prayers are over, the first prayer of tomorrow is returned.
+        """
+        if not self._names:
+            return None, None
+        if now is None:
+            now = time.time()
+        i = bisect_right(self._deadlines, now)
+        if i < len(self._deadlines):
+            return self._names[i], self._deadlines[i] - now
+        return self._names[0], self._first_tomorrow - now
+
+    def deadline(self, prayer_name):
+        """
+        Args:
+            prayer_name (str): The name of a prayer.
+
+        Returns:
+            datetime or None: Today's deadline for the prayer, or None if it has no valid time.
+        """
+        i = self._index.get(prayer_name)
+        return None if i is None else datetime.fromtimestamp(self._deadlines[i])
+
+    def has_passed(self, prayer_name, now=None):
+        """
+        Args:
+            prayer_name (str): The name of a prayer.
+            now (float, optional): The current epoch time. Defaults to time.time().
+
+        Returns:
+            bool: True if the prayer has a valid time today and that time has been reached.
+        """
+        i = self._index.get(prayer_name)
+        if i is None:
+            return False
+        return (time.time() if now is None else now) >= self._deadlines[i]
+
+    def deadlines(self):
+        """
+        Returns:
+            list: (deadline_datetime, prayer_name) tuples in chronological order.
+        """
+        return [(datetime.fromtimestamp(d), name) for d, name in zip(self._deadlines, self._names)]
+
+
+# --- Shared Instance ---
+
+_lock = threading.Lock()
+_current = None
+
+
+def get_schedule(prayer_times, day=None):
+    """
+    Returns the shared CompiledSchedule for the given times and day, compiling
+    a new one only if either differs from the last request.
+
+    Args:
+        prayer_times (dict): A dictionary of prayer names to times (HH:MM).
+        day (datetime.date, optional): The day to compile for. Defaults to today.
+
+    Returns:
+        CompiledSchedule: The shared compiled schedule.
+    """
+    global _current
+    day = day or datetime.now().date()
+    with _lock:
+        if _current is None or _current.day != day or _current.prayer_times != prayer_times:
+            _current = CompiledSchedule(prayer_times, day)
+        return _current
@@ -0,0 +1,269 @@
+# app/utils/response_cache.py
+
+"""
+This module provides ResponseCache, a two-tier cache of AI assistant answers.
+Prompts are normalized (case, whitespace, trailing punctuation) and keyed
+together with a version string for the model and its system instruction, so
+changing either invalidates old answers. Recent answers live in an in-memory
+LRU; all answers are kept in a small SQLite database with a time-to-live and
+a size cap, so repeat questions are answered without a network round-trip
+even after a restart.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from app.utils import config
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt):
+    """
+    Reduces a prompt to the form used for cache lookups.
+
+    Args:
+        prompt (str): The user's question.
+
+    Returns:
+        str: The prompt case-folded, with runs of whitespace collapsed and
+             trailing punctuation removed ("How many rakats in Isha?" and
+             "how many rakats in isha" are the same question).
+    """
+    return _WHITESPACE.sub(" ", prompt).strip().casefold().rstrip("?!.").rstrip()
+
+
+class ResponseCache:
+    """
+    A thread-safe response cache with an in-memory LRU tier and an optional
+    SQLite tier. Disk errors are logged and the cache carries on in memory.
+
+    Lookups never write: access times are kept in memory and written in one
+    batch before the size cap is enforced, once ACCESS_FLUSH_BATCH are
+    pending, and on close().
+    """
+
+    ACCESS_FLUSH_BATCH = 64
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key      TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            created  REAL NOT NULL,
+            accessed REAL NOT NULL,
+            size     INTEGER NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+    """
+
+    def __init__(self, path=None, memory_entries=None, ttl_seconds=None, max_bytes=None, clock=time.time):
+        """
+        Args:
+            path (str or Path, optional): The SQLite file for the disk tier; None keeps
+                                          the cache in memory only.
+            memory_entries (int, optional): Answers held in memory.
+                                            Defaults to config.AI_RESPONSE_CACHE_MEMORY_ENTRIES.
+            ttl_seconds (float, optional): How long an answer stays valid.
+                                           Defaults to config.AI_RESPONSE_CACHE_TTL_SECONDS.
+            max_bytes (int, optional): The most answer text kept on disk; the least recently
+                                       used answers are removed beyond it.
+                                       Defaults to config.AI_RESPONSE_CACHE_MAX_BYTES.
+            clock (callable): Returns the current epoch time, for tests.
+        """
+        self.memory_entries = memory_entries or config.AI_RESPONSE_CACHE_MEMORY_ENTRIES
+        self.ttl_seconds = ttl_seconds or config.AI_RESPONSE_CACHE_TTL_SECONDS
+        self.max_bytes = max_bytes or config.AI_RESPONSE_CACHE_MAX_BYTES
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (response, created), least recently used first
+        self._accessed = {}  # key -> access time not yet written to disk
+        self._stats = {"requests": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+        self._db = None
+        if path is not None:
+            self._open(Path(path))
+
+    @staticmethod
+    def make_key(prompt, version):
+        """
+        Args:
+            prompt (str): The user's question.
+            version (str): Identifies the model and system instruction that answer it.
+
+        Returns:
+            str: The cache key.
+        """
+        return hashlib.sha256(f"{version}\0{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+    def get(self, prompt, version):
+        """
+        Looks an answer up in memory, then on disk.
+
+        Args:
+            prompt (str): The user's question.
+            version (str): Identifies the model and system instruction.
+
+        Returns:
+            str or None: The cached answer, or None on a miss or if it has expired.
+        """
+        key = self.make_key(prompt, version)
+        now = self._clock()
+        with self._lock:
+            self._stats["requests"] += 1
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[1] < self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    self._touch(key, now)
+                    return entry[0]
+                del self._memory[key]
+
+            row = self._execute(
+                "SELECT response, created FROM responses WHERE key = ? AND created > ?",
+                (key, now - self.ttl_seconds),
+            )
+            row = row.fetchone() if row else None
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, row[0], row[1])
+            self._touch(key, now)
+            return row[0]
+
+    def put(self, prompt, version, response):
+        """
+        Stores an answer in both tiers.
+
+        Args:
+            prompt (str): The user's question.
+            version (str): Identifies the model and system instruction.
+            response (str): The answer to cache.
+        """
+        key = self.make_key(prompt, version)
+        now = self._clock()
+        with self._lock:
+            self._stats["stores"] += 1
+            self._remember(key, response, now)
+            self._accessed.pop(key, None)  # Superseded by the row written below
+            if self._execute(
+                "INSERT OR REPLACE INTO responses (key, response, created, accessed, size) VALUES (?, ?, ?, ?, ?)",
+                (key, response, now, now, len(response.encode("utf-8"))),
+            ):
+                self._evict(now)
+
+    def clear(self):
+        """Drops every cached answer from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._accessed.clear()
+            self._execute("DELETE FROM responses")
+
+    def stats(self):
+        """
+        Returns:
+            dict: Lookups, hits per tier, misses and stores, the overall hit rate,
+                  and the number of answers and bytes held in each tier.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            row = self._execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            stats["disk_entries"], stats["disk_bytes"] = row.fetchone() if row else (0, 0)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        stats["hit_rate"] = hits / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+    def close(self):
+        """Writes pending access times and closes the database; the cache keeps working in memory."""
+        with self._lock:
+            self._flush_access_times()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # --- Internals (called with the lock held) ---
+
+    def _open(self, path):
+        try:
+            os.makedirs(path.parent, exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+            with self._db:
+                self._db.executescript(self._SCHEMA)
+                # Expired answers are never served, so drop them once per start
+                self._db.execute(
+                    "DELETE FROM responses WHERE created <= ?", (self._clock() - self.ttl_seconds,)
+                )
+        except (OSError, sqlite3.Error) as e:
+            logging.error(f"AI response cache unavailable on disk, using memory only: {e}")
+            self._db = None
+
+    def _execute(self, statement, parameters=()):
+        """Runs a statement on the disk tier; returns None if there is none or it failed."""
+        if self._db is None:
+            return None
+        try:
+            with self._db:
+                return self._db.execute(statement, parameters)
+        except sqlite3.Error as e:
+            logging.error(f"AI response cache error: {e}")
+            return None
+
+    def _remember(self, key, response, created):
+        self._memory[key] = (response, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key, now):
+        """Records a use, so the size cap evicts the least recently used answers."""
+        if self._db is None:
+            return
+        self._accessed[key] = now
+        if len(self._accessed) >= self.ACCESS_FLUSH_BATCH:
+            self._flush_access_times()
+
+    def _flush_access_times(self):
+        """Writes the pending access times in one transaction."""
+        if not self._accessed or self._db is None:
+            return
+        pending, self._accessed = self._accessed, {}
+        try:
+            with self._db:
+                self._db.executemany(
+                    "UPDATE responses SET accessed = ? WHERE key = ?",
+                    [(accessed, key) for key, accessed in pending.items()],
+                )
+        except sqlite3.Error as e:
+            logging.error(f"AI response cache error: {e}")
+
+    def _evict(self, now):
+        """Removes expired answers, then the least recently used ones over the size cap."""
+        self._flush_access_times()
+        self._execute("DELETE FROM responses WHERE created <= ?", (now - self.ttl_seconds,))
+        row = self._execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+        excess = (row.fetchone()[0] if row else 0) - self.max_bytes
+        if excess <= 0:
+            return
+        keys = []
+        rows = self._execute("SELECT key, size FROM responses ORDER BY accessed")
+        for key, size in rows or []:
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        if self._db is not None:
+            try:
+                with self._db:
+                    self._db.executemany("DELETE FROM responses WHERE key = ?", keys)
+            except sqlite3.Error as e:
+                logging.error(f"AI response cache error: {e}")
+        for key, in keys:
+            self._memory.pop(key, None)
@@ -0,0 +1,213 @@
+# app/utils/startup_profiler.py
+
+"""
+This module provides StartupProfiler, which backs the `--profile-startup`
+mode of main.py. It records a timeline of named startup phases, the time
+spent executing every module imported while it runs (split into self and
+cumulative time), and peak Python memory via tracemalloc. Results can be
+printed as a sorted report, saved as JSON, and compared to a baseline.
+Memory tracing slows imports down, so timings are comparable with each other
+and with other profiled runs, not with an unprofiled launch.
+"""
+
+import importlib.abc
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class _TimedLoader:
+    """Wraps a module loader to time module creation and execution."""
+
+    def __init__(self, loader, timer):
+        self._loader = loader
+        self._timer = timer
+
+    def create_module(self, spec):
+        # Extension modules do most of their work here
+        with self._timer.timing(spec.name):
+            return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        try:
+            with self._timer.timing(module.__name__):
+                self._loader.exec_module(module)
+        finally:
+            # Give the module its real loader back so nothing else sees the wrapper
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    A meta path finder that defers to the real finders and wraps the loader
+    of every spec they return, so each import's execution time is recorded.
+    """
+
+    def __init__(self):
+        self.imports = {}  # module name -> [self_seconds, cumulative_seconds]
+        self._stack = []   # [name, child_seconds] of the imports in progress
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    @contextmanager
+    def timing(self, name):
+        frame = [name, 0.0]
+        self._stack.append(frame)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += elapsed
+            entry = self.imports.setdefault(name, [0.0, 0.0])
+            entry[0] += elapsed - frame[1]
+            entry[1] += elapsed
+
+
+class StartupProfiler:
+    """
+    Collects a startup timeline, import times and peak memory.
+    """
+
+    def __init__(self):
+        self.phases = []  # (name, start_offset, duration) in seconds, in start order
+        self._open = {}
+        self._import_timer = _ImportTimer()
+        self._started = None
+        self.total_seconds = None
+        self.peak_memory_bytes = None
+
+    def start(self):
+        """Starts the clock, the import hook and memory tracing."""
+        tracemalloc.start()
+        sys.meta_path.insert(0, self._import_timer)
+        self._started = time.perf_counter()
+
+    def stop(self):
+        """Ends any open phases and stops tracing. Safe to call more than once."""
+        if self._started is None or self.total_seconds is not None:
+            return
+        for name in list(self._open):
+            self.end(name)
+        self.total_seconds = time.perf_counter() - self._started
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        self.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def begin(self, name):
+        """Marks the start of a phase that is ended later with end()."""
+        self._open[name] = time.perf_counter()
+
+    def end(self, name):
+        """Marks the end of a phase started with begin()."""
+        started = self._open.pop(name)
+        self.phases.append((name, started - self._started, time.perf_counter() - started))
+
+    @contextmanager
+    def phase(self, name):
+        """A context manager that records the enclosed code as one phase."""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def imports(self, limit=None):
+        """
+        Args:
+            limit (int, optional): Return at most this many entries.
+
+        Returns:
+            list: (module_name, self_seconds, cumulative_seconds) tuples, slowest self time first.
+        """
+        ranked = sorted(
+            ((name, own, total) for name, (own, total) in self._import_timer.imports.items()),
+            key=lambda entry: entry[1],
+            reverse=True
+        )
+        return ranked[:limit] if limit else ranked
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: A JSON-serializable summary of the profile.
+        """
+        return {
+            "total_seconds": self.total_seconds,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "phases": [
+                {"name": name, "start_seconds": start, "seconds": duration}
+                for name, start, duration in self.phases
+            ],
+            "imports": [
+                {"module": name, "self_seconds": own, "cumulative_seconds": total}
+                for name, own, total in self.imports()
+            ],
+        }
+
+    def write_json(self, path):
+        """Writes to_dict() to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self, top_imports=20):
+        """
+        Returns:
+            str: A human-readable report: phases slowest first, then the slowest imports.
+        """
+        lines = [f"Startup profile: {self.total_seconds * 1000:.1f} ms total, "
+                 f"peak traced memory {self.peak_memory_bytes / (1024 * 1024):.1f} MiB", "", "Phases:"]
+        for name, start, duration in sorted(self.phases, key=lambda phase: phase[2], reverse=True):
+            lines.append(f"  {duration * 1000:9.1f} ms  (at +{start * 1000:8.1f} ms)  {name}")
+        lines += ["", f"Slowest imports (self / cumulative), top {top_imports}:"]
+        for name, own, total in self.imports(top_imports):
+            lines.append(f"  {own * 1000:9.1f} ms  {total * 1000:9.1f} ms  {name}")
+        return "\n".join(lines)
+
+    def check_baseline(self, baseline):
+        """
+        Compares the profile against a baseline of budgets.
+
+        Args:
+            baseline (dict): {"tolerance": float, "total_seconds": float,
+                              "peak_memory_bytes": int, "phases": {name: seconds}}.
+                             A measurement regresses when it exceeds its budget times
+                             the tolerance; missing entries are not checked.
+
+        Returns:
+            list: A description of each regression; empty if there are none.
+        """
+        tolerance = baseline.get("tolerance", 1.0)
+        measured = {
+            "total_seconds": self.total_seconds,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+        measured.update({f"phase '{name}'": duration for name, _, duration in self.phases})
+        budgets = {key: baseline[key] for key in ("total_seconds", "peak_memory_bytes") if key in baseline}
+        budgets.update({f"phase '{name}'": seconds for name, seconds in baseline.get("phases", {}).items()})
+
+        regressions = []
+        for key, budget in budgets.items():
+            value = measured.get(key)
+            if value is not None and value > budget * tolerance:
+                regressions.append(f"{key}: {value:.3f} exceeds {budget} x {tolerance}")
+        return regressions
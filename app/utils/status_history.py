@@ -0,0 +1,267 @@
+# app/utils/status_history.py
+
+"""
+This module provides StatusHistory, a compact in-memory representation of the
+prayer status history. Each (day, prayer) pair is a 2-bit code stored in a
+bytearray indexed by the day's offset from an epoch date, so ten years of
+history take under five kilobytes and any lookup or update is O(1).
+
+Codes: 0 = no status recorded, 1..3 = config.STATUS_OPTIONS in order
+("Completed", "Late", "Not Completed").
+"""
+
+import logging
+import struct
+from datetime import date, timedelta
+
+from app.utils import config
+
+_CODES_PER_BYTE = 4
+_HEADER = struct.Struct("<4sBII")  # magic, prayer count, epoch ordinal, day count
+_MAGIC = b"NRSH"
+
+
+class StatusHistory:
+    """
+    A bit-packed store of prayer statuses keyed by (date, prayer).
+    """
+
+    def __init__(self, epoch=None, prayers=None):
+        """
+        Args:
+            epoch (datetime.date, optional): The first day covered. Defaults to the
+                first day that is set.
+            prayers (list, optional): The prayer names, in order. Defaults to config.PRAYER_NAMES.
+        """
+        self.prayers = tuple(prayers or config.PRAYER_NAMES)
+        self._prayer_index = {name: i for i, name in enumerate(self.prayers)}
+        self._status_codes = {status: i + 1 for i, status in enumerate(config.STATUS_OPTIONS)}
+        self._statuses = (None,) + tuple(config.STATUS_OPTIONS)
+        self.epoch = epoch
+        self._days = 0
+        self._bits = bytearray()
+
+    # --- Single Values ---
+
+    def get(self, day, prayer):
+        """
+        Args:
+            day (datetime.date): The calendar day.
+            prayer (str): The prayer name.
+
+        Returns:
+            str or None: The recorded status, or None if nothing is recorded.
+        """
+        if self.epoch is None:
+            return None
+        offset = (day - self.epoch).days
+        if offset < 0 or offset >= self._days:
+            return None
+        return self._statuses[self._get_code(offset * len(self.prayers) + self._prayer_index[prayer])]
+
+    def set(self, day, prayer, status):
+        """
+        Records a status, growing the covered range if needed.
+
+        Args:
+            day (datetime.date): The calendar day.
+            prayer (str): The prayer name.
+            status (str or None): One of config.STATUS_OPTIONS, or None to clear it.
+
+        Raises:
+            KeyError: If the prayer or status is unknown.
+        """
+        code = 0 if status is None else self._status_codes[status]
+        slot = self._prayer_index[prayer]
+        if code == 0 and self.get(day, prayer) is None:
+            return  # Clearing an unset value must not grow the store
+        self._ensure_day(day)
+        self._set_code((day - self.epoch).days * len(self.prayers) + slot, code)
+
+    def get_day(self, day):
+        """
+        Args:
+            day (datetime.date): The calendar day.
+
+        Returns:
+            tuple: The day's statuses in prayer order (None where nothing is recorded).
+        """
+        count = len(self.prayers)
+        offset = -1 if self.epoch is None else (day - self.epoch).days
+        if not 0 <= offset < self._days:
+            return (None,) * count
+        base = offset * count
+        return tuple(self._statuses[self._get_code(base + i)] for i in range(count))
+
+    # --- Ranges ---
+
+    def get_range(self, start, end):
+        """
+        Returns the statuses of every day from `start` to `end` inclusive.
+
+        Args:
+            start (datetime.date): The first day.
+            end (datetime.date): The last day.
+
+        Returns:
+            list: One (date, tuple of statuses in prayer order) pair per day; days
+                  outside the stored range have all statuses as None.
+        """
+        rows = []
+        day = start
+        while day <= end:
+            rows.append((day, self.get_day(day)))
+            day += timedelta(days=1)
+        return rows
+
+    def set_range(self, start, rows):
+        """
+        Writes consecutive days of statuses starting at `start`.
+
+        Args:
+            start (datetime.date): The day of the first row.
+            rows (list): Tuples of statuses in prayer order (None leaves a prayer unset).
+        """
+        for i, statuses in enumerate(rows):
+            day = start + timedelta(days=i)
+            for prayer, status in zip(self.prayers, statuses):
+                self.set(day, prayer, status)
+
+    def copy(self):
+        """
+        Returns:
+            StatusHistory: An independent copy of this store.
+        """
+        clone = StatusHistory(self.epoch, self.prayers)
+        clone._days = self._days
+        clone._bits = bytearray(self._bits)
+        return clone
+
+    @property
+    def first_day(self):
+        """The first day covered by the store, or None if it is empty."""
+        return self.epoch if self._days else None
+
+    @property
+    def last_day(self):
+        """The last day covered by the store, or None if it is empty."""
+        return self.epoch + timedelta(days=self._days - 1) if self._days else None
+
+    @property
+    def nbytes(self):
+        """The size of the packed status data in bytes."""
+        return len(self._bits)
+
+    # --- Conversion ---
+
+    @classmethod
+    def from_json(cls, data, prayers=None):
+        """
+        Builds a store from the legacy flat dict such as {"2025-06-20_Fajr": "Completed"}.
+        Keys or statuses that cannot be represented are logged and skipped.
+
+        Args:
+            data (dict): The legacy status dictionary.
+            prayers (list, optional): The prayer names. Defaults to config.PRAYER_NAMES.
+
+        Returns:
+            StatusHistory: The packed history.
+        """
+        history = cls(prayers=prayers)
+        parsed = []
+        for key, status in data.items():
+            date_str, _, prayer = key.rpartition("_")
+            try:
+                day = date.fromisoformat(date_str)
+            except ValueError:
+                logging.warning(f"Skipping prayer status with malformed key: {key}")
+                continue
+            if prayer not in history._prayer_index or status not in history._status_codes:
+                logging.warning(f"Skipping unsupported prayer status {key}={status}")
+                continue
+            parsed.append((day, prayer, status))
+        if parsed:
+            # Size the store once up front instead of growing it entry by entry
+            history._ensure_day(min(day for day, _, _ in parsed))
+            history._ensure_day(max(day for day, _, _ in parsed))
+        for day, prayer, status in parsed:
+            history.set(day, prayer, status)
+        return history
+
+    def to_json(self):
+        """
+        Returns:
+            dict: The legacy flat dictionary containing every recorded status.
+        """
+        data = {}
+        for day, statuses in self.get_range(self.epoch, self.last_day) if self._days else []:
+            day_str = day.isoformat()
+            for prayer, status in zip(self.prayers, statuses):
+                if status is not None:
+                    data[f"{day_str}_{prayer}"] = status
+        return data
+
+    def to_bytes(self):
+        """
+        Serializes the store into a compact binary snapshot.
+
+        Returns:
+            bytes: A short header followed by the packed status codes.
+        """
+        epoch = self.epoch.toordinal() if self.epoch else 0
+        return _HEADER.pack(_MAGIC, len(self.prayers), epoch, self._days) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, payload, prayers=None):
+        """
+        Restores a store from a snapshot produced by to_bytes().
+
+        Raises:
+            ValueError: If the payload is not a valid snapshot for these prayers.
+        """
+        history = cls(prayers=prayers)
+        if len(payload) < _HEADER.size:
+            raise ValueError("Status history snapshot is truncated.")
+        magic, prayer_count, epoch, days = _HEADER.unpack_from(payload)
+        if magic != _MAGIC or prayer_count != len(history.prayers):
+            raise ValueError("Not a status history snapshot for this prayer list.")
+        history.epoch = date.fromordinal(epoch) if epoch else None
+        history._days = days
+        history._bits = bytearray(payload[_HEADER.size:])
+        if len(history._bits) != history._bytes_for(days):
+            raise ValueError("Status history snapshot has an unexpected length.")
+        return history
+
+    # --- Internals ---
+
+    def _bytes_for(self, days):
+        return (days * len(self.prayers) + _CODES_PER_BYTE - 1) // _CODES_PER_BYTE
+
+    def _get_code(self, index):
+        byte_index, slot = divmod(index, _CODES_PER_BYTE)
+        return (self._bits[byte_index] >> (slot * 2)) & 0b11
+
+    def _set_code(self, index, code):
+        byte_index, slot = divmod(index, _CODES_PER_BYTE)
+        shift = slot * 2
+        self._bits[byte_index] = (self._bits[byte_index] & ~(0b11 << shift)) | (code << shift)
+
+    def _ensure_day(self, day):
+        """Grows the covered range so that `day` has storage."""
+        if self.epoch is None:
+            self.epoch = day
+        offset = (day - self.epoch).days
+        if offset < 0:
+            # Prepend whole 4-day blocks: 4 * prayers codes is always a whole number
+            # of bytes, so the existing data can be shifted without repacking.
+            blocks = (-offset + _CODES_PER_BYTE - 1) // _CODES_PER_BYTE
+            shift_days = blocks * _CODES_PER_BYTE
+            self._bits[:0] = bytes(shift_days * len(self.prayers) // _CODES_PER_BYTE)
+            self.epoch -= timedelta(days=shift_days)
+            self._days += shift_days
+            offset += shift_days
+        if offset >= self._days:
+            self._days = offset + 1
+            missing = self._bytes_for(self._days) - len(self._bits)
+            if missing > 0:
+                self._bits.extend(bytes(missing))
@@ -0,0 +1,406 @@
+# app/utils/storage.py
+
+"""
+This module provides the pluggable persistence layer for prayer times, the
+prayer status history and the user action log.
+
+Two backends are available, selected by config.STORAGE_BACKEND:
+    - "json":   The legacy whole-file JSON documents in the models directory.
+    - "sqlite": A single SQLite database in WAL mode with indexed tables, where
+                single-row updates and date-range queries do not touch the rest
+                of the history.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from app.utils import config
+from app.utils import action_log
+from app.utils.file_cache import FileCache
+from app.utils.status_history import StatusHistory
+
+
+def split_status_key(key):
+    """
+    Splits a legacy status key such as "2025-06-20_Fajr" into its parts.
+
+    Returns:
+        tuple: (date_str, prayer_name), or None if the key is malformed.
+    """
+    date_str, sep, prayer_name = key.rpartition("_")
+    if not sep or not date_str or not prayer_name:
+        return None
+    return date_str, prayer_name
+
+
+def make_status_key(date_str, prayer_name):
+    """Builds the legacy status key for a date string and prayer name."""
+    return f"{date_str}_{prayer_name}"
+
+
+class StorageBackend:
+    """
+    The interface every storage backend implements. Dates are ISO strings
+    (YYYY-MM-DD) and statuses are keyed by "YYYY-MM-DD_Prayer".
+    """
+
+    def load_prayer_times(self):
+        """Returns the saved prayer times dict, or None if none are stored."""
+        raise NotImplementedError
+
+    def save_prayer_times(self, times):
+        """Replaces the saved prayer times. Raises OSError/sqlite3.Error on failure."""
+        raise NotImplementedError
+
+    def load_statuses(self, start=None, end=None):
+        """Returns statuses, optionally limited to dates in [start, end] (inclusive)."""
+        raise NotImplementedError
+
+    def save_statuses(self, statuses):
+        """Inserts or updates the given statuses, leaving all others untouched."""
+        raise NotImplementedError
+
+    def patch_statuses(self, changes):
+        """
+        Applies a delta to the status history: keys mapped to a status are
+        inserted or updated, keys mapped to None are removed. Entries that
+        already hold the given value are not rewritten.
+
+        Returns:
+            int: The number of stored entries that actually changed.
+        """
+        raise NotImplementedError
+
+    def load_status_history(self):
+        """Returns the whole status history as a bit-packed StatusHistory the caller may modify."""
+        return StatusHistory.from_json(self.load_statuses())
+
+    def append_actions(self, entries):
+        """Appends user action log entries."""
+        raise NotImplementedError
+
+    def iter_actions(self):
+        """Streams all user action log entries, oldest first."""
+        raise NotImplementedError
+
+    def cache_stats(self):
+        """Returns hit/miss counters for any in-memory cache the backend keeps."""
+        return {}
+
+    def close(self):
+        """Releases any open resources."""
+
+
+class JsonStorage(StorageBackend):
+    """
+    The legacy backend: each dataset is one JSON document that is rewritten in
+    full on every save. File paths are read from config on each call.
+
+    Parsed documents are kept in a FileCache, so loads only touch the disk
+    when a file was changed by something other than this backend.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._action_log = None
+        self._cache = FileCache()
+        self._history = (None, None)  # (parsed status dict, StatusHistory built from it)
+
+    def load_prayer_times(self):
+        times = self._cache.get(config.USER_TIMES_FILE, self._read_json)
+        return dict(times) if isinstance(times, dict) else times
+
+    def save_prayer_times(self, times):
+        self._write_json(config.USER_TIMES_FILE, dict(times), indent=4)
+
+    def load_statuses(self, start=None, end=None):
+        data = self._cache.get(config.PRAYER_STATUS_FILE, self._read_json) or {}
+        if start is None and end is None:
+            return dict(data)
+        return {key: value for key, value in data.items() if _key_in_range(key, start, end)}
+
+    def save_statuses(self, statuses):
+        self.patch_statuses(statuses)
+
+    def patch_statuses(self, changes):
+        with self._lock:
+            data = dict(self._cache.get(config.PRAYER_STATUS_FILE, self._read_json) or {})
+            changed = 0
+            for key, status in changes.items():
+                if status is None:
+                    if data.pop(key, None) is not None:
+                        changed += 1
+                elif data.get(key) != status:
+                    data[key] = status
+                    changed += 1
+            # The whole document is rewritten, so skip the write when nothing differs
+            if changed:
+                self._write_json(config.PRAYER_STATUS_FILE, data, indent=2)
+            return changed
+
+    def load_status_history(self):
+        data = self._cache.get(config.PRAYER_STATUS_FILE, self._read_json) or {}
+        with self._lock:
+            source, history = self._history
+            # The cache hands back the same dict until the file changes
+            if source is not data:
+                history = StatusHistory.from_json(data)
+                self._history = (data, history)
+        return history.copy()
+
+    def cache_stats(self):
+        """
+        Returns:
+            dict: Hit and miss counts of the parsed-file cache.
+        """
+        return self._cache.stats()
+
+    def append_actions(self, entries):
+        self._get_action_log().append_many(entries)
+
+    def iter_actions(self):
+        self._get_action_log()  # Ensures any legacy log has been migrated first
+        return action_log.iter_actions(config.USER_ACTION_LOG_FILE)
+
+    def close(self):
+        if self._action_log:
+            self._action_log.close()
+
+    def _get_action_log(self):
+        """Creates the JSONL action log writer, migrating the legacy array log once."""
+        with self._lock:
+            if self._action_log is None:
+                action_log.migrate_legacy_log(config.USER_LOG_FILE, config.USER_ACTION_LOG_FILE)
+                self._action_log = action_log.ActionLogWriter(
+                    config.USER_ACTION_LOG_FILE,
+                    max_bytes=config.ACTION_LOG_MAX_BYTES,
+                    rotate_daily=config.ACTION_LOG_ROTATE_DAILY
+                )
+            return self._action_log
+
+    @staticmethod
+    def _read_json(path):
+        """Reads a JSON document, returning None if it is missing or corrupt."""
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    return json.load(f)
+            except (IOError, json.JSONDecodeError) as e:
+                logging.error(f"Failed to read or parse {path}: {e}")
+        return None
+
+    def _write_json(self, path, data, indent):
+        """Writes a JSON document, creating its directory if needed, and caches it."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=indent)
+        except (IOError, TypeError, ValueError):
+            self._cache.invalidate(path)
+            raise
+        self._cache.put(path, data)
+
+
+class SqliteStorage(StorageBackend):
+    """
+    A SQLite backend. Each thread gets its own connection; WAL mode lets the
+    GUI thread read while the scheduler thread writes, and a busy timeout
+    serializes concurrent writers instead of failing them.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS prayer_times (
+            prayer TEXT PRIMARY KEY,
+            time   TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS prayer_status (
+            date   TEXT NOT NULL,
+            prayer TEXT NOT NULL,
+            status TEXT NOT NULL,
+            PRIMARY KEY (date, prayer)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS user_actions (
+            id        INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            action    TEXT NOT NULL,
+            prayer    TEXT,
+            details   TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS user_actions_timestamp ON user_actions (timestamp);
+    """
+
+    # Statements are fixed strings with placeholders, so sqlite3's per-connection
+    # statement cache keeps them prepared across calls.
+    _UPSERT_STATUS = (
+        "INSERT INTO prayer_status (date, prayer, status) VALUES (?, ?, ?) "
+        "ON CONFLICT (date, prayer) DO UPDATE SET status = excluded.status "
+        "WHERE status != excluded.status"
+    )
+    _DELETE_STATUS = "DELETE FROM prayer_status WHERE date = ? AND prayer = ?"
+    _SELECT_STATUS_RANGE = (
+        "SELECT date, prayer, status FROM prayer_status WHERE date BETWEEN ? AND ? ORDER BY date"
+    )
+    _SELECT_ALL_STATUS = "SELECT date, prayer, status FROM prayer_status ORDER BY date"
+    _INSERT_ACTION = "INSERT INTO user_actions (timestamp, action, prayer, details) VALUES (?, ?, ?, ?)"
+
+    def __init__(self, path):
+        """
+        Opens (and if needed creates) the database. A new database is seeded
+        from the legacy JSON files so switching backends keeps all history.
+
+        Args:
+            path (str or Path): The SQLite database file.
+        """
+        self.path = Path(path)
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        is_new = not self.path.exists()
+        os.makedirs(self.path.parent, exist_ok=True)
+        connection = self._connection()
+        with connection:
+            connection.executescript(self._SCHEMA)
+        if is_new:
+            self._import_legacy_json()
+
+    def _connection(self):
+        """Returns the calling thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def load_prayer_times(self):
+        rows = self._connection().execute("SELECT prayer, time FROM prayer_times").fetchall()
+        if not rows:
+            return None
+        # Return the prayers in their canonical order for display
+        order = {name: i for i, name in enumerate(config.PRAYER_NAMES)}
+        return dict(sorted(rows, key=lambda row: order.get(row[0], len(order))))
+
+    def save_prayer_times(self, times):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM prayer_times")
+            connection.executemany(
+                "INSERT INTO prayer_times (prayer, time) VALUES (?, ?)", times.items()
+            )
+
+    def load_statuses(self, start=None, end=None):
+        if start is None and end is None:
+            rows = self._connection().execute(self._SELECT_ALL_STATUS)
+        else:
+            rows = self._connection().execute(
+                self._SELECT_STATUS_RANGE, (start or "0000-00-00", end or "9999-99-99")
+            )
+        return {make_status_key(date_str, prayer): status for date_str, prayer, status in rows}
+
+    def save_statuses(self, statuses):
+        self.patch_statuses(statuses)
+
+    def patch_statuses(self, changes):
+        upserts, deletes = [], []
+        for key, status in changes.items():
+            parts = split_status_key(key)
+            if parts is None:
+                logging.warning(f"Ignoring malformed prayer status key: {key}")
+                continue
+            if status is None:
+                deletes.append(parts)
+            else:
+                upserts.append((parts[0], parts[1], status))
+        if not upserts and not deletes:
+            return 0
+        with self._connection() as connection:
+            before = connection.total_changes
+            if upserts:
+                connection.executemany(self._UPSERT_STATUS, upserts)
+            if deletes:
+                connection.executemany(self._DELETE_STATUS, deletes)
+            return connection.total_changes - before
+
+    def append_actions(self, entries):
+        rows = [
+            (entry.get("timestamp", ""), entry.get("action", ""), entry.get("prayer"),
+             json.dumps(entry.get("details") or {}))
+            for entry in entries
+        ]
+        with self._connection() as connection:
+            connection.executemany(self._INSERT_ACTION, rows)
+
+    def iter_actions(self):
+        cursor = self._connection().execute(
+            "SELECT timestamp, action, prayer, details FROM user_actions ORDER BY id"
+        )
+        for timestamp, action, prayer, details in cursor:
+            yield {"timestamp": timestamp, "action": action, "prayer": prayer, "details": json.loads(details)}
+
+    def close(self):
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _import_legacy_json(self):
+        """Copies the data held by the legacy JSON backend into a fresh database."""
+        legacy = JsonStorage()
+        times = legacy.load_prayer_times()
+        if times:
+            self.save_prayer_times(times)
+        statuses = legacy.load_statuses()
+        if statuses:
+            self.save_statuses(statuses)
+
+        batch = []
+        for entry in legacy.iter_actions():
+            batch.append(entry)
+            if len(batch) >= 1000:
+                self.append_actions(batch)
+                batch = []
+        if batch:
+            self.append_actions(batch)
+        legacy.close()
+        logging.info(f"Imported legacy JSON data into {self.path.name}")
+
+
+def _key_in_range(key, start, end):
+    """Checks whether a status key's date falls within [start, end]."""
+    parts = split_status_key(key)
+    if parts is None:
+        return False
+    return (start is None or parts[0] >= start) and (end is None or parts[0] <= end)
+
+
+# --- Shared Instance ---
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """
+    Returns the application-wide storage backend selected by config.STORAGE_BACKEND.
+
+    Returns:
+        StorageBackend: The shared backend instance.
+    """
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            if config.STORAGE_BACKEND == "sqlite":
+                _storage = SqliteStorage(config.DATABASE_FILE)
+            else:
+                _storage = JsonStorage()
+        return _storage
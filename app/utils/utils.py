@@ -5,13 +5,17 @@ This module provides utility functions for the application, including
 file I/O for prayer times and logs, time calculations, and logging setup.
 """
 
-import json
-import os
+import atexit
 import logging
+import sqlite3
+import threading
 from datetime import datetime, timedelta
 
 # Use the refactored config module for all constants
 from app.utils import config
+from app.utils.storage import get_storage
+from app.utils.action_log import BufferedActionLogger
+from app.utils.prayer_schedule import get_schedule
 
 # --- Logging Configuration ---
 # Set up a basic logger for the application.
@@ -25,49 +29,93 @@ logging.basicConfig(
 
 def load_prayer_times():
     """
-    Loads prayer times from the user_times.json file.
+    Loads prayer times from the configured storage backend.
 
     Returns:
         dict: A dictionary of prayer names to times (HH:MM).
-              Returns a default dict with "00:00" if the file is not found or corrupt.
-    """
-    if os.path.exists(config.USER_TIMES_FILE):
-        try:
-            with open(config.USER_TIMES_FILE, 'r') as f:
-                return json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
-            logging.error(f"Failed to read or parse {config.USER_TIMES_FILE}: {e}")
-    # Return default values if file doesn't exist or is invalid
+              Returns a default dict with "00:00" if no times are stored or they are unreadable.
+    """
+    try:
+        times = get_storage().load_prayer_times()
+        if times is not None:
+            return times
+    except sqlite3.Error as e:
+        logging.error(f"Failed to load prayer times: {e}")
+    # Return default values if nothing is stored or the data is invalid
     return {name: "00:00" for name in config.PRAYER_NAMES}
 
 
 def save_prayer_times(times):
     """
-    Saves the provided prayer times dictionary to the user_times.json file.
+    Saves the provided prayer times dictionary to the configured storage backend.
 
     Args:
         times (dict): A dictionary of prayer names to times (HH:MM).
 
     Returns:
-        bool: True if the file was saved successfully, False otherwise.
+        bool: True if the times were saved successfully, False otherwise.
     """
     try:
-        # os.makedirs works with pathlib objects and handles directory creation
-        os.makedirs(os.path.dirname(config.USER_TIMES_FILE), exist_ok=True)
-        with open(config.USER_TIMES_FILE, 'w') as f:
-            json.dump(times, f, indent=4)
+        get_storage().save_prayer_times(times)
         logging.info("Prayer times saved successfully.")
         return True
-    except IOError as e:
-        logging.error(f"Error writing to {config.USER_TIMES_FILE}: {e}")
+    except (IOError, sqlite3.Error) as e:
+        logging.error(f"Error saving prayer times: {e}")
         return False
 
 
 # --- User Action Logging ---
 
+_action_logger = None
+_action_logger_lock = threading.Lock()
+
+
+def _write_actions(entries):
+    """Persists a batch of action log entries; runs on the logger's writer thread."""
+    get_storage().append_actions(entries)
+
+
+def get_action_logger():
+    """
+    Returns the shared write-behind action logger, starting its writer thread on first use.
+
+    Returns:
+        BufferedActionLogger: The application-wide action logger.
+    """
+    global _action_logger
+    with _action_logger_lock:
+        if _action_logger is None:
+            _action_logger = BufferedActionLogger(
+                _write_actions,
+                max_queue=config.ACTION_LOG_QUEUE_SIZE,
+                batch_size=config.ACTION_LOG_BATCH_SIZE,
+                flush_interval=config.ACTION_LOG_FLUSH_INTERVAL_SECONDS
+            )
+            _action_logger.start()
+        return _action_logger
+
+
+def shutdown_action_logger(timeout=5.0):
+    """
+    Flushes any buffered action log entries and stops the writer thread.
+    Safe to call more than once, or if nothing was ever logged.
+
+    Args:
+        timeout (float): The maximum number of seconds to wait for the final flush.
+    """
+    global _action_logger
+    with _action_logger_lock:
+        logger, _action_logger = _action_logger, None
+    if logger:
+        if not logger.stop(timeout):
+            logging.warning("Timed out flushing the action log on shutdown.")
+        logging.info(f"Action logger stopped: {logger.stats()}")
+
+
 def log_user_action(action_type, prayer_name=None, extra_info=None):
     """
-    Appends a log entry to the user_logs.json file.
+    Queues a log entry for the user action log. The entry is written in the
+    background, so this never blocks the calling thread on disk I/O.
 
     Args:
         action_type (str): The type of action being logged (e.g., 'notified', 'offered').
@@ -81,25 +129,25 @@ def log_user_action(action_type, prayer_name=None, extra_info=None):
         "details": extra_info or {}
     }
 
-    logs = []
-    if os.path.exists(config.USER_LOG_FILE):
-        try:
-            with open(config.USER_LOG_FILE, 'r') as f:
-                existing_data = json.load(f)
-                # Ensure we are appending to a list, even if the file is malformed
-                if isinstance(existing_data, list):
-                    logs = existing_data
-        except (IOError, json.JSONDecodeError) as e:
-            logging.error(f"Could not read logs from {config.USER_LOG_FILE}: {e}. Starting a new log.")
+    if not get_action_logger().enqueue(log_entry):
+        logging.warning(f"Action log buffer is full; dropped '{action_type}' entry.")
 
-    logs.append(log_entry)
 
-    try:
-        os.makedirs(os.path.dirname(config.USER_LOG_FILE), exist_ok=True)
-        with open(config.USER_LOG_FILE, 'w') as f:
-            json.dump(logs, f, indent=4)
-    except IOError as e:
-        logging.error(f"Could not write logs to {config.USER_LOG_FILE}: {e}")
+def iter_user_actions():
+    """
+    Streams all logged user actions, oldest first, without loading the log into memory.
+    Entries still waiting in the write-behind buffer are flushed first.
+
+    Yields:
+        dict: Log entries with 'timestamp', 'action', 'prayer' and 'details' keys.
+    """
+    if _action_logger:
+        _action_logger.flush(timeout=5.0)
+    return get_storage().iter_actions()
+
+
+# Make sure buffered entries reach disk even if the app exits without quit_app_action
+atexit.register(shutdown_action_logger)
 
 
 # --- Time Calculation Logic ---
@@ -115,34 +163,25 @@ def get_next_prayer_info(current_times):
         tuple: A tuple containing (next_prayer_name, countdown_string).
                Returns ("N/A", "N/A") if no times are set.
     """
-    now = datetime.now()
-    prayer_times_today = []
+    return format_next_prayer(get_schedule(current_times))
 
-    for name, time_str in current_times.items():
-        try:
-            prayer_dt = datetime.strptime(time_str, '%H:%M').replace(
-                year=now.year, month=now.month, day=now.day
-            )
-            prayer_times_today.append((name, prayer_dt))
-        except (ValueError, TypeError):
-            continue  # Skip invalid time formats or None values
-
-    prayer_times_today.sort(key=lambda x: x[1])
-
-    # Find the next prayer that is later today
-    for name, prayer_dt in prayer_times_today:
-        if prayer_dt > now:
-            time_diff = prayer_dt - now
-            return name, str(timedelta(seconds=int(time_diff.total_seconds())))
-
-    # If all of today's prayers have passed, the next is the first one tomorrow
-    if prayer_times_today:
-        first_prayer_name, first_prayer_dt = prayer_times_today[0]
-        next_prayer_dt = first_prayer_dt + timedelta(days=1)
-        time_diff = next_prayer_dt - now
-        return first_prayer_name, str(timedelta(seconds=int(time_diff.total_seconds())))
-
-    return "N/A", "N/A"
+
+def format_next_prayer(schedule, now=None):
+    """
+    Formats the next prayer of a compiled schedule for display.
+
+    Args:
+        schedule (CompiledSchedule): Today's compiled prayer schedule.
+        now (float, optional): The current epoch time. Defaults to time.time().
+
+    Returns:
+        tuple: A tuple containing (next_prayer_name, countdown_string).
+               Returns ("N/A", "N/A") if no times are set.
+    """
+    name, remaining = schedule.next_prayer(now)
+    if name is None:
+        return "N/A", "N/A"
+    return name, str(timedelta(seconds=int(remaining)))
 
 def get_day_name(date_obj: datetime.date) -> str:
     """
@@ -1,112 +1,305 @@
 # app/views/calendar_view.py
 """
 This module is responsible for creating and rendering all the UI widgets
-for the 7-day prayer calendar view.
+for the prayer calendar view.
 """
 
+import weakref
+
 import customtkinter as ctk
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from app.utils import config
-from app.utils.utils import get_day_name  # We will move get_day_name to utils
+from app.utils.utils import get_day_name
 
 
-def build_calendar_frame(parent, dates_data, status_vars, show_dropdown_callback):
+class _DayRows:
     """
-    Constructs the main scrollable frame and populates it with 7 days of data.
-
-    Args:
-        parent (ctk.CTkFrame): The root frame to build the calendar inside.
-        dates_data (list): A list of dictionaries, each containing info for a single day.
-        status_vars (dict): A dictionary to store the StringVar for each prayer status.
-        show_dropdown_callback (function): The function to call when a status button is clicked.
+    The widgets for one day section: a date header and one row per prayer.
+    They are created once and re-bound to a different day while scrolling;
+    only cells whose text, color or state differs are reconfigured.
     """
-    content = ctk.CTkScrollableFrame(parent, fg_color="transparent", width=360, height=350)
-    content.pack(pady=10, padx=20)
 
-    for day_info in dates_data:
-        _render_day_section(content, day_info, status_vars, show_dropdown_callback)
+    def __init__(self, parent, on_status_click, on_status_change):
+        self.day = None
+        self._binding = False
+        self._on_status_change = on_status_change
+        self._applied_header = None
+        self._applied = {}  # prayer -> (status, disabled) currently shown
+
+        self.header = ctk.CTkLabel(parent, text="", font=ctk.CTkFont(size=16, weight="bold"))
+        self.header.pack(pady=(10, 5), anchor="w", padx=10)
+
+        self.buttons = {}
+        self.status_vars = {}
+        for prayer in config.PRAYER_NAMES:
+            status_var = ctk.StringVar(value=config.DEFAULT_PRAYER_STATUS)
+            status_var.trace_add("write", lambda *_, p=prayer: self._on_write(p))
+
+            row = ctk.CTkFrame(parent, fg_color="#2a2a2a")
+            row.pack(fill="x", padx=10, pady=3)
+
+            prayer_label = ctk.CTkLabel(row, text=prayer, width=60, anchor="w")
+            prayer_label.pack(side="left", padx=10)
+
+            btn = ctk.CTkButton(row, textvariable=status_var, width=140)
+            btn.pack(side="right", padx=10)
+            btn.configure(command=lambda v=status_var, b=btn: on_status_click(v, b))
+
+            self.buttons[prayer] = btn
+            self.status_vars[prayer] = status_var
+
+    def bind(self, day, is_today, statuses, disabled):
+        """
+        Shows a day in these widgets, touching only what changed since the last bind.
+
+        Args:
+            day (datetime.date): The day to display.
+            is_today (bool): Whether the day is today.
+            statuses (tuple): The statuses in config.PRAYER_NAMES order.
+            disabled (tuple): Whether each prayer's button is disabled, in the same order.
+        """
+        self.day = day
+        header = (day, is_today)
+        if header != self._applied_header:
+            self.header.configure(
+                text=day.strftime("%d %B - ") + get_day_name(day),
+                text_color="cyan" if is_today else "white"
+            )
+            self._applied_header = header
 
+        self._binding = True  # Re-binding is not a user change
+        try:
+            for prayer, status, is_disabled in zip(config.PRAYER_NAMES, statuses, disabled):
+                applied = self._applied.get(prayer, (None, None))
+                if applied == (status, is_disabled):
+                    continue
+                if status != applied[0]:
+                    self.status_vars[prayer].set(status)
+                self.buttons[prayer].configure(
+                    fg_color=config.STATUS_COLORS[status],
+                    state="disabled" if is_disabled else "normal"
+                )
+                self._applied[prayer] = (status, is_disabled)
+        finally:
+            self._binding = False
 
-def _render_day_section(parent, day_info, status_vars, show_dropdown_callback):
+    def _on_write(self, prayer):
+        if self._binding or self.day is None:
+            return
+        status = self.status_vars[prayer].get()
+        # The dropdown updates the button itself, so the shown value is already current
+        self._applied[prayer] = (status, self._applied.get(prayer, (None, False))[1])
+        self._on_status_change(self.day, prayer, status)
+
+
+class VirtualCalendar:
+    """
+    A scrollable calendar over an arbitrary range of days that keeps a fixed
+    pool of day sections. Scrolling re-binds the pooled widgets to the days
+    that come into view, so building and scrolling cost the same for a week
+    or for years of history.
     """
-    Renders a single day's section, including the date label and prayer status buttons.
 
-    Args:
-        parent (ctk.CTkFrame): The scrollable frame to render into.
-        day_info (dict): Contains all necessary data for rendering one day.
-        status_vars (dict): The dictionary to store created StringVars.
-        show_dropdown_callback (function): The function to call when a status button is clicked.
+    def __init__(self, parent, first_day, last_day, get_day, show_dropdown_callback,
+                 on_status_change, visible_days=None):
+        """
+        Args:
+            parent (ctk.CTkFrame): The frame to build the calendar inside.
+            first_day (datetime.date): The earliest day that can be scrolled to.
+            last_day (datetime.date): The latest day that can be scrolled to.
+            get_day (function): Called with a date; returns (is_today, statuses, disabled)
+                                where statuses and disabled follow config.PRAYER_NAMES.
+            show_dropdown_callback (function): Called with (status_var, button) when a status button is clicked.
+            on_status_change (function): Called with (date, prayer, status) when the user changes a status.
+            visible_days (int, optional): The number of pooled day sections.
+                                          Defaults to config.CALENDAR_VISIBLE_DAYS.
+        """
+        self.first_day = first_day
+        self.last_day = last_day
+        self._get_day = get_day
+        self.visible_days = visible_days or config.CALENDAR_VISIBLE_DAYS
+        self.offset = 0  # Index of the first visible day
+
+        self.container = ctk.CTkFrame(parent, fg_color="transparent", width=380, height=350)
+        self.container.pack(pady=10, padx=10)
+        self.container.pack_propagate(False)
+
+        self.scrollbar = ctk.CTkScrollbar(self.container, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        body = ctk.CTkFrame(self.container, fg_color="transparent")
+        body.pack(side="left", fill="both", expand=True)
+
+        self.rows = [
+            _DayRows(body, show_dropdown_callback, on_status_change)
+            for _ in range(self.visible_days)
+        ]
+        # One shared bind tag gives every pooled widget wheel scrolling with a single handler each
+        tag = f"VirtualCalendar{id(self)}"
+        for widget in self._all_widgets(self.container):
+            widget.bindtags((tag,) + widget.bindtags())
+        self.container.bind_class(tag, "<MouseWheel>", self._on_mousewheel)
+        self.container.bind_class(tag, "<Button-4>", lambda e: self.scroll_by(-1))
+        self.container.bind_class(tag, "<Button-5>", lambda e: self.scroll_by(1))
+
+    def set_range(self, first_day, last_day):
+        """
+        Changes the scrollable range, keeping the same day at the top when it is still in range.
+
+        Args:
+            first_day (datetime.date): The new earliest day.
+            last_day (datetime.date): The new latest day.
+        """
+        top = self.first_day + timedelta(days=self.offset)
+        self.first_day = first_day
+        self.last_day = last_day
+        self.scroll_to(top)
+
+    @property
+    def day_count(self):
+        """The number of days in the scrollable range."""
+        return (self.last_day - self.first_day).days + 1
+
+    def scroll_to(self, day):
+        """Scrolls so that `day` is the first visible day (clamped to the range)."""
+        self._set_offset((day - self.first_day).days)
+
+    def scroll_by(self, days):
+        """Scrolls up (negative) or down (positive) by a number of days."""
+        self._set_offset(self.offset + days)
+
+    def refresh(self):
+        """Re-binds every visible day section to the current data; unchanged cells are left alone."""
+        for i, rows in enumerate(self.rows):
+            index = self.offset + i
+            if index < self.day_count:
+                day = self.first_day + timedelta(days=index)
+                rows.bind(day, *self._get_day(day))
+        total = self.day_count
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_days) / total))
+
+    def yview(self, *args):
+        """The scrollbar command: handles ("moveto", fraction) and ("scroll", n, "units"|"pages")."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._set_offset(round(float(args[1]) * self.day_count))
+        elif args[0] == "scroll":
+            step = self.visible_days if args[2] == "pages" else 1
+            self.scroll_by(int(args[1]) * step)
+
+    def _set_offset(self, offset):
+        self.offset = max(0, min(offset, self.day_count - self.visible_days))
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        if event.delta:
+            self.scroll_by(-1 if event.delta > 0 else 1)
+
+    @staticmethod
+    def _all_widgets(widget):
+        """Yields a widget and all of its descendants."""
+        yield widget
+        for child in widget.winfo_children():
+            yield from VirtualCalendar._all_widgets(child)
+
+
+class StatusDropdown:
+    """
+    A pop-up menu for changing a prayer's status. One instance is created per
+    root window on first use; afterwards it is only withdrawn, re-targeted to
+    the clicked button and shown again, so no windows are created per click.
     """
-    date_str = day_info["date"].strftime("%d %B - ") + get_day_name(day_info["date"])
-    day_label = ctk.CTkLabel(parent, text=date_str, font=ctk.CTkFont(size=16, weight="bold"))
-    day_label.pack(pady=(10 if day_info["is_today"] else 5, 5), anchor="w", padx=10)
 
-    for prayer in config.PRAYER_NAMES:
-        key = f"{day_info['date'].strftime('%Y-%m-%d')}_{prayer}"
-        initial_status = day_info["statuses"].get(key, "Not Completed")
-        status_var = ctk.StringVar(value=initial_status)
-        status_vars[key] = status_var
+    def __init__(self, root):
+        """
+        Args:
+            root (ctk.CTk): The absolute root window of the application.
+        """
+        self.status_var = None
+        self.button = None
+
+        # A CTkToplevel without decorations (title bar, borders) looks like a menu
+        self.window = ctk.CTkToplevel(root)
+        self.window.overrideredirect(True)
+        self.window.withdraw()
+
+        self.option_buttons = []
+        for option in config.STATUS_OPTIONS:
+            opt_btn = ctk.CTkButton(self.window, text=option, command=lambda o=option: self.select(o))
+            opt_btn.pack(pady=2, padx=2)
+            self.option_buttons.append(opt_btn)
+        self._width = None
 
-        row = ctk.CTkFrame(parent, fg_color="#2a2a2a")
-        row.pack(fill="x", padx=10, pady=3)
+        # Hide the dropdown if the user clicks away from it
+        self.window.bind("<FocusOut>", lambda event: self.hide())
 
-        prayer_label = ctk.CTkLabel(row, text=prayer, width=60, anchor="w")
-        prayer_label.pack(side="left", padx=10)
+    def show(self, status_var, button):
+        """
+        Points the dropdown at a status button and shows it just below that button.
 
-        btn = ctk.CTkButton(
-            row,
-            textvariable=status_var,
-            fg_color=config.STATUS_COLORS[status_var.get()],
-            state="disabled" if day_info["prayer_disabled_status"][prayer] else "normal",
-            width=140
-        )
-        btn.pack(side="right", padx=10)
+        Args:
+            status_var (ctk.StringVar): The variable tied to the button's text.
+            button (ctk.CTkButton): The button that was clicked.
+        """
+        self.status_var = status_var
+        self.button = button
 
-        # Use a lambda to pass the specific variable and button to the callback
-        btn.configure(command=lambda v=status_var, b=btn: show_dropdown_callback(v, b))
+        width = button.winfo_width()
+        if width != self._width:
+            # Make the options the same width as the clicked button
+            for opt_btn in self.option_buttons:
+                opt_btn.configure(width=width)
+            self._width = width
 
+        x = button.winfo_rootx()
+        y = button.winfo_rooty() + button.winfo_height() + 2
+        self.window.geometry(f"+{int(x)}+{int(y)}")
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_set()  # Grab focus so the FocusOut event will work
+
+    def select(self, option):
+        """Sets the new status on the targeted button and hides the dropdown."""
+        if self.status_var is not None:
+            self.status_var.set(option)
+            self.button.configure(fg_color=config.STATUS_COLORS[option])
+        self.hide()
+
+    def hide(self):
+        """Withdraws the dropdown and forgets its target."""
+        self.window.withdraw()
+        self.status_var = None
+        self.button = None
+
+
+_dropdowns = weakref.WeakKeyDictionary()  # root window -> StatusDropdown
+
+
+def get_status_dropdown(root):
+    """
+    Returns the status dropdown of a root window, creating it on first use.
+
+    Args:
+        root (ctk.CTk): The absolute root window of the application.
+
+    Returns:
+        StatusDropdown: The shared dropdown for that window.
+    """
+    dropdown = _dropdowns.get(root)
+    if dropdown is None or not dropdown.window.winfo_exists():
+        dropdown = StatusDropdown(root)
+        _dropdowns[root] = dropdown
+    return dropdown
 
-# In app/views/calendar_view.py, replace the old function with this one:
 
 def display_status_dropdown(parent_frame, status_var, button):
     """
-    Creates and displays a true pop-up dropdown menu to change a prayer's status.
+    Displays the pop-up dropdown menu to change a prayer's status.
 
     Args:
         parent_frame (ctk.CTk): The absolute root window of the application.
         status_var (ctk.StringVar): The variable tied to the button's text.
         button (ctk.CTkButton): The button that was clicked to position the dropdown.
     """
-    # 1. Create a CTkToplevel - a true pop-up window
-    dropdown = ctk.CTkToplevel(parent_frame)
-
-    # 2. Remove window decorations (title bar, borders) to make it look like a menu
-    dropdown.overrideredirect(True)
-
-    # 3. Get the absolute screen position of the button that was clicked
-    x = button.winfo_rootx()
-    y = button.winfo_rooty() + button.winfo_height() + 2  # Position it just below the button
-
-    # 4. Place the Toplevel window at that absolute screen position
-    dropdown.geometry(f"+{int(x)}+{int(y)}")
-
-    def select_option(option):
-        """Callback to set the new status and destroy the dropdown."""
-        status_var.set(option)
-        button.configure(fg_color=config.STATUS_COLORS[option])
-        dropdown.destroy()
-
-    # 5. Create the buttons inside the new Toplevel window
-    for option in config.STATUS_OPTIONS:
-        opt_btn = ctk.CTkButton(
-            dropdown,
-            text=option,
-            width=button.winfo_width(),  # Make the dropdown buttons the same width as the original
-            command=lambda o=option: select_option(o)
-        )
-        opt_btn.pack(pady=2, padx=2)
-
-    # 6. Make the dropdown disappear if the user clicks away from it
-    dropdown.bind("<FocusOut>", lambda event: dropdown.destroy())
-    dropdown.focus_set()  # Grab focus so the FocusOut event will work
\ No newline at end of file
+    get_status_dropdown(parent_frame).show(status_var, button)
@@ -3,6 +3,9 @@
 import customtkinter as ctk
 from app.utils.config import PRAYER_NAMES
 
+# Marks an option the renderer has not applied yet
+_UNSET = object()
+
 def create_dashboard_view(parent, app_controller):
     """
     Creates and returns the main dashboard frame.
@@ -64,4 +67,40 @@ def _create_prayer_times_grid(parent, app_controller):
         time_label = ctk.CTkLabel(times_grid, text=initial_time, font=ctk.CTkFont(size=16))
         time_label.grid(row=i, column=1, sticky="e", padx=15, pady=8)
 
-        app_controller.prayer_labels[name] = (name_label, time_label)
\ No newline at end of file
+        app_controller.prayer_labels[name] = (name_label, time_label)
+
+
+class LabelRenderer:
+    """
+    Applies label options while remembering what each label currently shows,
+    so an update loop can describe the full desired state every tick and
+    only the options that actually changed reach Tk.
+    """
+
+    def __init__(self):
+        self._applied = {}  # label -> {option: value} last applied
+        self.configure_calls = 0
+
+    def render(self, label, **options):
+        """
+        Configures a label with any of `options` that differ from what it shows.
+
+        Args:
+            label (ctk.CTkLabel): The label to update.
+            **options: Label options such as text or text_color.
+
+        Returns:
+            bool: True if the label had to be reconfigured.
+        """
+        applied = self._applied.setdefault(label, {})
+        changed = {key: value for key, value in options.items() if applied.get(key, _UNSET) != value}
+        if not changed:
+            return False
+        label.configure(**changed)
+        applied.update(changed)
+        self.configure_calls += 1
+        return True
+
+    def invalidate(self):
+        """Forgets all applied values, so the next render reconfigures everything."""
+        self._applied.clear()
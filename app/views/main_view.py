@@ -2,24 +2,36 @@
 
 # Standard library imports
 import queue
+import time
 from datetime import datetime
 
 # Third-party imports
 import customtkinter as ctk
 
 # Local application imports reflecting the new structure
-from app.utils.config import START_MINIMIZED, ASSETS_DIR
+from app.utils.config import (
+    START_MINIMIZED,
+    ASSETS_DIR,
+    DASHBOARD_TICK_MARGIN_MS,
+    QUEUE_POLL_INTERVAL_MS,
+    BACKGROUND_QUEUE_POLL_INTERVAL_MS
+)
 from app.utils.utils import (
     load_prayer_times,
     save_prayer_times,
-    get_next_prayer_info,
+    format_next_prayer,
     logging
 )
-from app.services.notifier import show_notification_popup
-from app.services.prayer_calendar import open_calendar_view
+from app.utils.prayer_schedule import get_schedule
+from app.services.notifier import NotificationPopup
+from app.services.dispatcher import NotificationDispatcher
+from app.services.sinks import NotificationEvent
+from app.services.audio import get_audio_engine
+from app.services.event_channel import EventChannel
+from app.services.prayer_calendar import CalendarPage
 
 # View factory function imports
-from app.views.dashboard_view import create_dashboard_view
+from app.views.dashboard_view import create_dashboard_view, LabelRenderer
 from app.views.settings_view import create_settings_view
 from app.views.chatbot_view import create_chatbot_view
 
@@ -29,14 +41,18 @@ class MainView:
     The main view of the application, acting as a controller for all other UI components.
     """
 
-    def __init__(self, scheduler):
+    def __init__(self, scheduler, on_ready=None, fanout=None):
         """
         Initializes the main application window, creates all frames, and starts the event loop.
 
         Args:
             scheduler: An instance of the ReminderScheduler service.
+            on_ready (callable, optional): Called with this MainView once the event loop
+                                           is running and the first frame has been drawn.
+            fanout (SinkFanout, optional): Also delivers every reminder to these sinks.
         """
         self.scheduler = scheduler
+        self.fanout = fanout
 
         # --- Main Window Setup ---
         self.app = ctk.CTk()
@@ -52,12 +68,31 @@ class MainView:
 
         # --- Application State ---
         self.prayer_times = load_prayer_times()
+        self.schedule = get_schedule(self.prayer_times)
         self.frames = {}
+        self._view_factories = {}
+        self.calendar_page = None
+        self.notification_popup = None  # Built once the first frame is up, then reused
+        self.dispatcher = NotificationDispatcher(self.app.after, self._present_notifications)
         # These attributes will be populated by the view factory functions
         self.prayer_entries = {}
         self.clock_label = None
         self.countdown_label = None
         self.prayer_labels = {}
+        self.renderer = LabelRenderer()
+        self.tick_stats = {"ticks": 0, "max_late_ms": 0.0}
+        self._tick_due = None  # time.monotonic() at which the pending tick should fire
+        self._dashboard_job = None
+        self._queue_job = None
+        self._event_driven = False  # True once the scheduler wakes the GUI through an EventChannel
+
+        # --- Background Mode ---
+        # While hidden in the tray the dashboard is not redrawn and the queue is polled slowly
+        self.in_background = False
+        self.wakeup_stats = {
+            mode: {"dashboard": 0, "queue": 0, "seconds": 0.0} for mode in ("foreground", "background")
+        }
+        self._mode_started = time.monotonic()
 
         # --- Build and Display UI ---
         self._create_all_views()
@@ -65,31 +100,43 @@ class MainView:
 
         # --- Start Persistent Processes ---
         self.update_dashboard_display()
-        self.process_scheduler_queue()
+        self._connect_scheduler_queue()
         self.app.protocol("WM_DELETE_WINDOW", self.hide_window)
 
         if START_MINIMIZED:
-            self.app.withdraw()
+            self.hide_window()
 
+        if on_ready:
+            self.app.after_idle(lambda: on_ready(self))
+        # Pre-build the reminder window and decode the Azan after the first frame, off the startup path
+        self.app.after_idle(self._prewarm_notifications)
         self.app.mainloop()
 
     def _create_all_views(self):
         """
-        Initializes all the different views (frames) of the application.
+        Registers the factories for all the different views (frames) of the
+        application. Only the dashboard is built now; the others are built the
+        first time they are shown.
         """
-        logging.info("Creating UI views...")
+        self._view_factories = {
+            "dashboard": create_dashboard_view,
+            "settings": create_settings_view,
+            "chatbot": create_chatbot_view,
+        }
         self.frames["dashboard"] = create_dashboard_view(self.app, self)
-        self.frames["settings"] = create_settings_view(self.app, self)
-        self.frames["chatbot"] = create_chatbot_view(self.app, self)
-        logging.info("UI views created successfully.")
+        logging.info("Dashboard view created; other views will be created on first use.")
 
     def show_frame(self, frame_name):
         """
-        Hides all other frames and shows the requested frame.
+        Hides all other frames and shows the requested frame, creating it first if needed.
 
         Args:
             frame_name (str): The key for the frame to be displayed.
         """
+        if frame_name not in self.frames:
+            logging.info(f"Creating the {frame_name} view...")
+            self.frames[frame_name] = self._view_factories[frame_name](self.app, self)
+
         if frame_name == "settings":
             self.load_times_into_settings_entries()
 
@@ -99,14 +146,18 @@ class MainView:
 
     def open_calendar_page(self):
         """
-        Dynamically creates and displays the calendar view.
+        Displays the calendar view, creating it on first use and refreshing it afterwards.
         """
-        # This view is created on-demand rather than at startup
-        self.frames["calendar"] = open_calendar_view(
-            root_frame=self.app,
-            get_today_times_callback=self.scheduler.get_today_times,
-            switch_to_dashboard=lambda: self.show_frame("dashboard")
-        )
+        if self.calendar_page is None:
+            # This view is created on-demand rather than at startup, then kept alive
+            self.calendar_page = CalendarPage(
+                root_frame=self.app,
+                get_schedule_callback=self.scheduler.get_schedule,
+                switch_to_dashboard=lambda: self.show_frame("dashboard")
+            )
+            self.frames["calendar"] = self.calendar_page.frame
+        else:
+            self.calendar_page.refresh()
         self.show_frame("calendar")
 
     def save_new_times(self):
@@ -126,6 +177,7 @@ class MainView:
 
         save_prayer_times(new_times)
         self.prayer_times = new_times
+        self.schedule = get_schedule(new_times)
         self.scheduler.reload_times()
         logging.info("GUI saved new times and reloaded scheduler.")
         self.show_frame("dashboard")
@@ -140,49 +192,128 @@ class MainView:
 
     def update_dashboard_display(self):
         """
-        Updates the clock, countdown, and prayer time highlights on the dashboard every second.
+        Updates the clock, countdown, and prayer time highlights on the dashboard.
+        Runs just after every wall-clock second and only reconfigures labels whose
+        text or color changed.
         """
-        self.clock_label.configure(text=datetime.now().strftime("%H:%M:%S"))
+        self._dashboard_job = None
+        self._count_wakeup("dashboard")
+        if self._tick_due is not None:
+            late_ms = (time.monotonic() - self._tick_due) * 1000
+            self.tick_stats["ticks"] += 1
+            self.tick_stats["max_late_ms"] = max(self.tick_stats["max_late_ms"], late_ms)
 
-        next_prayer, countdown = get_next_prayer_info(self.prayer_times)
+        now = datetime.now()
+        render = self.renderer.render
+        render(self.clock_label, text=now.strftime("%H:%M:%S"))
+
+        if self.schedule.day != now.date():
+            self.schedule = get_schedule(self.prayer_times, now.date())
+        next_prayer, countdown = format_next_prayer(self.schedule, now.timestamp())
         if next_prayer != "N/A":
-            self.countdown_label.configure(text=f"Next prayer: {next_prayer} in {countdown}")
+            render(self.countdown_label, text=f"Next prayer: {next_prayer} in {countdown}")
         else:
-            self.countdown_label.configure(text="No prayer times set.")
+            render(self.countdown_label, text="No prayer times set.")
 
         for name, (name_label, time_label) in self.prayer_labels.items():
-            time_label.configure(text=self.prayer_times.get(name, "00:00"))
             text_color = "cyan" if name == next_prayer else "white"
-            name_label.configure(text_color=text_color)
-            time_label.configure(text_color=text_color)
+            render(name_label, text_color=text_color)
+            render(time_label, text=self.prayer_times.get(name, "00:00"), text_color=text_color)
 
-        self.app.after(1000, self.update_dashboard_display)
+        self._schedule_dashboard_tick()
+
+    def _schedule_dashboard_tick(self):
+        """
+        Schedules the next dashboard update just after the next wall-clock second,
+        so the clock neither drifts nor skips or repeats a second.
+        """
+        delay_ms = int((1 - time.time() % 1) * 1000) + DASHBOARD_TICK_MARGIN_MS
+        self._tick_due = time.monotonic() + delay_ms / 1000
+        self._dashboard_job = self.app.after(delay_ms, self.update_dashboard_display)
 
     def process_scheduler_queue(self):
         """
         Checks the queue for notification requests from the scheduler service.
         """
+        self._queue_job = None
+        self._count_wakeup("queue")
         try:
-            message = self.scheduler.notification_queue.get_nowait()
-            msg_type, data = message
-            if msg_type == 'show_notification':
-                prayer_name = data
-                logging.info(f"GUI received request to show notification for {prayer_name}")
-                show_notification_popup(
-                    prayer_name=prayer_name,
-                    offered_callback=lambda: self.scheduler.acknowledge_prayer(prayer_name),
-                    snooze_callback=lambda: self.scheduler.snooze_prayer(prayer_name)
-                )
-        except queue.Empty:
-            pass  # No message in queue, which is normal
+            # Drain everything that is pending in one pass
+            while True:
+                try:
+                    message = self.scheduler.notification_queue.get_nowait()
+                except queue.Empty:
+                    break  # No more messages, which is normal
+                self._handle_scheduler_message(message, received_at=time.perf_counter())
         finally:
-            self.app.after(100, self.process_scheduler_queue)
+            if not self._event_driven:
+                interval = BACKGROUND_QUEUE_POLL_INTERVAL_MS if self.in_background else QUEUE_POLL_INTERVAL_MS
+                self._queue_job = self.app.after(interval, self.process_scheduler_queue)
+
+    def _connect_scheduler_queue(self):
+        """
+        Wakes the GUI directly when the scheduler's queue is an EventChannel;
+        any other queue falls back to being polled on a timer.
+        """
+        channel = self.scheduler.notification_queue
+        if isinstance(channel, EventChannel):
+            self._event_driven = True
+            channel.attach(self.app, self.process_scheduler_queue)
+        else:
+            self._event_driven = False
+            self.process_scheduler_queue()
+
+    def _handle_scheduler_message(self, message, received_at=None):
+        """
+        Acts on a single message from the scheduler.
+
+        Args:
+            message (tuple): A (msg_type, data) pair.
+            received_at (float, optional): The time.perf_counter() at which it was taken off the queue.
+        """
+        msg_type, data = message
+        if msg_type == 'show_notification':
+            prayer_name = data
+            logging.info(f"GUI received request to show notification for {prayer_name}")
+            if self.fanout:
+                self.fanout.publish(NotificationEvent.from_message(message))  # Never blocks
+            self.dispatcher.submit(prayer_name, received_at)
+
+    def _present_notifications(self, prayer_names, received_at):
+        """Shows a coalesced batch of reminders in the combined popup."""
+        self._get_notification_popup().show(
+            prayer_names, self._on_prayer_offered, self._on_prayer_snoozed, received_at=received_at
+        )
+
+    def _on_prayer_offered(self, prayer_name):
+        self.dispatcher.resolve(prayer_name)
+        self.scheduler.acknowledge_prayer(prayer_name)
+
+    def _on_prayer_snoozed(self, prayer_name):
+        self.dispatcher.resolve(prayer_name)
+        self.scheduler.snooze_prayer(prayer_name)
+
+    def _prewarm_notifications(self):
+        """Builds the reminder window and starts the audio engine, so the first reminder shows at once."""
+        self._get_notification_popup()
+        # Decodes the Azan on the engine's own thread, then each prayer's clip ahead of time
+        get_audio_engine().follow_schedule(self.scheduler.get_schedule)
+
+    def _get_notification_popup(self):
+        """
+        Returns:
+            NotificationPopup: The reusable reminder window, built on first use.
+        """
+        if self.notification_popup is None:
+            self.notification_popup = NotificationPopup(self.app)
+        return self.notification_popup
 
     # --- Window and System Tray Management ---
 
     def hide_window(self):
-        """Hides the main window to the system tray."""
+        """Hides the main window to the system tray and suspends the UI timers."""
         self.app.withdraw()
+        self._enter_background_mode()
         logging.info("Window hidden to system tray.")
 
     def schedule_show_window(self):
@@ -194,4 +325,62 @@ class MainView:
         self.app.deiconify()
         self.app.lift()
         self.app.focus_force()
-        logging.info("Window shown from system tray.")
\ No newline at end of file
+        self._leave_background_mode()
+        logging.info("Window shown from system tray.")
+
+    def _enter_background_mode(self):
+        """
+        Stops the dashboard timer. Scheduler events still wake the GUI through
+        the event channel; a polled queue is slowed down to one cheap wakeup per
+        BACKGROUND_QUEUE_POLL_INTERVAL_MS, which is all that is needed to show
+        notifications while the window is hidden.
+        """
+        if self.in_background:
+            return
+        self._switch_wakeup_mode(background=True)
+        if self._dashboard_job is not None:
+            self.app.after_cancel(self._dashboard_job)
+            self._dashboard_job = None
+            self._tick_due = None
+        if self._queue_job is not None:
+            self.app.after_cancel(self._queue_job)
+            self._queue_job = self.app.after(BACKGROUND_QUEUE_POLL_INTERVAL_MS, self.process_scheduler_queue)
+
+    def _leave_background_mode(self):
+        """Resumes the UI timers with a single catch-up render and an immediate queue check."""
+        if not self.in_background:
+            return
+        self._switch_wakeup_mode(background=False)
+        self.update_dashboard_display()
+        if self._queue_job is not None:
+            self.app.after_cancel(self._queue_job)
+        self.process_scheduler_queue()  # Re-arms polling if the queue is not event-driven
+
+    def _switch_wakeup_mode(self, background):
+        """Closes the time spent in the current mode and switches modes."""
+        now = time.monotonic()
+        self.wakeup_stats[self._wakeup_mode()]["seconds"] += now - self._mode_started
+        self._mode_started = now
+        self.in_background = background
+
+    def _wakeup_mode(self):
+        return "background" if self.in_background else "foreground"
+
+    def _count_wakeup(self, timer):
+        self.wakeup_stats[self._wakeup_mode()][timer] += 1
+
+    def wakeups_per_minute(self):
+        """
+        Returns:
+            dict: For "foreground" and "background", the UI timer wakeups per minute
+                  spent in that mode (0.0 for a mode that was never entered).
+        """
+        current = self._wakeup_mode()
+        rates = {}
+        for mode, stats in self.wakeup_stats.items():
+            seconds = stats["seconds"]
+            if mode == current:
+                seconds += time.monotonic() - self._mode_started
+            wakeups = stats["dashboard"] + stats["queue"]
+            rates[mode] = wakeups * 60 / seconds if seconds > 0 else 0.0
+        return rates
\ No newline at end of file
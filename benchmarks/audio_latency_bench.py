@@ -0,0 +1,92 @@
+# benchmarks/audio_latency_bench.py
+"""
+Measures how long the Azan takes to start: the old path, which checks the
+file, initializes the mixer if needed and decodes the MP3 with
+pygame.mixer.music.load on every reminder, against the AudioEngine, which
+decodes once and only starts a channel per trigger. A final trigger after
+clearing the clip cache shows what a reminder costs when its clip was not
+prefetched.
+
+Each trigger is stopped again right away. Runs without a sound card when
+SDL_AUDIODRIVER=dummy is set.
+
+Usage:
+    SDL_AUDIODRIVER=dummy python -m benchmarks.audio_latency_bench [--triggers 20]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import pygame
+
+from app.services.audio import AudioEngine, _decoded_size
+from app.services.audio_library import AudioLibrary
+from app.utils import config
+
+
+def _legacy_trigger(sound_file):
+    """The per-reminder work notifier.play_azan_sound used to do."""
+    started = time.perf_counter()
+    if os.path.exists(sound_file):
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        pygame.mixer.music.load(sound_file)
+        pygame.mixer.music.play()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    pygame.mixer.music.stop()
+    return elapsed_ms
+
+
+def _summary(samples):
+    return (f"avg {statistics.mean(samples):7.2f} ms, median {statistics.median(samples):7.2f} ms, "
+            f"max {max(samples):7.2f} ms")
+
+
+def run(triggers, sound_file):
+    legacy = [_legacy_trigger(sound_file) for _ in range(triggers)]
+    pygame.mixer.quit()
+
+    library = AudioLibrary(pygame.mixer.Sound, _decoded_size, default_azan=sound_file)
+    engine = AudioEngine(library)
+    warm_up_started = time.perf_counter()
+    engine.start()
+    engine.wait_ready()
+    warm_up_ms = (time.perf_counter() - warm_up_started) * 1000
+
+    latencies = []
+    for _ in range(triggers):
+        engine.play()
+        engine.stop()
+        # Commands run in order, so wait for this play to be recorded before the next
+        while engine.stats()["plays"] < len(latencies) + 1:
+            time.sleep(0.001)
+        latencies.append(engine.stats()["last_latency_ms"])
+    stats = engine.stats()
+
+    library.clear()  # The engine is idle, so the cache can be cleared from here
+    engine.play()
+    while engine.stats()["plays"] < triggers + 1:
+        time.sleep(0.001)
+    cold_ms = engine.stats()["last_latency_ms"]
+    engine.shutdown(2)
+
+    print(f"legacy load-and-play per trigger: {_summary(legacy)}")
+    print(f"AudioEngine trigger to play:      {_summary(latencies)}")
+    print(f"AudioEngine one-off warm-up:      {warm_up_ms:7.0f} ms "
+          f"({stats['cache']['cached_bytes'] / 1024 / 1024:.1f} MiB decoded)")
+    print(f"AudioEngine play on a cache miss: {cold_ms:7.0f} ms")
+    print(f"mixer output buffer:              {stats['output_latency_ms']:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--triggers", type=int, default=20, help="Reminders triggered on each path.")
+    parser.add_argument("--sound", default=str(config.AZAN_SOUND_FILE), help="The sound file to play.")
+    args = parser.parse_args()
+    run(args.triggers, args.sound)
+
+
+if __name__ == "__main__":
+    main()
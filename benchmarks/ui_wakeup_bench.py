@@ -0,0 +1,108 @@
+# benchmarks/ui_wakeup_bench.py
+"""
+Measures how often the GUI's timers wake the Tk main loop with the window
+visible and with it hidden in the system tray (background mode), and how
+long scheduler messages take to reach the GUI through the event channel.
+
+The real MainView is built against a stand-in scheduler whose queue stays
+idle, then the Tk main loop runs for a fixed time in each mode. For
+the latency run, a background thread posts messages while the window is
+hidden; they use a message type the GUI ignores, so no popups open.
+Needs a display.
+
+Usage:
+    python -m benchmarks.ui_wakeup_bench [--seconds 10] [--messages 50]
+"""
+
+import argparse
+import threading
+import time
+from unittest.mock import patch
+
+import customtkinter as ctk
+
+from app.services.event_channel import EventChannel
+from app.utils import utils
+from app.utils.prayer_schedule import get_schedule
+from app.views.main_view import MainView
+
+
+class _IdleScheduler:
+    """Provides what MainView needs from the scheduler without running one."""
+
+    def __init__(self):
+        self.notification_queue = EventChannel()
+
+    def get_schedule(self):
+        return get_schedule(utils.load_prayer_times())
+
+
+def _post_messages(channel, count):
+    """Posts scheduler-style messages from another thread, like the scheduler does."""
+    for i in range(count):
+        time.sleep(0.02)
+        channel.put(("bench", i))
+
+
+def run(seconds, messages):
+    views = []
+    results = {}
+    create_all_views = MainView._create_all_views
+    mainloop = ctk.CTk.mainloop
+
+    def capture_view(self):
+        views.append(self)
+        create_all_views(self)
+
+    def measure(app):
+        # Runs the real main loop: Tk only accepts calls from other threads while it is running
+        view = views[0]
+        channel = view.scheduler.notification_queue
+        poster = threading.Thread(target=_post_messages, args=(channel, messages))
+
+        def enter_background():
+            view.hide_window()
+            app.after(int(seconds * 1000), start_posting)
+
+        def start_posting():
+            results["rates"] = view.wakeups_per_minute()
+            results["wakeups"] = {mode: dict(stats) for mode, stats in view.wakeup_stats.items()}
+            poster.start()
+            app.after(100, finish_when_delivered)
+
+        def finish_when_delivered():
+            if poster.is_alive() or not channel.empty():
+                app.after(100, finish_when_delivered)
+            else:
+                app.quit()
+
+        app.after(int(seconds * 1000), enter_background)
+        mainloop(app)
+        results["channel"] = channel.stats()
+        results["max_late_ms"] = view.tick_stats["max_late_ms"]
+        app.destroy()
+
+    with patch.object(MainView, "_create_all_views", capture_view), \
+            patch.object(ctk.CTk, "mainloop", measure):
+        MainView(_IdleScheduler())
+
+    for mode in ("foreground", "background"):
+        stats = results["wakeups"][mode]
+        print(f"{mode + ':':<12} {results['rates'][mode]:8.1f} wakeups/min "
+              f"(dashboard {stats['dashboard']}, queue {stats['queue']})")
+    print(f"dashboard tick max lateness: {results['max_late_ms']:.1f} ms")
+    channel_stats = results["channel"]
+    print(f"event delivery: {channel_stats['delivered']} messages in {channel_stats['wakeups']} wakeups, "
+          f"avg {channel_stats['avg_latency_ms']:.2f} ms, max {channel_stats['max_latency_ms']:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0, help="Time spent measuring each mode.")
+    parser.add_argument("--messages", type=int, default=50, help="Messages posted for the latency run.")
+    args = parser.parse_args()
+    run(args.seconds, args.messages)
+
+
+if __name__ == "__main__":
+    main()
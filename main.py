@@ -5,19 +5,17 @@ The main entry point for the Namaz Reminder application.
 This script initializes all the core components, including the background scheduler,
 the system tray icon, and the main graphical user interface (GUI), then starts
 the application's main event loop.
+
+Application modules are imported inside the functions that need them, so that
+`--profile-startup` can time every import, and so that `--headless` never
+loads the GUI toolkit. Run `python main.py --help` for options.
 """
 
-import queue
-import threading
+import argparse
+import json
 import sys
-from PIL import Image
-import pystray
-
-# Import the refactored MainView class and services
-from app.views.main_view import MainView
-from app.services.scheduler import ReminderScheduler
-from app.utils import utils
-from app.utils import config
+import threading
+from contextlib import nullcontext
 
 # --- Global instances to be shared across the application ---
 # These are populated by the main() function.
@@ -33,7 +31,12 @@ def initialize_scheduler():
     Returns:
         ReminderScheduler: An initialized and started instance of the scheduler.
     """
-    notification_queue = queue.Queue()
+    from app.services.scheduler import ReminderScheduler
+    from app.services.event_channel import EventChannel
+    from app.utils import utils
+
+    # The GUI attaches to this queue so scheduler messages wake it without polling
+    notification_queue = EventChannel()
     scheduler = ReminderScheduler(notification_queue)
     scheduler.start()
     utils.logging.info("Reminder scheduler service started.")
@@ -51,6 +54,11 @@ def create_tray_icon(on_show_callback, on_quit_callback):
     Returns:
         pystray.Icon: An initialized and running instance of the tray icon.
     """
+    from PIL import Image
+    import pystray
+    from app.utils import config
+    from app.utils import utils
+
     try:
         icon_image = Image.open(config.APP_ICON_PNG)
     except FileNotFoundError:
@@ -68,16 +76,129 @@ def create_tray_icon(on_show_callback, on_quit_callback):
     return icon
 
 
-def main():
+def parse_args(argv=None):
+    """
+    Parses the command line options.
+
+    Args:
+        argv (list, optional): The arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Namaz Reminder")
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Start the app, print a startup timeline, import times and peak memory "
+             "once the first frame is drawn, then exit."
+    )
+    parser.add_argument(
+        "--profile-output", metavar="PATH",
+        help="With --profile-startup, also write the profile to this JSON file."
+    )
+    parser.add_argument(
+        "--startup-baseline", metavar="PATH",
+        help="With --profile-startup, compare against this baseline and exit with status 1 on regressions."
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="Run only the scheduler, without a window or tray icon, and deliver reminders to --sink targets."
+    )
+    parser.add_argument(
+        "--sink", action="append", metavar="SPEC",
+        help="Also deliver reminders here: stdout, log[:PATH], command:COMMAND, webhook:URL, "
+             "socket:PATH or audio. May be repeated. Defaults to config.NOTIFICATION_SINKS; "
+             "with --headless and no sinks configured, to stdout."
+    )
+    return parser.parse_args(argv)
+
+
+def build_sinks(args, default=()):
+    """
+    Creates the notification sinks from --sink, or from config.NOTIFICATION_SINKS.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+        default (tuple): The sink specs used when neither names any.
+
+    Returns:
+        list: The NotificationSink instances.
+
+    Raises:
+        ValueError: If a sink specification is not recognized.
+    """
+    from app.services.sinks import build_sink
+    from app.utils import config
+
+    return [build_sink(spec) for spec in args.sink or config.NOTIFICATION_SINKS or default]
+
+
+def start_headless(args):
+    """
+    Runs the scheduler without the GUI until interrupted.
+
+    Args:
+        args (argparse.Namespace): The parsed options.
+
+    Returns:
+        int: The process exit code.
+    """
+    from app.services.headless import run_headless
+
+    try:
+        sinks = build_sinks(args, default=("stdout",))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    run_headless(sinks)
+    return 0
+
+
+def main(argv=None):
     """
     The primary function that orchestrates the application startup.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv[1:].
     """
     global app_instance, scheduler_instance, icon_instance
 
+    args = parse_args(argv)
+    if args.headless:
+        sys.exit(start_headless(args))
+
+    profiler = None
+    if args.profile_startup:
+        from app.utils.startup_profiler import StartupProfiler
+        profiler = StartupProfiler()
+        profiler.start()
+
+    def phase(name):
+        return profiler.phase(name) if profiler else nullcontext()
+
+    with phase("import core modules"):
+        from app.utils import utils
+    with phase("import main view"):
+        from app.views.main_view import MainView
+
     utils.logging.info("Starting Namaz Reminder App...")
 
+    # Optional sinks (webhook, desktop command, ...) that get every reminder next to the popup
+    try:
+        sinks = build_sinks(args)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
     # 1. Start background services
-    scheduler_instance = initialize_scheduler()
+    with phase("initialize_scheduler"):
+        scheduler_instance = initialize_scheduler()
+    fanout = None
+    if sinks:
+        from app.services.fanout import SinkFanout
+        with phase("start notification sinks"):
+            fanout = SinkFanout(sinks)
+            fanout.start(scheduler_instance)
 
     # 2. Define the actions for the system tray icon
     def show_window_action(icon, item):
@@ -96,6 +217,9 @@ def main():
         utils.logging.info("'Quit' action triggered from system tray.")
         if scheduler_instance:
             scheduler_instance.stop()
+        if fanout:
+            fanout.stop()
+        utils.shutdown_action_logger()
         if icon_instance:
             icon_instance.stop()
         if app_instance:
@@ -103,15 +227,62 @@ def main():
         sys.exit(0)
 
     # 3. Create the system tray icon
-    icon_instance = create_tray_icon(show_window_action, quit_app_action)
+    with phase("create_tray_icon"):
+        icon_instance = create_tray_icon(show_window_action, quit_app_action)
 
     # 4. Initialize and run the main GUI. This is a blocking call.
     # The script will pause here until the application is quit.
-    app_instance = MainView(scheduler_instance)
+    exit_code = 0
+
+    def on_ready(view):
+        """Publishes the GUI once it is up; when profiling, reports and quits."""
+        nonlocal exit_code
+        global app_instance
+        app_instance = view
+        if profiler:
+            profiler.end("MainView until first frame")
+            exit_code = _finish_startup_profile(profiler, args)
+            view.app.quit()
+
+    if profiler:
+        profiler.begin("MainView until first frame")
+    MainView(scheduler_instance, on_ready=on_ready, fanout=fanout)
+
+    if profiler:
+        scheduler_instance.stop()
+        if fanout:
+            fanout.stop()
+        utils.shutdown_action_logger()
+        icon_instance.stop()
+        sys.exit(exit_code)
 
     utils.logging.info("Application has been closed.")
 
 
+def _finish_startup_profile(profiler, args):
+    """
+    Stops the profiler, prints its report and handles the JSON and baseline options.
+
+    Returns:
+        int: The process exit code: 1 if the baseline check found regressions, else 0.
+    """
+    profiler.stop()
+    print(profiler.report())
+    if args.profile_output:
+        profiler.write_json(args.profile_output)
+        print(f"\nProfile written to {args.profile_output}")
+    if args.startup_baseline:
+        with open(args.startup_baseline) as f:
+            regressions = profiler.check_baseline(json.load(f))
+        if regressions:
+            print("\nStartup regressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nStartup is within the baseline.")
+    return 0
+
+
 if __name__ == "__main__":
     # This ensures the main() function is called only when the script is executed directly
-    main()
\ No newline at end of file
+    main()
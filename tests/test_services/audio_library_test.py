@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from app.services.audio_library import AZAN, PRE_ALERT, AudioLibrary
+
+MIB = 1024 * 1024
+
+
+class TestAudioLibrary(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = {}
+        for name in ("azan", "fajr", "chime", "a", "b", "c"):
+            path = os.path.join(self.tmp.name, f"{name}.mp3")
+            open(path, "wb").close()
+            self.paths[name] = path
+        self.decoder = MagicMock(side_effect=lambda path: MagicMock(path=path))
+        # Decoded sizes by file name
+        self.sizes = {"azan": 30 * MIB, "fajr": 20 * MIB, "chime": 1 * MIB, "a": 10 * MIB, "b": 10 * MIB, "c": 10 * MIB}
+        self.library = self._library(budget_bytes=64 * MIB)
+
+    def _library(self, budget_bytes):
+        return AudioLibrary(
+            self.decoder,
+            lambda sound: self.sizes[os.path.basename(sound.path)[:-4]],
+            budget_bytes=budget_bytes,
+            azan_files={"Fajr": self.paths["fajr"]},
+            default_azan=self.paths["azan"],
+            pre_alert_file=self.paths["chime"],
+        )
+
+    def test_resolve_maps_prayers_to_clips(self):
+        self.assertEqual(self.library.resolve("Fajr"), self.paths["fajr"])
+        self.assertEqual(self.library.resolve("Asr"), self.paths["azan"])
+        self.assertEqual(self.library.resolve(), self.paths["azan"])
+        self.assertEqual(self.library.resolve("Asr", PRE_ALERT), self.paths["chime"])
+        with self.assertRaises(ValueError):
+            self.library.resolve("Asr", "siren")
+
+    def test_resolve_skips_missing_files(self):
+        self.library.azan_files["Isha"] = os.path.join(self.tmp.name, "missing.mp3")
+        self.assertIsNone(self.library.resolve("Isha", AZAN))
+
+    def test_get_decodes_once(self):
+        first = self.library.get(self.paths["azan"])
+        second = self.library.get(self.paths["azan"])
+
+        self.assertIs(first, second)
+        self.decoder.assert_called_once_with(self.paths["azan"])
+        stats = self.library.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["cached_bytes"], 30 * MIB)
+
+    def test_least_recently_used_clip_is_evicted_over_budget(self):
+        library = self._library(budget_bytes=25 * MIB)
+        library.get(self.paths["a"])
+        library.get(self.paths["b"])
+        library.get(self.paths["a"])  # b is now the least recently used
+        library.prefetch(self.paths["c"])
+
+        self.assertTrue(library.is_cached(self.paths["a"]))
+        self.assertFalse(library.is_cached(self.paths["b"]))
+        self.assertTrue(library.is_cached(self.paths["c"]))
+        self.assertEqual(library.stats()["evictions"], 1)
+        self.assertLessEqual(library.stats()["cached_bytes"], 25 * MIB)
+
+    def test_a_clip_over_the_budget_is_still_kept_alone(self):
+        library = self._library(budget_bytes=5 * MIB)
+        library.get(self.paths["chime"])
+        library.get(self.paths["azan"])
+
+        self.assertEqual(library.stats()["entries"], 1)
+        self.assertTrue(library.is_cached(self.paths["azan"]))
+
+    def test_prefetch_skips_cached_clips(self):
+        self.assertTrue(self.library.prefetch(self.paths["fajr"]))
+        self.assertFalse(self.library.prefetch(self.paths["fajr"]))
+        self.decoder.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
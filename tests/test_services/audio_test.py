@@ -0,0 +1,193 @@
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.services.audio import AudioEngine
+from app.services.audio_library import AZAN, PRE_ALERT
+from app.utils.clock import VirtualClock
+from app.utils.prayer_schedule import CompiledSchedule
+
+
+class FakeLibrary:
+    """An AudioLibrary stand-in whose clips all resolve and decode to mocks."""
+
+    def __init__(self, undecodable=()):
+        self.undecodable = set(undecodable)
+        self.sounds = {}
+        self.prefetched = []
+        self.events = []  # ("prefetch" or "play", path) in the order they happened
+        self.default_azan = "azan.mp3"
+
+    def resolve(self, prayer_name=None, kind="azan"):
+        if kind == PRE_ALERT:
+            return "chime.mp3"
+        return {"Fajr": "fajr.mp3"}.get(prayer_name, "azan.mp3")
+
+    def get(self, path):
+        if path in self.undecodable:
+            raise RuntimeError("Unrecognized audio format")
+        if path not in self.sounds:
+            sound = self.sounds[path] = MagicMock(name=path)
+            sound.play.side_effect = lambda: self.events.append(("play", path))
+        return self.sounds[path]
+
+    def prefetch(self, path):
+        self.prefetched.append(path)
+        self.events.append(("prefetch", path))
+        if path in self.sounds:
+            return False
+        self.get(path)
+        return True
+
+    def is_cached(self, path):
+        return path in self.sounds
+
+    def stats(self):
+        return {"entries": len(self.sounds)}
+
+
+class TestAudioEngine(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch("app.services.audio.pygame")
+        self.pygame = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pygame.mixer.get_init.side_effect = [None, (44100, -16, 2)]
+        self.library = FakeLibrary()
+
+    def _start(self, library=None):
+        engine = AudioEngine(library or self.library)
+        engine.start()
+        self.addCleanup(engine.shutdown, 2)
+        self.assertTrue(engine.wait_ready(2))
+        return engine
+
+    def test_mixer_is_initialized_once_and_default_azan_prefetched(self):
+        engine = self._start()
+        for _ in range(3):
+            engine.play("Asr")
+        engine.shutdown(2)
+
+        self.pygame.mixer.init.assert_called_once()
+        self.assertEqual(self.library.prefetched, ["azan.mp3"])
+        self.assertEqual(self.library.sounds["azan.mp3"].play.call_count, 3)
+        self.pygame.mixer.music.load.assert_not_called()
+
+    def test_each_prayer_plays_its_own_clip(self):
+        engine = self._start()
+        engine.play("Fajr")
+        engine.play("Isha", PRE_ALERT)
+        engine.shutdown(2)
+
+        self.library.sounds["fajr.mp3"].play.assert_called_once()
+        self.library.sounds["chime.mp3"].play.assert_called_once()
+        # Starting the chime stopped the Fajr Azan first
+        self.library.sounds["fajr.mp3"].stop.assert_called()
+
+    def test_stats_report_latency(self):
+        engine = self._start()
+        engine.play()
+        engine.shutdown(2)
+
+        stats = engine.stats()
+        self.assertEqual(stats["plays"], 1)
+        self.assertGreaterEqual(stats["last_latency_ms"], 0.0)
+        self.assertAlmostEqual(stats["output_latency_ms"], 512 / 44100 * 1000)
+        self.assertEqual(stats["cache"], {"entries": 1})
+
+    def test_stop_and_fade_are_forwarded(self):
+        engine = self._start()
+        engine.play()
+        engine.fade(250)
+        engine.shutdown(2)
+
+        sound = self.library.sounds["azan.mp3"]
+        sound.fadeout.assert_called_once_with(250)
+        sound.stop.assert_called()
+
+    def test_streams_clips_that_cannot_be_decoded(self):
+        engine = self._start(FakeLibrary(undecodable={"azan.mp3"}))
+        engine.play()
+        engine.shutdown(2)
+
+        self.pygame.mixer.music.load.assert_called_once_with("azan.mp3")
+        self.pygame.mixer.music.play.assert_called_once()
+
+    def test_next_prayer_clip_is_prefetched_before_its_deadline(self):
+        clock = VirtualClock(datetime(2026, 3, 1, 4, 51))  # Within the lead time of both clips
+        schedule = CompiledSchedule({"Fajr": "05:00", "Dhuhr": "13:00"}, clock.now().date())
+        engine = AudioEngine(self.library, clock)
+        engine.start()
+        self.assertTrue(engine.wait_ready(2))
+        engine.follow_schedule(lambda: schedule)
+        engine.shutdown(2)
+
+        self.assertEqual(self.library.prefetched, ["azan.mp3", "fajr.mp3", "chime.mp3"])
+
+    def test_prefetch_waits_until_the_lead_time(self):
+        clock = VirtualClock(datetime(2026, 3, 1, 3, 0))
+        schedule = CompiledSchedule({"Fajr": "05:00"}, clock.now().date())
+        engine = AudioEngine(self.library, clock)
+        engine._get_schedule = lambda: schedule
+
+        # The chime is decoded first: 600 s before it plays, 300 s before Fajr
+        self.assertEqual(engine.run_scheduled(clock.now()), 2 * 3600 - 900)
+        self.assertEqual(self.library.prefetched, [])
+
+    def test_pre_alert_chime_is_prefetched_and_played_ahead_of_the_azan(self):
+        clock = VirtualClock(datetime(2026, 3, 1, 3, 0))
+        schedule = CompiledSchedule({"Fajr": "05:00", "Dhuhr": "13:00"}, clock.now().date())
+        fajr = schedule.deadline("Fajr")
+        engine = AudioEngine(self.library, clock)
+        engine._get_schedule = lambda: schedule
+
+        timeline = []
+        while clock.now() < fajr:
+            wait = engine.run_scheduled(clock.now())
+            timeline += [(clock.now().strftime("%H:%M"), *event) for event in self.library.events]
+            self.library.events.clear()
+            clock.advance(wait)
+        # The scheduler's reminder plays the Azan at the deadline
+        engine._play(time.perf_counter(), "Fajr", AZAN)
+        timeline += [(clock.now().strftime("%H:%M"), *event) for event in self.library.events]
+
+        self.assertEqual(timeline, [
+            ("04:45", "prefetch", "chime.mp3"),
+            ("04:50", "prefetch", "fajr.mp3"),
+            ("04:55", "play", "chime.mp3"),
+            ("05:00", "play", "fajr.mp3"),
+        ])
+        self.assertEqual(self.library.sounds["chime.mp3"].play.call_count, 1)
+        # Once Fajr has passed, the cached chime is kept and Dhuhr's Azan is decoded next
+        self.assertEqual(engine.run_scheduled(clock.now()), 8 * 3600 - 600)
+
+    def test_a_chime_missed_by_more_than_a_minute_is_skipped(self):
+        clock = VirtualClock(datetime(2026, 3, 1, 4, 58))
+        schedule = CompiledSchedule({"Fajr": "05:00"}, clock.now().date())
+        engine = AudioEngine(self.library, clock)
+        engine._get_schedule = lambda: schedule
+
+        self.assertEqual(engine.run_scheduled(clock.now()), 120)
+        self.assertNotIn(("play", "chime.mp3"), self.library.events)
+        self.assertEqual(engine.run_scheduled(clock.now()), 120)  # Not retried
+
+
+class TestAudioEngineWithoutAudio(unittest.TestCase):
+
+    @patch("app.services.audio.utils.logging.error")
+    @patch("app.services.audio.pygame")
+    def test_playback_is_skipped_when_the_mixer_fails(self, mock_pygame, mock_error):
+        mock_pygame.mixer.get_init.return_value = None
+        mock_pygame.mixer.init.side_effect = RuntimeError("No available audio device")
+        engine = AudioEngine()
+        engine.start()
+        engine.play()
+        engine.shutdown(2)
+
+        mock_error.assert_called_once()
+        self.assertEqual(engine.stats()["plays"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import MagicMock
+
+from app.services.dispatcher import NotificationDispatcher
+
+
+class TestNotificationDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 100.0
+        self.scheduled = []
+        self.present = MagicMock()
+        self.dispatcher = NotificationDispatcher(
+            lambda delay_ms, callback: self.scheduled.append(delay_ms) or "job",
+            self.present,
+            window_ms=250,
+            clock=lambda: self.now,
+        )
+
+    def test_burst_is_presented_as_one_batch(self):
+        for prayer, received_at in (("Asr", 1.0), ("Maghrib", 2.0)):
+            self.dispatcher.submit(prayer, received_at)
+        self.dispatcher.flush()
+
+        self.assertEqual(self.scheduled, [0])  # The first batch is not delayed
+        self.present.assert_called_once_with(["Asr", "Maghrib"], 1.0)
+
+    def test_prayers_on_screen_or_waiting_are_deduplicated(self):
+        self.assertTrue(self.dispatcher.submit("Asr"))
+        self.assertFalse(self.dispatcher.submit("Asr"))
+        self.dispatcher.flush()
+        self.assertFalse(self.dispatcher.submit("Asr"))  # Still on screen
+        self.dispatcher.resolve("Asr")
+        self.assertTrue(self.dispatcher.submit("Asr"))
+
+        self.assertEqual(self.dispatcher.stats()["deduplicated"], 2)
+
+    def test_updates_are_throttled_to_one_per_window(self):
+        self.dispatcher.submit("Asr")
+        self.dispatcher.flush()
+        self.now += 0.1
+        self.dispatcher.submit("Maghrib")
+        self.dispatcher.submit("Isha")
+
+        self.assertEqual(self.scheduled, [0, 150])
+        self.dispatcher.flush()
+        self.assertEqual(self.present.call_count, 2)
+        self.assertEqual(self.present.call_args[0][0], ["Maghrib", "Isha"])
+        self.assertEqual(self.dispatcher.stats()["largest_batch"], 2)
+
+    def test_flush_without_pending_reminders_does_nothing(self):
+        self.dispatcher.flush()
+        self.present.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import select
+import threading
+import time
+import tkinter
+import unittest
+
+from app.services.event_channel import EventChannel
+
+
+class FakeTk:
+    """Watches file handlers like Tk's notifier; pump() runs those that are readable."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.calling_threads = set()
+
+    def createfilehandler(self, fd, mask, func):
+        self.calling_threads.add(threading.get_ident())
+        self.handlers[fd] = (mask, func)
+
+    def deletefilehandler(self, fd):
+        self.calling_threads.add(threading.get_ident())
+        del self.handlers[fd]
+
+    def pump(self):
+        readable, _, _ = select.select(list(self.handlers), [], [], 0)
+        for fd in readable:
+            mask, func = self.handlers[fd]
+            func(fd, mask)
+
+
+class FakeWidget:
+    """A root window whose Tk can watch file descriptors."""
+
+    def __init__(self):
+        self.tk = FakeTk()
+
+    def pump(self):
+        self.tk.pump()
+
+
+class PollingWidget:
+    """A root window on a Tk without file handlers (as on Windows); pump() runs due after() callbacks."""
+
+    def __init__(self):
+        self.tk = object()
+        self.jobs = []
+
+    def after(self, ms, func):
+        self.jobs.append(func)
+        return f"job{len(self.jobs)}"
+
+    def after_cancel(self, job):
+        self.jobs.clear()
+
+    def pump(self):
+        jobs, self.jobs = self.jobs, []
+        for func in jobs:
+            func()
+
+
+class TestEventChannel(unittest.TestCase):
+
+    def setUp(self):
+        self.channel = EventChannel()
+        self.widget = FakeWidget()
+        self.received = []
+        self.addCleanup(self.channel.detach)
+
+    def drain(self):
+        while not self.channel.empty():
+            self.received.append(self.channel.get_nowait())
+
+    def test_burst_is_delivered_with_one_wakeup(self):
+        self.channel.attach(self.widget, self.drain)
+
+        for prayer in ("Asr", "Maghrib", "Isha"):
+            self.channel.put(("show_notification", prayer))
+
+        self.widget.pump()
+        self.assertEqual([data for _, data in self.received], ["Asr", "Maghrib", "Isha"])
+        stats = self.channel.stats()
+        self.assertEqual(stats["delivered"], 3)
+        self.assertEqual(stats["wakeups"], 1)
+        self.assertGreaterEqual(stats["max_latency_ms"], stats["avg_latency_ms"])
+
+        # Nothing is pending after the drain, and the next message wakes the loop again
+        self.widget.pump()
+        self.assertEqual(self.channel.stats()["wakeups"], 1)
+        self.channel.put(("show_notification", "Fajr"))
+        self.widget.pump()
+        self.assertEqual(self.channel.stats()["wakeups"], 2)
+
+    def test_messages_put_before_attach_are_delivered(self):
+        self.channel.put(("show_notification", "Fajr"))
+
+        self.channel.attach(self.widget, self.drain)
+        self.widget.pump()
+        self.assertEqual(self.received, [("show_notification", "Fajr")])
+
+    def test_puts_from_other_threads_never_call_into_tk(self):
+        self.channel.attach(self.widget, self.drain)
+        threads = [threading.Thread(target=self.channel.put, args=(("show_notification", i),)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.widget.pump()
+        self.assertEqual(sorted(data for _, data in self.received), list(range(20)))
+        self.assertEqual(self.widget.tk.calling_threads, {threading.get_ident()})
+
+    def test_falls_back_to_polling_without_file_handlers(self):
+        widget = PollingWidget()
+        self.channel.put(("show_notification", "Dhuhr"))
+        self.channel.attach(widget, self.drain)
+
+        widget.pump()
+        self.assertEqual(self.received, [("show_notification", "Dhuhr")])
+        widget.pump()  # Re-armed, but nothing to deliver
+        self.assertEqual(self.channel.stats()["wakeups"], 1)
+
+        self.channel.put(("show_notification", "Asr"))
+        widget.pump()
+        self.assertEqual(len(self.received), 2)
+
+    @unittest.skipUnless(hasattr(tkinter.Tcl().tk, "createfilehandler"), "Tk cannot watch file descriptors here")
+    def test_wakes_a_real_tcl_event_loop(self):
+        interp = tkinter.Tcl()
+        widget = type("Root", (), {"tk": interp.tk})()
+        self.channel.attach(widget, self.drain)
+
+        threading.Thread(target=self.channel.put, args=(("show_notification", "Isha"),)).start()
+        for _ in range(100):
+            interp.tk.dooneevent(tkinter._tkinter.DONT_WAIT)
+            if self.received:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.received, [("show_notification", "Isha")])
+
+
+if __name__ == "__main__":
+    unittest.main()
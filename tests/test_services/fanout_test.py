@@ -0,0 +1,170 @@
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+from app.services.fanout import SinkFanout
+from app.services.sinks import NotificationEvent, NotificationSink, UnixSocketSink, WebhookSink
+
+
+class StubWebhookServer(ThreadingHTTPServer):
+    """A local HTTP server that records the JSON bodies POSTed to it."""
+
+    def __init__(self, status=200, delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.bodies = []
+        self.received = threading.Event()
+        super().__init__(("127.0.0.1", 0), self._Handler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/hook"
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            time.sleep(self.server.delay)
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            self.server.bodies.append(json.loads(body))
+            self.send_response(self.server.status)
+            self.end_headers()
+            self.server.received.set()
+
+        def log_message(self, *args):
+            pass  # Keep test output quiet
+
+
+class BlockingSink(NotificationSink):
+    """A sink that stays busy until released, like a hung endpoint."""
+
+    name = "blocking"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.events = []
+
+    def notify(self, event):
+        self.release.wait(5)
+        self.events.append(event)
+
+
+class TestSinkFanout(unittest.TestCase):
+
+    def setUp(self):
+        self.event = NotificationEvent("show_notification", "Asr")
+        self.scheduler = MagicMock()
+
+    def test_webhook_receives_the_event(self):
+        server = StubWebhookServer()
+        self.addCleanup(server.close)
+        fanout = SinkFanout([WebhookSink(server.url, timeout=2)])
+        fanout.start(self.scheduler)
+        fanout.publish(self.event)
+        fanout.stop(timeout=2)
+
+        self.assertEqual(server.bodies[0]["prayer"], "Asr")
+        self.assertEqual(server.bodies[0]["type"], "show_notification")
+        stats = fanout.stats()["webhook"]
+        self.assertEqual(stats["delivered"], 1)
+        self.assertGreater(stats["last_latency_ms"], 0.0)
+
+    def test_webhook_errors_and_timeouts_count_as_failures(self):
+        failing = StubWebhookServer(status=500)
+        slow = StubWebhookServer(delay=1.0)
+        self.addCleanup(failing.close)
+        self.addCleanup(slow.close)
+        fanout = SinkFanout([WebhookSink(failing.url, timeout=2), WebhookSink(slow.url, timeout=0.2)])
+        fanout.start(self.scheduler)
+        fanout.publish(self.event)
+        fanout.stop(timeout=3)
+
+        stats = fanout.stats()
+        self.assertEqual(stats["webhook"]["failed"], 1)
+        self.assertEqual(stats["webhook#2"]["failed"], 1)
+        self.assertLess(stats["webhook#2"]["max_duration_ms"], 1000)
+
+    def test_slow_sink_does_not_delay_publish_or_other_sinks(self):
+        blocking = BlockingSink()
+        fast = MagicMock(spec=NotificationSink)
+        fast.name = "fast"
+        delivered = threading.Event()
+        fast.notify.side_effect = lambda event: delivered.set()
+        fanout = SinkFanout([blocking, fast])
+        fanout.start(self.scheduler)
+
+        started = time.perf_counter()
+        accepted = fanout.publish(self.event)
+        self.assertLess(time.perf_counter() - started, 0.05)
+        self.assertEqual(accepted, 2)
+        self.assertTrue(delivered.wait(2))
+        self.assertEqual(blocking.events, [])
+
+        blocking.release.set()
+        fanout.stop(timeout=2)
+        self.assertEqual(len(blocking.events), 1)
+        fast.open.assert_called_once_with(self.scheduler)
+        fast.close.assert_called_once()
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        blocking = BlockingSink()
+        fanout = SinkFanout([blocking], max_queue=2)
+        fanout.start(self.scheduler)
+        # One event is taken by the worker; two more fill the queue
+        results = [fanout.publish(self.event) for _ in range(6)]
+        blocking.release.set()
+        fanout.stop(timeout=2)
+
+        stats = fanout.stats()["blocking"]
+        self.assertEqual(results.count(0), stats["dropped"])
+        self.assertGreaterEqual(stats["dropped"], 3)
+        self.assertEqual(stats["delivered"] + stats["dropped"], 6)
+
+    def test_failing_sink_is_isolated(self):
+        broken = MagicMock(spec=NotificationSink)
+        broken.name = "broken"
+        broken.notify.side_effect = OSError("disk full")
+        working = MagicMock(spec=NotificationSink)
+        working.name = "working"
+        fanout = SinkFanout([broken, working])
+        fanout.start(self.scheduler)
+        fanout.publish(self.event)
+        fanout.stop(timeout=2)
+
+        working.notify.assert_called_once_with(self.event)
+        self.assertEqual(fanout.stats()["broken"]["failed"], 1)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class TestUnixSocketSink(unittest.TestCase):
+
+    def test_event_is_written_as_a_json_line(self):
+        lines = []
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                lines.append(json.loads(self.rfile.readline()))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "namaz.sock")
+            with socketserver.UnixStreamServer(path, Handler) as server:
+                worker = threading.Thread(target=server.handle_request)
+                worker.start()
+                UnixSocketSink(path, timeout=2).notify(NotificationEvent("show_notification", "Isha"))
+                worker.join(2)
+
+        self.assertEqual(lines[0]["prayer"], "Isha")
+
+
+if __name__ == "__main__":
+    unittest.main()
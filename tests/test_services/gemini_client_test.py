@@ -2,10 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 import app.services.gemini_client as gemini_client
+from app.utils.response_cache import ResponseCache
 
 
 class TestGeminiClient(unittest.TestCase):
 
+    def setUp(self):
+        # Keep answers in memory so tests never read or write the real cache file
+        self.cache = ResponseCache(None)
+        patcher = patch("app.services.gemini_client._response_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("app.services.gemini_client.load_dotenv")
     @patch.dict("os.environ", {}, clear=True)
     def test_initialize_model_missing_api_key(self, mock_load_dotenv):
@@ -24,6 +32,17 @@ class TestGeminiClient(unittest.TestCase):
         mock_configure.assert_called_once_with(api_key="dummy_api_key")
         mock_model_class.assert_called_once()
 
+    @patch("app.services.gemini_client._initialize_ai_model")
+    @patch("app.services.gemini_client.model", gemini_client._UNSET)
+    def test_model_is_initialized_once_on_first_use(self, mock_initialize):
+        mock_initialize.return_value = MagicMock()
+
+        first = gemini_client.get_model()
+        second = gemini_client.get_model()
+
+        self.assertIs(first, second)
+        mock_initialize.assert_called_once()
+
     @patch("app.services.gemini_client.model", None)
     def test_get_ai_response_when_model_not_initialized(self):
         response = gemini_client.get_ai_response("What is Fajr?")
@@ -47,3 +66,24 @@ class TestGeminiClient(unittest.TestCase):
 
         response = gemini_client.get_ai_response("Tell me about Wudu.")
         self.assertIn("unable to respond", response)
+
+    @patch("app.services.gemini_client.model")
+    def test_repeated_question_is_answered_from_cache(self, mock_model):
+        mock_model.generate_content.return_value.text = "Isha has four obligatory rakats."
+
+        first = gemini_client.get_ai_response("How many rakats in Isha?")
+        second = gemini_client.get_ai_response("  how many RAKATS in isha ")
+
+        self.assertEqual(first, second)
+        mock_model.generate_content.assert_called_once()
+        self.assertEqual(self.cache.stats()["memory_hits"], 1)
+
+    @patch("app.services.gemini_client.model")
+    def test_failed_response_is_not_cached(self, mock_model):
+        mock_model.generate_content.side_effect = [Exception("API failure"), MagicMock(text="Answer")]
+
+        gemini_client.get_ai_response("Tell me about Wudu.")
+        response = gemini_client.get_ai_response("Tell me about Wudu.")
+
+        self.assertEqual(response, "Answer")
+        self.assertEqual(mock_model.generate_content.call_count, 2)
@@ -0,0 +1,74 @@
+import json
+import queue
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from app.services.headless import run_headless
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Runs in a fresh interpreter so modules imported by other tests do not interfere
+PROBE = """
+import json, sys
+import main
+from app.services import headless, sinks
+main.parse_args(["--headless", "--sink", "stdout", "--sink", "audio"])
+[sinks.build_sink(spec) for spec in ("stdout", "log", "audio", "command:true")]
+gui = ("tkinter", "customtkinter", "pystray", "PIL", "app.views.main_view")
+print(json.dumps(sorted(name for name in gui if name in sys.modules)))
+"""
+
+
+class TestHeadless(unittest.TestCase):
+
+    def test_headless_imports_no_gui_toolkit(self):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(json.loads(output.strip().splitlines()[-1]), [])
+
+    def test_run_headless_delivers_notifications_until_stopped(self):
+        notification_queue = queue.Queue()
+        scheduler = MagicMock(notification_queue=notification_queue)
+        scheduler.is_alive.return_value = True
+        stop_event = threading.Event()
+        sink = MagicMock()
+        sink.name = "test"
+        sink.notify.side_effect = lambda event: stop_event.set()
+
+        notification_queue.put(("show_notification", "Isha"))
+        run_headless([sink], stop_event, scheduler)
+
+        self.assertEqual(sink.notify.call_args[0][0].prayer_name, "Isha")
+        scheduler.stop.assert_called_once()
+        sink.close.assert_called_once()
+
+    def test_stop_wakes_the_loop_blocked_on_the_queue(self):
+        class RecordingQueue(queue.Queue):
+            def get(self, block=True, timeout=None):
+                timeouts.append(timeout)
+                waiting.set()
+                return super().get(block, timeout)
+
+        timeouts = []
+        waiting = threading.Event()
+        scheduler = MagicMock(notification_queue=RecordingQueue())
+        scheduler.is_alive.return_value = True
+        stop_event = threading.Event()
+        runner = threading.Thread(target=run_headless, args=([], stop_event, scheduler))
+        runner.start()
+
+        self.assertTrue(waiting.wait(timeout=5))
+        stop_event.set()
+        runner.join(timeout=5)
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(timeouts, [None])
+        scheduler.stop.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
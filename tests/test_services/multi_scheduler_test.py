@@ -0,0 +1,91 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from datetime import datetime
+
+from app.services.multi_scheduler import MultiProfileScheduler
+
+
+def _ts(hour, minute, day=20):
+    return datetime(2025, 6, day, hour, minute).timestamp()
+
+
+class TestMultiProfileScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_queue = MagicMock()
+        self.scheduler = MultiProfileScheduler(self.mock_queue)
+
+    def test_dispatch_tags_events_with_profile_id(self):
+        self.scheduler.set_profile("alice", {"Fajr": "04:30", "Asr": "15:15"}, now=_ts(3, 0))
+        self.scheduler.set_profile("bob", {"Fajr": "04:30"}, now=_ts(3, 0))
+
+        sent = self.scheduler.dispatch_due(_ts(4, 30))
+
+        self.assertEqual(sent, 2)
+        self.mock_queue.put.assert_any_call(('show_notification', ('alice', 'Fajr')))
+        self.mock_queue.put.assert_any_call(('show_notification', ('bob', 'Fajr')))
+
+    def test_each_profile_keeps_one_pending_entry(self):
+        for i in range(100):
+            self.scheduler.set_profile(i, {"Fajr": "04:30", "Dhuhr": "12:00"}, now=_ts(3, 0))
+
+        self.scheduler.dispatch_due(_ts(12, 0))
+
+        self.assertEqual(len(self.scheduler._heap), 100)
+        self.assertEqual(self.scheduler.next_deadline(), _ts(4, 30, day=21))
+
+    def test_updated_profile_discards_stale_deadline(self):
+        self.scheduler.set_profile("alice", {"Fajr": "04:30"}, now=_ts(3, 0))
+        self.scheduler.set_profile("alice", {"Fajr": "05:00"}, now=_ts(3, 0))
+
+        self.assertEqual(self.scheduler.dispatch_due(_ts(4, 45)), 0)
+        self.assertEqual(self.scheduler.dispatch_due(_ts(5, 0)), 1)
+
+    def test_readded_profile_fires_once(self):
+        self.scheduler.set_profile("alice", {"Fajr": "04:30"}, now=_ts(3, 0))
+        self.scheduler.remove_profile("alice")
+        self.scheduler.set_profile("alice", {"Fajr": "04:30"}, now=_ts(3, 0))
+
+        for day in (20, 21, 22):
+            self.assertEqual(self.scheduler.dispatch_due(_ts(4, 30, day=day)), 1)
+
+    def test_notifications_are_sent_without_holding_the_lock(self):
+        scheduler = self.scheduler
+        snoozed = []
+
+        class WaitingQueue:
+            def put(self, item):
+                consumer = threading.Thread(
+                    target=lambda: (scheduler.snooze_prayer("alice", "Fajr", now=_ts(4, 30)), snoozed.append(True))
+                )
+                consumer.start()
+                consumer.join(timeout=2)
+
+        scheduler.notification_queue = WaitingQueue()
+        scheduler.set_profile("alice", {"Fajr": "04:30"}, now=_ts(3, 0))
+
+        self.assertEqual(scheduler.dispatch_due(_ts(4, 30)), 1)
+        self.assertEqual(snoozed, [True])
+
+    def test_missed_reminders_are_skipped_but_rescheduled(self):
+        self.scheduler.set_profile("alice", {"Fajr": "04:30", "Dhuhr": "12:00"}, now=_ts(3, 0))
+
+        self.assertEqual(self.scheduler.dispatch_due(_ts(11, 0)), 0)
+        self.assertEqual(self.scheduler.next_deadline(), _ts(12, 0))
+
+    @patch("app.services.multi_scheduler.config.DEFAULT_SNOOZE_MINUTES", 5)
+    def test_snooze_and_remove_profile(self):
+        self.scheduler.set_profile("alice", {"Fajr": "04:30"}, now=_ts(3, 0))
+        self.scheduler.set_profile("bob", {"Fajr": "04:30"}, now=_ts(3, 0))
+        self.scheduler.snooze_prayer("alice", "Fajr", now=_ts(4, 31))
+        self.scheduler.snooze_prayer("bob", "Fajr", now=_ts(4, 31))
+        self.scheduler.remove_profile("bob")
+
+        self.assertEqual(self.scheduler.dispatch_due(_ts(4, 36)), 1)
+        self.mock_queue.put.assert_called_once_with(('show_notification', ('alice', 'Fajr')))
+        self.assertEqual(self.scheduler.profile_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
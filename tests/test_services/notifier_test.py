@@ -6,56 +6,94 @@ from app.services import notifier
 
 class TestNotifier(unittest.TestCase):
 
-    @patch("app.services.notifier.os.path.exists", return_value=False)
-    @patch("app.services.notifier.utils.logging.warning")
-    @patch("app.services.notifier.config")
-    def test_play_azan_sound_missing_file(self, mock_config, mock_log, mock_exists):
-        mock_config.AZAN_SOUND_FILE = "nonexistent.mp3"
-        notifier.play_azan_sound()
-        mock_log.assert_called_with("Audio file not found at: nonexistent.mp3")
-
-    @patch("app.services.notifier.pygame.mixer.music.stop")
-    @patch("app.services.notifier.pygame.mixer.music.get_busy", return_value=True)
-    @patch("app.services.notifier.pygame.mixer.get_init", return_value=True)
-    @patch("app.services.notifier.utils.logging.info")
-    def test_stop_azan_sound(self, mock_log, mock_get_init, mock_get_busy, mock_stop):
+    @patch("app.services.notifier.get_audio_engine")
+    def test_play_azan_sound_uses_audio_engine(self, mock_engine):
+        notifier.play_azan_sound("Fajr")
+        mock_engine.return_value.play.assert_called_once_with("Fajr")
+
+    @patch("app.services.notifier.get_audio_engine")
+    def test_stop_and_fade_azan_sound(self, mock_engine):
         notifier.stop_azan_sound()
-        mock_stop.assert_called_once()
-        mock_log.assert_called_with("Azan sound stopped.")
-
-    @patch("app.services.notifier.pygame.mixer.music.play")
-    @patch("app.services.notifier.pygame.mixer.music.load")
-    @patch("app.services.notifier.pygame.mixer.init")
-    @patch("app.services.notifier.pygame.mixer.get_init", return_value=False)
-    @patch("app.services.notifier.os.path.exists", return_value=True)
-    @patch("app.services.notifier.config")
-    @patch("app.services.notifier.utils.logging.info")
-    def test_play_azan_sound_success(
-        self, mock_log, mock_config, mock_exists, mock_get_init, mock_init, mock_load, mock_play
-    ):
-        mock_config.AZAN_SOUND_FILE = "dummy.mp3"
-        notifier.play_azan_sound()
-        mock_load.assert_called_with("dummy.mp3")
-        mock_play.assert_called_once()
-        mock_log.assert_called_with("Azan sound started playing.")
-
-    @patch("app.services.notifier.ctk.CTkToplevel")
-    @patch("app.services.notifier._create_popup_widgets")
-    @patch("app.services.notifier._center_popup_window")
-    @patch("app.services.notifier.threading.Thread")
-    def test_show_notification_popup_creates_window(
-        self, mock_thread, mock_center, mock_create, mock_popup
-    ):
-        mock_popup_instance = MagicMock()
-        mock_popup.return_value = mock_popup_instance
-
-        notifier.show_notification_popup("Fajr", lambda: None, lambda: None)
-
-        mock_popup.assert_called_once()
-        mock_popup_instance.title.assert_called_with("Fajr Reminder")
-        mock_center.assert_called_once()
-        mock_create.assert_called_once()
-        mock_popup_instance.focus_force.assert_called_once()
+        notifier.fade_azan_sound()
+        mock_engine.return_value.stop.assert_called_once()
+        mock_engine.return_value.fade.assert_called_once()
+
+
+class TestNotificationPopup(unittest.TestCase):
+
+    def setUp(self):
+        for target in ("ctk", "play_azan_sound", "fade_azan_sound"):
+            patcher = patch(f"app.services.notifier.{target}")
+            setattr(self, f"mock_{target}", patcher.start())
+            self.addCleanup(patcher.stop)
+        # Separate mocks per widget, so rows can be told apart
+        self.mock_ctk.CTkFrame.side_effect = lambda *args, **kwargs: MagicMock()
+        self.mock_ctk.CTkButton.side_effect = lambda *args, **kwargs: MagicMock()
+        self.window = self.mock_ctk.CTkToplevel.return_value
+        self.window.winfo_screenwidth.return_value = 1920
+        self.window.winfo_screenheight.return_value = 1080
+        self.popup = notifier.NotificationPopup()
+
+    def test_window_is_built_withdrawn_and_centered(self):
+        self.window.withdraw.assert_called_once()
+        self.window.geometry.assert_called_once_with("350x180+785+450")
+        self.window.deiconify.assert_not_called()
+
+    def test_show_reuses_the_window(self):
+        self.popup.show(["Fajr"], None, None)
+        self.popup.hide()
+        self.popup.show(["Isha"], None, None)
+
+        self.mock_ctk.CTkToplevel.assert_called_once()
+        self.assertEqual(self.window.deiconify.call_count, 2)
+        self.window.title.assert_called_with("Isha Reminder")
+        # The row from the first reminder was reused
+        self.assertEqual(len(self.popup._rows), 1)
+
+    def test_burst_shares_one_window_and_one_azan(self):
+        self.popup.show(["Asr", "Maghrib"], None, None)
+        self.popup.show(["Maghrib", "Isha"], None, None)
+
+        self.assertEqual(self.popup.prayers, ["Asr", "Maghrib", "Isha"])
+        self.window.deiconify.assert_called_once()
+        self.mock_play_azan_sound.assert_called_once_with("Asr")
+        self.window.title.assert_called_with("Prayer Reminders")
+        self.window.geometry.assert_called_with("350x280+785+400")
+
+    def test_each_prayer_is_answered_separately(self):
+        offered, snoozed = MagicMock(), MagicMock()
+        self.popup.show(["Asr", "Maghrib"], offered, snoozed)
+        asr_row = self.popup._rows[0]
+        asr_row.offered_button.configure.call_args[1]["command"]()
+
+        offered.assert_called_once_with("Asr")
+        self.assertEqual(self.popup.prayers, ["Maghrib"])
+        self.mock_fade_azan_sound.assert_not_called()  # Maghrib is still waiting
+
+        maghrib_row = next(row for row in self.popup._rows if row.prayer_name == "Maghrib")
+        maghrib_row.snooze_button.configure.call_args[1]["command"]()
+        snoozed.assert_called_once_with("Maghrib")
+        self.assertFalse(self.popup.is_showing)
+        self.mock_fade_azan_sound.assert_called_once()
+        self.window.destroy.assert_not_called()
+
+    def test_closing_the_window_snoozes_every_prayer(self):
+        snoozed = MagicMock()
+        self.popup.show(["Asr", "Maghrib"], None, snoozed)
+        self.popup._on_close()
+
+        self.assertEqual([c.args[0] for c in snoozed.call_args_list], ["Asr", "Maghrib"])
+        self.assertFalse(self.popup.is_showing)
+
+    def test_first_frame_latency_is_recorded_once(self):
+        with patch("app.services.notifier.time.perf_counter", return_value=10.025):
+            self.popup.show(["Dhuhr"], None, None, received_at=9.990)
+            self.popup._on_expose()
+            self.popup._on_expose()  # Later redraws of the same reminder are not counted
+
+        stats = self.popup.stats()
+        self.assertEqual(stats["shown"], 1)
+        self.assertAlmostEqual(stats["last_latency_ms"], 35.0)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ import customtkinter as ctk
 
 from app.services import prayer_calendar
 from app.utils import config
+from app.utils.prayer_schedule import CompiledSchedule
+from app.utils.status_history import StatusHistory
 
 
 class TestPrayerCalendarService(unittest.TestCase):
@@ -44,40 +46,70 @@ class TestPrayerCalendarService(unittest.TestCase):
             saved = json.load(f)
         self.assertEqual(saved, data)
 
+    def test_save_status_data_skips_unchanged_file(self):
+        prayer_calendar._save_status_data({"2025-06-20_Fajr": "Completed"})
+        mtime = os.stat(self.test_file).st_mtime_ns
+
+        prayer_calendar._save_status_data({"2025-06-20_Fajr": "Completed"})
+        self.assertEqual(os.stat(self.test_file).st_mtime_ns, mtime)
+
+    def test_status_change_tracker_reports_only_changed_keys(self):
+        tracker = prayer_calendar.StatusChangeTracker()
+        self.assertEqual(tracker.changes(), {})
+
+        tracker.update("2025-06-20_Fajr", "Completed", "Not Completed")
+        tracker.update("2025-06-20_Isha", "Completed", "Late")
+        tracker.update("2025-06-20_Isha", "Late", "Completed")  # Reverted to the loaded value
+        self.assertEqual(tracker.changes(), {"2025-06-20_Fajr": "Completed"})
+
     def test_should_disable_button_logic(self):
         today = datetime.now().date()
         future_date = today + timedelta(days=1)
         past_date = today - timedelta(days=1)
         now_time_str = datetime.now().strftime("%H:%M")
         early_time_str = (datetime.now() + timedelta(minutes=30)).strftime("%H:%M")
+        schedule = CompiledSchedule({"Fajr": now_time_str, "Asr": early_time_str, "Isha": ""}, today)
 
         # Future date = disabled
-        self.assertTrue(prayer_calendar._should_disable_button(future_date, today, now_time_str))
+        self.assertTrue(prayer_calendar._should_disable_button(future_date, today, schedule, "Fajr"))
         # Past date = not disabled
-        self.assertFalse(prayer_calendar._should_disable_button(past_date, today, now_time_str))
+        self.assertFalse(prayer_calendar._should_disable_button(past_date, today, schedule, "Fajr"))
         # Today, time not reached = disabled
-        self.assertTrue(prayer_calendar._should_disable_button(today, today, early_time_str))
+        self.assertTrue(prayer_calendar._should_disable_button(today, today, schedule, "Asr"))
         # Today, empty time = disabled
-        self.assertTrue(prayer_calendar._should_disable_button(today, today, ""))
+        self.assertTrue(prayer_calendar._should_disable_button(today, today, schedule, "Isha"))
         # Today, time already passed = not disabled
-        self.assertFalse(prayer_calendar._should_disable_button(today, today, now_time_str))
+        self.assertFalse(prayer_calendar._should_disable_button(today, today, schedule, "Fajr"))
 
-    @patch("app.services.prayer_calendar._load_status_data", return_value={})
-    @patch("app.services.prayer_calendar.calendar_view.build_calendar_frame")
-    def test_open_calendar_view_structure(self, mock_build_calendar, mock_load):
+    @patch("app.services.prayer_calendar._load_status_history", return_value=StatusHistory())
+    @patch("app.services.prayer_calendar.calendar_view.VirtualCalendar")
+    def test_calendar_page_structure(self, mock_calendar, mock_load):
         # Use real CTk root to avoid frame creation errors
         root = ctk.CTk()
         root.withdraw()
 
-        def fake_get_times():
-            return {name: "05:00" for name in ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]}
+        def fake_get_schedule():
+            times = {name: "05:00" for name in ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]}
+            return CompiledSchedule(times, datetime.now().date())
 
         switch_mock = MagicMock()
 
-        frame = prayer_calendar.open_calendar_view(root, fake_get_times, switch_mock)
+        page = prayer_calendar.CalendarPage(root, fake_get_schedule, switch_mock)
+
+        self.assertIsInstance(page.frame, ctk.CTkFrame)
+        mock_calendar.assert_called_once()
+        mock_calendar.return_value.scroll_to.assert_called_once_with(datetime.now().date())
+
+        # Showing the page again refreshes the same calendar instead of rebuilding it
+        page.refresh()
+        mock_calendar.assert_called_once()
+        mock_calendar.return_value.refresh.assert_called_once()
 
-        self.assertIsInstance(frame, ctk.CTkFrame)
-        mock_build_calendar.assert_called_once()
+        # Leaving without changes writes nothing
+        with patch("app.services.prayer_calendar._save_status_data") as mock_save:
+            page.save_and_back()
+        mock_save.assert_not_called()
+        switch_mock.assert_called_once()
 
         root.destroy()
 
@@ -1,8 +1,11 @@
+import queue
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
 from app.services.scheduler import ReminderScheduler
+from app.utils.clock import VirtualClock
 
 
 class TestReminderScheduler(unittest.TestCase):
@@ -48,19 +51,16 @@ class TestReminderScheduler(unittest.TestCase):
         from app.utils import config  # dynamic import to get default snooze minutes
 
         fixed_now = datetime(2025, 6, 20, 2, 0)
+        self.scheduler.clock = VirtualClock(fixed_now)
 
-        with patch("app.services.scheduler.datetime") as mock_datetime:
-            mock_datetime.now.return_value = fixed_now
-            mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
+        self.scheduler.snooze_prayer("Fajr")
 
-            self.scheduler.snooze_prayer("Fajr")
+        self.assertIn("Fajr", self.scheduler.snoozed_reminders)
+        snoozed_until = self.scheduler.snoozed_reminders["Fajr"]
+        expected = fixed_now + timedelta(minutes=config.DEFAULT_SNOOZE_MINUTES)
 
-            self.assertIn("Fajr", self.scheduler.snoozed_reminders)
-            snoozed_until = self.scheduler.snoozed_reminders["Fajr"]
-            expected = fixed_now + timedelta(minutes=config.DEFAULT_SNOOZE_MINUTES)
-
-            delta_seconds = abs((snoozed_until - expected).total_seconds())
-            self.assertLessEqual(delta_seconds, 1, f"Expected ~{expected}, got {snoozed_until}")
+        delta_seconds = abs((snoozed_until - expected).total_seconds())
+        self.assertLessEqual(delta_seconds, 1, f"Expected ~{expected}, got {snoozed_until}")
 
     @patch("app.services.scheduler.utils.load_prayer_times")
     @patch("app.services.scheduler.utils.logging.info")
@@ -72,6 +72,65 @@ class TestReminderScheduler(unittest.TestCase):
         self.scheduler._check_for_day_change(datetime(2025, 6, 20, 0, 0))
         self.assertEqual(self.scheduler.last_checked_date, datetime(2025, 6, 20).date())
 
+    @patch("app.services.scheduler.utils.load_prayer_times")
+    def test_reload_times_skips_prayers_already_passed(self, mock_load_prayer_times):
+        mock_load_prayer_times.return_value = {"Fajr": "04:30", "Dhuhr": "12:00", "Asr": "15:15"}
+        self.scheduler.reload_times(datetime(2025, 6, 20, 12, 0, 30))
+
+        scheduled = sorted(name for _, name in self.scheduler._regular_deadlines)
+        self.assertEqual(scheduled, ["Asr", "Dhuhr"])
+
+    @patch("app.services.scheduler.utils.log_user_action")
+    @patch("app.services.scheduler.utils.load_prayer_times")
+    def test_check_regular_reminders_fires_only_due_deadlines(self, mock_load_prayer_times, mock_log_user_action):
+        mock_load_prayer_times.return_value = {"Dhuhr": "12:00", "Asr": "15:15"}
+        self.scheduler.reload_times(datetime(2025, 6, 20, 11, 0))
+
+        self.scheduler.run_pending(datetime(2025, 6, 20, 12, 0, 5))
+
+        self.mock_queue.put.assert_called_once_with(('show_notification', 'Dhuhr'))
+        self.assertEqual(self.scheduler.reminders_today, {"Asr": "15:15"})
+        self.assertEqual(self.scheduler.next_deadline(datetime(2025, 6, 20, 12, 0, 5)),
+                         datetime(2025, 6, 20, 15, 15))
+
+    @patch("app.services.scheduler.utils.log_user_action")
+    @patch("app.services.scheduler.utils.load_prayer_times")
+    def test_notifications_are_sent_without_holding_the_lock(self, mock_load_prayer_times, mock_log_user_action):
+        # A queue whose put() waits for another thread to snooze, as the GUI
+        # thread does when tkinter hands it a call from the scheduler thread
+        scheduler = self.scheduler
+        snoozed = []
+
+        class WaitingQueue:
+            def put(self, item):
+                gui = threading.Thread(target=lambda: (scheduler.snooze_prayer("Asr"), snoozed.append(True)))
+                gui.start()
+                gui.join(timeout=2)
+
+        mock_load_prayer_times.return_value = {"Dhuhr": "12:00"}
+        scheduler.reload_times(datetime(2025, 6, 20, 11, 0))
+        scheduler.notification_queue = WaitingQueue()
+
+        scheduler.run_pending(datetime(2025, 6, 20, 12, 0, 5))
+
+        self.assertEqual(snoozed, [True])
+
+    @patch("app.services.scheduler.utils.log_user_action")
+    @patch("app.services.scheduler.config.DEFAULT_SNOOZE_MINUTES", 0)
+    def test_snooze_wakes_sleeping_thread(self, mock_log_user_action):
+        self.mock_queue = queue.Queue()
+        self.scheduler.notification_queue = self.mock_queue
+        self.scheduler.reminders_today = {}
+        self.scheduler._regular_deadlines = []
+        self.scheduler.start()
+        try:
+            self.scheduler.snooze_prayer("Isha")
+            self.assertEqual(self.mock_queue.get(timeout=2), ('show_notification', 'Isha'))
+        finally:
+            self.scheduler.stop()
+            self.scheduler.join(timeout=2)
+        self.assertFalse(self.scheduler.is_alive())
+
 
 if __name__ == "__main__":
     unittest.main()
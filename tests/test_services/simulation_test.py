@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime
+
+from app.services import simulation
+
+TIMES = {"Fajr": "04:30", "Dhuhr": "12:15", "Asr": "15:45", "Maghrib": "19:10", "Isha": "20:40"}
+
+
+class TestSimulation(unittest.TestCase):
+
+    def test_month_fires_every_prayer_on_time(self):
+        start, end = datetime(2025, 6, 1), datetime(2025, 7, 1)
+        result = simulation.simulate(start, end, lambda day: TIMES)
+
+        self.assertEqual(len(result.notifications), 30 * 5)
+        self.assertEqual(result.max_latency_seconds(), 0.0)
+        self.assertEqual(result.missed(lambda day: TIMES), [])
+        # One pass per reminder, one per midnight, plus the capped sleeps in between
+        self.assertLess(result.wakeups, 30 * 24 * 3600 / 300 + 30 * 6 + 1)
+
+    def test_day_rollover_picks_up_new_times(self):
+        def times_for_date(day):
+            return {"Fajr": "04:30" if day.day == 1 else "04:31"}
+
+        result = simulation.simulate(datetime(2025, 6, 1), datetime(2025, 6, 3), times_for_date)
+
+        fired = [n.fired_at for n in result.notifications]
+        self.assertEqual(fired, [datetime(2025, 6, 1, 4, 30), datetime(2025, 6, 2, 4, 31)])
+
+    def test_snoozes_retrigger_until_acknowledged(self):
+        def react(scheduler, fired):
+            if fired.prayer_name == "Fajr" and fired.fired_at.minute < 33:
+                scheduler.snooze_prayer("Fajr")
+            else:
+                scheduler.acknowledge_prayer(fired.prayer_name)
+
+        result = simulation.simulate(datetime(2025, 6, 1), datetime(2025, 6, 1, 6), lambda day: TIMES, react)
+
+        fired = [n.fired_at.strftime("%H:%M") for n in result.notifications]
+        self.assertEqual(fired, ["04:30", "04:31", "04:32", "04:33"])
+        actions = [action for _, action, _ in result.actions]
+        self.assertEqual(actions.count("snoozed"), 3)
+        self.assertEqual(actions[-1], "offered")
+
+    def test_start_mid_minute_still_fires_current_prayer(self):
+        result = simulation.simulate(datetime(2025, 6, 1, 12, 15, 40), datetime(2025, 6, 1, 13), lambda day: TIMES)
+
+        self.assertEqual(len(result.notifications), 1)
+        self.assertEqual(result.notifications[0].latency_seconds, 40.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
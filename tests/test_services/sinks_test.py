@@ -0,0 +1,77 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.services.sinks import (
+    AudioSink, CommandSink, LogFileSink, NotificationEvent, StdoutSink, UnixSocketSink, WebhookSink,
+    build_sink
+)
+
+
+class TestSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.event = NotificationEvent("show_notification", "Asr", datetime(2025, 6, 20, 15, 30))
+
+    def test_stdout_sink_prints_a_line(self):
+        stream = io.StringIO()
+        StdoutSink(stream).notify(self.event)
+        self.assertEqual(stream.getvalue(), "[2025-06-20 15:30:00] It's time for Asr prayer!\n")
+
+    def test_log_file_sink_appends(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs", "notifications.log")
+            sink = LogFileSink(path)
+            sink.notify(self.event)
+            sink.notify(NotificationEvent("show_notification", "Maghrib"))
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("Asr", lines[0])
+        self.assertIn("Maghrib", lines[1])
+
+    def test_command_sink_passes_event_to_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, "out.txt")
+            script = f"import os; open({out!r}, 'w').write(os.environ['NAMAZ_PRAYER'] + ' ' + os.environ['NAMAZ_EVENT'])"
+            sink = CommandSink(f'"{sys.executable}" -c "{script}"')
+            sink.notify(self.event)
+            with open(out) as f:
+                self.assertEqual(f.read(), "Asr show_notification")
+
+    def test_command_sink_substitutes_prayer_placeholder(self):
+        with patch("app.services.sinks.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            CommandSink("notify-send 'Time for {prayer}'").notify(self.event)
+        self.assertEqual(mock_run.call_args[0][0], ["notify-send", "Time for Asr"])
+
+    def test_audio_sink_plays_on_the_audio_engine(self):
+        with patch("app.services.audio.get_audio_engine") as mock_engine, \
+                patch("app.services.audio.shutdown_audio_engine") as mock_shutdown:
+            sink = AudioSink()
+            sink.open(MagicMock())
+            sink.notify(self.event)
+            sink.close()
+        mock_engine.return_value.play.assert_called_once_with("Asr")
+        mock_engine.return_value.follow_schedule.assert_called_once()
+        mock_shutdown.assert_called_once()
+
+    def test_build_sink(self):
+        self.assertIsInstance(build_sink("stdout"), StdoutSink)
+        self.assertIsInstance(build_sink("audio"), AudioSink)
+        self.assertEqual(build_sink("log:/tmp/x.log").path, "/tmp/x.log")
+        self.assertEqual(build_sink("command:echo hi").command, ["echo", "hi"])
+        self.assertIsInstance(build_sink("webhook:http://localhost:8123/hook"), WebhookSink)
+        self.assertEqual(build_sink("socket:/run/namaz.sock").path, "/run/namaz.sock")
+        self.assertIsInstance(build_sink("socket:/run/namaz.sock"), UnixSocketSink)
+        for spec in ("speaker", "command:", "stdout:x", "webhook:", "webhook:ftp://host/x"):
+            with self.assertRaises(ValueError):
+                build_sink(spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
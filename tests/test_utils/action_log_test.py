@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from app.utils import action_log
+
+
+class TestActionLog(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.temp_dir.name) / "user_logs.jsonl"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_append_writes_one_line_per_entry(self):
+        writer = action_log.ActionLogWriter(self.log_path, max_bytes=10_000)
+        writer.append({"action": "notified", "prayer": "Fajr"})
+        writer.append_many([{"action": "snoozed"}, {"action": "offered"}])
+        writer.close()
+
+        lines = self.log_path.read_text().splitlines()
+        self.assertEqual([json.loads(line)["action"] for line in lines], ["notified", "snoozed", "offered"])
+
+    def test_size_rotation_keeps_order_for_reader(self):
+        writer = action_log.ActionLogWriter(self.log_path, max_bytes=60)
+        for i in range(10):
+            writer.append({"n": i, "action": "notified"})
+        writer.close()
+
+        self.assertGreater(len(action_log.rotated_files(self.log_path)), 1)
+        self.assertEqual([entry["n"] for entry in action_log.iter_actions(self.log_path)], list(range(10)))
+
+    def test_daily_rotation(self):
+        writer = action_log.ActionLogWriter(self.log_path, max_bytes=10_000)
+        with patch("app.utils.action_log.datetime") as mock_datetime:
+            mock_datetime.now.return_value.date.return_value = date(2025, 6, 19)
+            writer.append({"n": 1})
+            mock_datetime.now.return_value.date.return_value = date(2025, 6, 20)
+            writer.append({"n": 2})
+        writer.close()
+
+        rotated = action_log.rotated_files(self.log_path)
+        self.assertEqual([p.name for p in rotated], ["user_logs.2025-06-19.jsonl"])
+        self.assertEqual([entry["n"] for entry in action_log.iter_actions(self.log_path)], [1, 2])
+
+    def test_reader_skips_malformed_lines(self):
+        self.log_path.write_text('{"n": 1}\nnot json\n\n{"n": 2}\n')
+        self.assertEqual([entry["n"] for entry in action_log.iter_actions(self.log_path)], [1, 2])
+
+    def test_migrate_legacy_log_runs_once_and_preserves_order(self):
+        legacy_path = Path(self.temp_dir.name) / "user_logs.json"
+        legacy_path.write_text(json.dumps([{"n": 1}, {"n": 2}], indent=4))
+        self.log_path.write_text('{"n": 3}\n')
+
+        self.assertEqual(action_log.migrate_legacy_log(legacy_path, self.log_path), 2)
+        self.assertEqual(action_log.migrate_legacy_log(legacy_path, self.log_path), 0)
+
+        self.assertFalse(legacy_path.exists())
+        self.assertTrue(os.path.exists(str(legacy_path) + ".migrated"))
+        self.assertEqual([entry["n"] for entry in action_log.iter_actions(self.log_path)], [1, 2, 3])
+
+
+class TestBufferedActionLogger(unittest.TestCase):
+
+    def test_entries_are_written_in_batches(self):
+        written = []
+        logger = action_log.BufferedActionLogger(written.append, max_queue=100, batch_size=5, flush_interval=60)
+        logger.start()
+        for i in range(12):
+            logger.enqueue({"n": i})
+        self.assertTrue(logger.flush(timeout=2))
+
+        self.assertEqual([len(batch) for batch in written], [5, 5, 2])
+        self.assertEqual(logger.stats()["written"], 12)
+        logger.stop(timeout=2)
+
+    def test_time_threshold_flushes_partial_batch(self):
+        flushed = threading.Event()
+        logger = action_log.BufferedActionLogger(lambda batch: flushed.set(), max_queue=100,
+                                                 batch_size=50, flush_interval=0.05)
+        logger.start()
+        logger.enqueue({"n": 1})
+
+        self.assertTrue(flushed.wait(timeout=2))
+        logger.stop(timeout=2)
+
+    def test_full_buffer_drops_instead_of_blocking(self):
+        release = threading.Event()
+        logger = action_log.BufferedActionLogger(lambda batch: release.wait(2), max_queue=2,
+                                                 batch_size=1, flush_interval=60)
+        logger.start()
+        results = [logger.enqueue({"n": i}) for i in range(10)]
+        release.set()
+
+        self.assertIn(False, results)
+        self.assertEqual(logger.stats()["dropped"], results.count(False))
+        logger.stop(timeout=2)
+
+    def test_stop_flushes_remaining_entries_and_counts_failures(self):
+        def failing_sink(batch):
+            raise IOError("disk full")
+
+        logger = action_log.BufferedActionLogger(failing_sink, max_queue=100, batch_size=50, flush_interval=60)
+        logger.start()
+        logger.enqueue({"n": 1})
+        logger.enqueue({"n": 2})
+
+        self.assertTrue(logger.stop(timeout=2))
+        self.assertFalse(logger.is_alive())
+        stats = logger.stats()
+        self.assertEqual((stats["failed"], stats["queue_depth"]), (2, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from app.utils.file_cache import FileCache
+
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "data.json"
+        self.path.write_text(json.dumps({"Fajr": "04:30"}))
+        self.cache = FileCache()
+        self.loader = MagicMock(side_effect=lambda path: json.loads(Path(path).read_text()))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_unchanged_file_is_served_from_memory(self):
+        first = self.cache.get(self.path, self.loader)
+        second = self.cache.get(self.path, self.loader)
+
+        self.assertIs(first, second)
+        self.loader.assert_called_once()
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_external_change_is_detected(self):
+        self.cache.get(self.path, self.loader)
+        self.path.write_text(json.dumps({"Fajr": "05:00", "Isha": "20:40"}))
+
+        self.assertEqual(self.cache.get(self.path, self.loader)["Fajr"], "05:00")
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_put_after_write_keeps_cache_warm(self):
+        new_data = {"Fajr": "05:15"}
+        self.path.write_text(json.dumps(new_data))
+        self.cache.put(self.path, new_data)
+
+        self.assertIs(self.cache.get(self.path, self.loader), new_data)
+        self.loader.assert_not_called()
+
+    def test_missing_file_returns_none_without_loading(self):
+        os.remove(self.path)
+        self.assertIsNone(self.cache.get(self.path, self.loader))
+        self.loader.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
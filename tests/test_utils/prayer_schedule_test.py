@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime, date
+
+from app.utils import prayer_schedule
+from app.utils.prayer_schedule import CompiledSchedule
+
+DAY = date(2025, 6, 20)
+TIMES = {"Fajr": "04:30", "Dhuhr": "12:15", "Asr": "15:45", "Maghrib": "", "Isha": "bad"}
+
+
+def _ts(hour, minute, second=0, day=20):
+    return datetime(2025, 6, day, hour, minute, second).timestamp()
+
+
+class TestCompiledSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = CompiledSchedule(TIMES, DAY)
+
+    def test_invalid_and_empty_times_are_skipped(self):
+        self.assertEqual(len(self.schedule), 3)
+        self.assertIsNone(self.schedule.deadline("Maghrib"))
+        self.assertEqual(self.schedule.deadline("Asr"), datetime(2025, 6, 20, 15, 45))
+
+    def test_next_prayer_uses_strictly_later_deadline(self):
+        self.assertEqual(self.schedule.next_prayer(_ts(4, 29, 30)), ("Fajr", 30.0))
+        self.assertEqual(self.schedule.next_prayer(_ts(4, 30)), ("Dhuhr", _ts(12, 15) - _ts(4, 30)))
+
+    def test_next_prayer_wraps_to_tomorrow(self):
+        name, remaining = self.schedule.next_prayer(_ts(22, 0))
+        self.assertEqual(name, "Fajr")
+        self.assertEqual(remaining, _ts(4, 30, day=21) - _ts(22, 0))
+
+    def test_empty_schedule(self):
+        self.assertEqual(CompiledSchedule({}, DAY).next_prayer(_ts(12, 0)), (None, None))
+
+    def test_has_passed(self):
+        self.assertTrue(self.schedule.has_passed("Fajr", _ts(4, 30)))
+        self.assertFalse(self.schedule.has_passed("Dhuhr", _ts(12, 14, 59)))
+        self.assertFalse(self.schedule.has_passed("Maghrib", _ts(23, 0)))
+
+    def test_get_schedule_is_shared_until_inputs_change(self):
+        first = prayer_schedule.get_schedule(dict(TIMES), DAY)
+        self.assertIs(prayer_schedule.get_schedule(dict(TIMES), DAY), first)
+        self.assertIsNot(prayer_schedule.get_schedule(dict(TIMES), date(2025, 6, 21)), first)
+        self.assertIsNot(prayer_schedule.get_schedule({"Fajr": "04:31"}, DAY), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
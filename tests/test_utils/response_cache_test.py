@@ -0,0 +1,139 @@
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from app.utils.response_cache import ResponseCache, normalize_prompt
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "cache" / "responses.db"
+        self.clock = FakeClock()
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        self.temp_dir.cleanup()
+
+    def make_cache(self, path=True, **kwargs):
+        kwargs.setdefault("memory_entries", 8)
+        kwargs.setdefault("ttl_seconds", 3600)
+        kwargs.setdefault("max_bytes", 1024 * 1024)
+        cache = ResponseCache(self.path if path else None, clock=self.clock, **kwargs)
+        self.caches.append(cache)
+        return cache
+
+    def test_normalize_prompt(self):
+        self.assertEqual(normalize_prompt("  What  is\tFajr?? "), "what is fajr")
+        self.assertEqual(normalize_prompt("What is Fajr"), normalize_prompt("what is fajr?"))
+
+    def test_normalized_prompts_share_an_entry(self):
+        cache = self.make_cache(path=False)
+        cache.put("What is Fajr?", "v1", "The dawn prayer.")
+
+        self.assertEqual(cache.get("what is   fajr", "v1"), "The dawn prayer.")
+        self.assertIsNone(cache.get("What is Isha?", "v1"))
+
+    def test_other_version_misses(self):
+        cache = self.make_cache()
+        cache.put("What is Fajr?", "v1", "The dawn prayer.")
+
+        self.assertIsNone(cache.get("What is Fajr?", "v2"))
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = self.make_cache(path=False, memory_entries=2)
+        cache.put("a", "v1", "A")
+        cache.put("b", "v1", "B")
+        cache.get("a", "v1")
+        cache.put("c", "v1", "C")
+
+        self.assertEqual(cache.get("a", "v1"), "A")
+        self.assertIsNone(cache.get("b", "v1"))
+
+    def test_answers_persist_across_instances(self):
+        self.make_cache().put("What is Fajr?", "v1", "The dawn prayer.")
+
+        reopened = self.make_cache()
+        self.assertEqual(reopened.get("What is Fajr?", "v1"), "The dawn prayer.")
+        self.assertEqual(reopened.get("What is Fajr?", "v1"), "The dawn prayer.")
+
+        stats = reopened.stats()
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["hit_rate"], 1.0)
+
+    def test_memory_hits_do_not_write_to_disk(self):
+        cache = self.make_cache()
+        cache.put("What is Fajr?", "v1", "The dawn prayer.")
+        writes = cache._db.total_changes
+
+        for _ in range(10):
+            self.clock.now += 1
+            self.assertEqual(cache.get("What is Fajr?", "v1"), "The dawn prayer.")
+
+        self.assertEqual(cache._db.total_changes, writes)
+        self.assertEqual(cache.stats()["memory_hits"], 10)
+
+        # The last access time is written on close
+        cache.close()
+        with closing(sqlite3.connect(self.path)) as db:
+            self.assertEqual(db.execute("SELECT accessed FROM responses").fetchone()[0], self.clock.now)
+
+    def test_expired_answers_are_not_served(self):
+        cache = self.make_cache(ttl_seconds=60)
+        cache.put("What is Fajr?", "v1", "The dawn prayer.")
+        self.clock.now += 61
+
+        self.assertIsNone(cache.get("What is Fajr?", "v1"))
+        self.assertIsNone(self.make_cache(ttl_seconds=60).get("What is Fajr?", "v1"))
+
+    def test_disk_tier_evicts_least_recently_used_over_size_cap(self):
+        cache = self.make_cache(memory_entries=1, max_bytes=250)
+        for prompt in ("a", "b"):
+            cache.put(prompt, "v1", prompt * 100)
+            self.clock.now += 1
+        cache.get("a", "v1")  # "b" is now the least recently used
+        self.clock.now += 1
+        cache.put("c", "v1", "c" * 100)
+
+        self.assertIsNone(cache.get("b", "v1"))
+        self.assertEqual(cache.get("a", "v1"), "a" * 100)
+        self.assertLessEqual(cache.stats()["disk_bytes"], 250)
+
+    def test_stats_count_misses_and_entries(self):
+        cache = self.make_cache()
+        cache.get("What is Fajr?", "v1")
+        cache.put("What is Fajr?", "v1", "The dawn prayer.")
+        cache.get("What is Fajr?", "v1")
+
+        stats = cache.stats()
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["disk_entries"], 1)
+        self.assertEqual(stats["disk_bytes"], len("The dawn prayer."))
+
+    def test_unusable_database_falls_back_to_memory(self):
+        Path(self.temp_dir.name, "blocker").write_text("")
+        cache = ResponseCache(Path(self.temp_dir.name) / "blocker" / "responses.db", clock=self.clock)
+        cache.put("What is Fajr?", "v1", "The dawn prayer.")
+
+        self.assertEqual(cache.get("What is Fajr?", "v1"), "The dawn prayer.")
+        self.assertEqual(cache.stats()["disk_entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+
+from app.utils.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        sys.path.insert(0, str(self.root))
+
+    def tearDown(self):
+        sys.path.remove(str(self.root))
+        for name in ("profiled_outer", "profiled_inner"):
+            sys.modules.pop(name, None)
+        self.temp_dir.cleanup()
+
+    def test_records_phases_and_import_times(self):
+        (self.root / "profiled_inner.py").write_text("import time\ntime.sleep(0.02)\n")
+        (self.root / "profiled_outer.py").write_text(textwrap.dedent("""
+            import time
+            import profiled_inner
+            time.sleep(0.01)
+        """))
+
+        profiler = StartupProfiler()
+        profiler.start()
+        with profiler.phase("imports"):
+            import profiled_outer  # noqa: F401
+        profiler.begin("idle")
+        time.sleep(0.01)
+        profiler.stop()  # Ends the open phase too
+
+        self.assertEqual([name for name, _, _ in profiler.phases], ["imports", "idle"])
+        timings = {name: (own, total) for name, own, total in profiler.imports()}
+        outer_self, outer_total = timings["profiled_outer"]
+        inner_self, inner_total = timings["profiled_inner"]
+        self.assertGreaterEqual(inner_self, 0.02)
+        self.assertGreaterEqual(outer_total, inner_total + 0.01)
+        self.assertLess(outer_self, outer_total)
+        self.assertGreater(profiler.peak_memory_bytes, 0)
+        self.assertEqual(type(sys.modules["profiled_outer"].__loader__).__name__, "SourceFileLoader")
+        self.assertNotIn(profiler._import_timer, sys.meta_path)
+        self.assertIn("profiled_inner", profiler.report())
+
+    def test_json_output_and_baseline_check(self):
+        profiler = StartupProfiler()
+        profiler.start()
+        with profiler.phase("fast"):
+            pass
+        with profiler.phase("slow"):
+            time.sleep(0.02)
+        profiler.stop()
+
+        path = self.root / "profile.json"
+        profiler.write_json(path)
+        data = json.loads(path.read_text())
+        self.assertEqual([phase["name"] for phase in data["phases"]], ["fast", "slow"])
+
+        regressions = profiler.check_baseline({
+            "tolerance": 1.5,
+            "total_seconds": 10.0,
+            "phases": {"fast": 1.0, "slow": 0.001, "missing": 0.001},
+        })
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("phase 'slow'", regressions[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import unittest
+from datetime import date, timedelta
+
+from app.utils import config
+from app.utils.status_history import StatusHistory
+
+with open(config.PRAYER_STATUS_FILE) as f:
+    SAMPLE = json.load(f)
+
+
+class TestStatusHistory(unittest.TestCase):
+
+    def test_get_and_set(self):
+        history = StatusHistory()
+        self.assertIsNone(history.get(date(2025, 6, 20), "Fajr"))
+
+        history.set(date(2025, 6, 20), "Fajr", "Late")
+        history.set(date(2025, 6, 20), "Isha", "Completed")
+        history.set(date(2025, 6, 20), "Isha", None)
+
+        self.assertEqual(history.get(date(2025, 6, 20), "Fajr"), "Late")
+        self.assertIsNone(history.get(date(2025, 6, 20), "Isha"))
+        self.assertIsNone(history.get(date(2025, 6, 21), "Fajr"))
+
+    def test_growing_backwards_keeps_existing_values(self):
+        history = StatusHistory()
+        history.set(date(2025, 6, 20), "Asr", "Completed")
+        history.set(date(2025, 6, 13), "Maghrib", "Late")
+
+        self.assertEqual(history.get(date(2025, 6, 20), "Asr"), "Completed")
+        self.assertEqual(history.get(date(2025, 6, 13), "Maghrib"), "Late")
+        self.assertLessEqual(history.first_day, date(2025, 6, 13))
+
+    def test_json_round_trip_is_lossless(self):
+        history = StatusHistory.from_json(SAMPLE)
+        self.assertEqual(history.to_json(), SAMPLE)
+
+    def test_bytes_round_trip(self):
+        history = StatusHistory.from_json(SAMPLE)
+        restored = StatusHistory.from_bytes(history.to_bytes())
+        self.assertEqual(restored.to_json(), SAMPLE)
+        with self.assertRaises(ValueError):
+            StatusHistory.from_bytes(b"bogus")
+
+    def test_get_range_pads_days_outside_store(self):
+        history = StatusHistory.from_json({"2025-06-20_Fajr": "Completed"})
+        rows = history.get_range(date(2025, 6, 19), date(2025, 6, 21))
+
+        self.assertEqual([day for day, _ in rows], [date(2025, 6, 19), date(2025, 6, 20), date(2025, 6, 21)])
+        self.assertEqual(rows[1][1], ("Completed", None, None, None, None))
+        self.assertEqual(rows[0][1], (None,) * 5)
+
+    def test_ten_years_fit_in_a_few_kilobytes(self):
+        history = StatusHistory()
+        start = date(2015, 1, 1)
+        history.set_range(start, [("Completed", "Late", "Not Completed", "Completed", "Late")] * 3653)
+
+        self.assertLess(history.nbytes, 5 * 1024)
+        self.assertEqual(history.get(start + timedelta(days=3652), "Asr"), "Not Completed")
+
+    def test_unsupported_entries_are_skipped(self):
+        history = StatusHistory.from_json({"2025-06-20-Fajr": "Completed", "2025-06-20_Fajr": "Unknown"})
+        self.assertEqual(history.to_json(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.utils import storage
+
+
+class TestStorageBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.paths = {
+            "USER_TIMES_FILE": root / "user_times.json",
+            "USER_LOG_FILE": root / "user_logs.json",
+            "USER_ACTION_LOG_FILE": root / "user_logs.jsonl",
+            "PRAYER_STATUS_FILE": root / "prayer_status.json",
+        }
+        self.patchers = [patch(f"app.utils.storage.config.{name}", path) for name, path in self.paths.items()]
+        for patcher in self.patchers:
+            patcher.start()
+        self.db_path = root / "test.db"
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _backends(self):
+        json_backend = storage.JsonStorage()
+        sqlite_backend = storage.SqliteStorage(self.db_path)
+        return [json_backend, sqlite_backend]
+
+    def test_prayer_times_round_trip(self):
+        for backend in self._backends():
+            with self.subTest(backend=type(backend).__name__):
+                self.assertIsNone(backend.load_prayer_times())
+                backend.save_prayer_times({"Isha": "20:40", "Fajr": "04:30"})
+                self.assertEqual(backend.load_prayer_times(), {"Fajr": "04:30", "Isha": "20:40"})
+                backend.close()
+
+    def test_save_statuses_merges_and_range_query_filters(self):
+        for backend in self._backends():
+            with self.subTest(backend=type(backend).__name__):
+                backend.save_statuses({"2025-06-19_Fajr": "Late", "2025-06-20_Fajr": "Completed"})
+                backend.save_statuses({"2025-06-20_Fajr": "Not Completed", "2025-06-21_Asr": "Late"})
+
+                self.assertEqual(len(backend.load_statuses()), 3)
+                self.assertEqual(backend.load_statuses("2025-06-20", "2025-06-21"),
+                                 {"2025-06-20_Fajr": "Not Completed", "2025-06-21_Asr": "Late"})
+                backend.close()
+
+    def test_patch_statuses_counts_changes_and_removes_none(self):
+        for backend in self._backends():
+            with self.subTest(backend=type(backend).__name__):
+                self.assertEqual(backend.patch_statuses({"2025-06-20_Fajr": "Late", "2025-06-20_Asr": "Late"}), 2)
+                self.assertEqual(backend.patch_statuses({"2025-06-20_Fajr": "Late"}), 0)
+                self.assertEqual(backend.patch_statuses({"2025-06-20_Fajr": "Completed", "2025-06-20_Asr": None}), 2)
+                self.assertEqual(backend.load_statuses(), {"2025-06-20_Fajr": "Completed"})
+                backend.close()
+
+    def test_json_patch_without_changes_does_not_write(self):
+        backend = storage.JsonStorage()
+        backend.patch_statuses({"2025-06-20_Fajr": "Late"})
+        with patch.object(backend, "_write_json") as write:
+            backend.patch_statuses({"2025-06-20_Fajr": "Late", "2025-06-21_Fajr": None})
+        write.assert_not_called()
+
+    def test_actions_are_appended_and_streamed(self):
+        for backend in self._backends():
+            with self.subTest(backend=type(backend).__name__):
+                backend.append_actions([
+                    {"timestamp": "2025-06-20 04:30:00", "action": "notified", "prayer": "Fajr", "details": {}},
+                    {"timestamp": "2025-06-20 04:31:00", "action": "snoozed", "prayer": "Fajr",
+                     "details": {"snooze_until": "04:32"}},
+                ])
+                actions = list(backend.iter_actions())
+                self.assertEqual([a["action"] for a in actions], ["notified", "snoozed"])
+                self.assertEqual(actions[1]["details"], {"snooze_until": "04:32"})
+                backend.close()
+
+    def test_sqlite_imports_legacy_json_on_creation(self):
+        self.paths["USER_TIMES_FILE"].write_text(json.dumps({"Fajr": "04:30"}))
+        self.paths["PRAYER_STATUS_FILE"].write_text(json.dumps({"2025-06-20_Fajr": "Late"}))
+        self.paths["USER_LOG_FILE"].write_text(json.dumps([{"timestamp": "t", "action": "offered", "prayer": "Fajr"}]))
+
+        backend = storage.SqliteStorage(self.db_path)
+
+        self.assertEqual(backend.load_prayer_times(), {"Fajr": "04:30"})
+        self.assertEqual(backend.load_statuses(), {"2025-06-20_Fajr": "Late"})
+        self.assertEqual([a["action"] for a in backend.iter_actions()], ["offered"])
+        backend.close()
+
+    def test_sqlite_concurrent_writers(self):
+        backend = storage.SqliteStorage(self.db_path)
+
+        def write_statuses(day):
+            for prayer in ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]:
+                backend.save_statuses({f"2025-06-{day:02d}_{prayer}": "Completed"})
+                backend.append_actions([{"timestamp": "t", "action": "offered", "prayer": prayer}])
+
+        threads = [threading.Thread(target=write_statuses, args=(day,)) for day in range(1, 11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(backend.load_statuses()), 50)
+        self.assertEqual(sum(1 for _ in backend.iter_actions()), 50)
+        backend.close()
+
+    def test_json_backend_serves_repeat_loads_from_cache(self):
+        backend = storage.JsonStorage()
+        backend.save_prayer_times({"Fajr": "04:30"})
+        backend.save_statuses({"2025-06-20_Fajr": "Late"})
+
+        for _ in range(3):
+            backend.load_prayer_times()
+            backend.load_statuses()
+
+        self.assertEqual(backend.cache_stats()["misses"], 1)  # The first status read, before any write
+        self.assertEqual(backend.cache_stats()["hits"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
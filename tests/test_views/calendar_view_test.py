@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import customtkinter as ctk
 
@@ -11,55 +11,66 @@ from app.views import calendar_view
 class TestCalendarView(unittest.TestCase):
     def setUp(self):
         """
-        Runs before each test. Initializes a root Tkinter window,
-        mocks a status_vars dictionary, and prepares sample date data.
+        Runs before each test. Initializes a root Tkinter window
+        and prepares the callbacks the calendar widgets need.
         """
         self.root = ctk.CTk()  # Root window for UI tests
-        self.status_vars = {}  # Will hold StringVars for prayer statuses
         self.show_dropdown_mock = MagicMock()  # Mock callback for dropdown click
-
-        # Set up a single day's data for testing
         self.today = datetime.now().date()
-        self.dates_data = [
-            {
-                "date": self.today,
-                "is_today": True,
-                "statuses": {
-                    f"{self.today}_Fajr": "Completed",
-                    f"{self.today}_Dhuhr": "Not Completed"
-                },
-                "prayer_disabled_status": {
-                    "Fajr": False,
-                    "Dhuhr": True,
-                    "Asr": False,
-                    "Maghrib": False,
-                    "Isha": False
-                }
-            }
-        ]
-
-    @patch("app.views.calendar_view.get_day_name", return_value="Monday")
-    @patch("app.views.calendar_view.config")
-    def test_build_calendar_frame_creates_widgets(self, mock_config, mock_get_day_name):
+
+    def _build_calendar(self, first_day, last_day):
+        statuses = ("Completed", "Not Completed", "Late", "Not Completed", "Not Completed")
+        disabled = (False, True, False, False, False)
+        self.get_day = MagicMock(side_effect=lambda day: (day == self.today, statuses, disabled))
+        self.on_change = MagicMock()
+        frame = ctk.CTkFrame(self.root)
+        return calendar_view.VirtualCalendar(
+            frame, first_day, last_day, self.get_day, self.show_dropdown_mock, self.on_change, visible_days=2
+        )
+
+    def test_virtual_calendar_reuses_a_fixed_pool_of_rows(self):
         """
-        Test that the calendar frame correctly creates and populates all widgets for one day.
+        Test that scrolling through years of days re-binds the same pooled widgets.
         """
-        # Setup mock values
-        mock_config.PRAYER_NAMES = ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]
-        mock_config.STATUS_COLORS = {
-            "Completed": "green",
-            "Not Completed": "red"
-        }
+        calendar = self._build_calendar(self.today - timedelta(days=3 * 365), self.today)
+        first_rows = calendar.rows[0]
+
+        calendar.scroll_to(self.today - timedelta(days=400))
+        calendar.scroll_by(1)
+        calendar.yview("moveto", "1.0")
+
+        self.assertEqual(len(calendar.rows), 2)
+        self.assertIs(calendar.rows[0], first_rows)
+        self.assertEqual(calendar.rows[0].day, self.today - timedelta(days=1))
+        self.assertEqual(calendar.rows[1].day, self.today)
+        # Only the visible days were ever requested from the data source
+        self.assertEqual(self.get_day.call_count, 6)
+        self.assertEqual(calendar.rows[1].status_vars["Asr"].get(), "Late")
+        self.assertEqual(calendar.rows[1].buttons["Dhuhr"].cget("state"), "disabled")
+
+    def test_virtual_calendar_reports_only_user_changes(self):
+        """
+        Test that status changes are reported with their day, but re-binding is not.
+        """
+        calendar = self._build_calendar(self.today - timedelta(days=10), self.today)
+        calendar.scroll_to(self.today - timedelta(days=1))
+        self.on_change.assert_not_called()
 
-        # Create a parent frame to render calendar inside
-        frame = ctk.CTkFrame(self.root)
+        calendar.rows[0].status_vars["Fajr"].set("Late")
+        self.on_change.assert_called_once_with(self.today - timedelta(days=1), "Fajr", "Late")
 
-        # Call the actual function that creates the calendar UI
-        calendar_view.build_calendar_frame(frame, self.dates_data, self.status_vars, self.show_dropdown_mock)
+    def test_refresh_reconfigures_only_changed_cells(self):
+        """
+        Test that refreshing unchanged days leaves the widgets alone.
+        """
+        calendar = self._build_calendar(self.today - timedelta(days=10), self.today)
+        calendar.scroll_to(self.today - timedelta(days=1))
 
-        # Check if the status_vars dictionary was populated for at least one prayer
-        self.assertIn(f"{self.today}_Fajr", self.status_vars)
-        self.assertIsInstance(self.status_vars[f"{self.today}_Fajr"], ctk.StringVar)
+        with patch.object(calendar.rows[0].buttons["Fajr"], "configure") as configure, \
+                patch.object(calendar.rows[0].header, "configure") as header_configure:
+            calendar.refresh()
+            configure.assert_not_called()
+            header_configure.assert_not_called()
 
     @patch("app.views.calendar_view.config")
     def test_display_status_dropdown_changes_status(self, mock_config):
@@ -90,6 +101,32 @@ class TestCalendarView(unittest.TestCase):
         self.assertEqual(status_var.get(), "Completed")
         self.assertEqual(button.cget("fg_color"), "green")
 
+    @patch("app.views.calendar_view.config")
+    def test_status_dropdown_is_reused_and_retargeted(self, mock_config):
+        """
+        Test that repeated clicks reuse one dropdown window and update the latest button.
+        """
+        mock_config.STATUS_OPTIONS = ["Completed", "Late", "Not Completed"]
+        mock_config.STATUS_COLORS = {"Completed": "green", "Late": "orange", "Not Completed": "red"}
+
+        first_var, second_var = ctk.StringVar(value="Not Completed"), ctk.StringVar(value="Not Completed")
+        first_btn = ctk.CTkButton(self.root, textvariable=first_var, width=100)
+        second_btn = ctk.CTkButton(self.root, textvariable=second_var, width=100)
+
+        calendar_view.display_status_dropdown(self.root, first_var, first_btn)
+        dropdown = calendar_view.get_status_dropdown(self.root)
+        window = dropdown.window
+        calendar_view.display_status_dropdown(self.root, second_var, second_btn)
+
+        self.assertIs(calendar_view.get_status_dropdown(self.root), dropdown)
+        self.assertIs(dropdown.window, window)
+
+        dropdown.select("Late")
+        self.assertEqual(first_var.get(), "Not Completed")
+        self.assertEqual(second_var.get(), "Late")
+        self.assertEqual(second_btn.cget("fg_color"), "orange")
+        self.assertIsNone(dropdown.status_var)
+
 
 if __name__ == '__main__':
     unittest.main()
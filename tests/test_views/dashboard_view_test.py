@@ -59,6 +59,20 @@ class TestDashboardView(unittest.TestCase):
         # Check initial time value for Dhuhr
         self.assertEqual(labels["Dhuhr"][1].cget("text"), "12:15")
 
+    def test_label_renderer_configures_only_changes(self):
+        """
+        Ensures repeated renders with the same values do not touch the label.
+        """
+        renderer = dashboard_view.LabelRenderer()
+        label = MagicMock()
+
+        self.assertTrue(renderer.render(label, text="12:00:00", text_color="white"))
+        self.assertFalse(renderer.render(label, text="12:00:00", text_color="white"))
+        self.assertTrue(renderer.render(label, text="12:00:01", text_color="white"))
+
+        label.configure.assert_called_with(text="12:00:01")
+        self.assertEqual(renderer.configure_calls, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock, call, ANY
 from datetime import datetime
 import queue
 
@@ -14,6 +14,7 @@ with patch("customtkinter.CTk", MagicMock()), \
      patch("customtkinter.CTkFont", MagicMock()):
 
     from app.views.main_view import MainView
+    from app.services.event_channel import EventChannel
 
 
 class TestMainView(unittest.TestCase):
@@ -33,11 +34,19 @@ class TestMainView(unittest.TestCase):
         mock_settings.return_value = MagicMock()
         mock_chatbot.return_value = MagicMock()
 
+        self.main_view.frames = {}
         self.main_view._create_all_views()
 
+        # Only the dashboard is built at startup
         self.assertIn("dashboard", self.main_view.frames)
-        self.assertIn("settings", self.main_view.frames)
+        self.assertNotIn("settings", self.main_view.frames)
+        self.assertNotIn("chatbot", self.main_view.frames)
+        mock_chatbot.assert_not_called()
+
+        self.main_view.show_frame("chatbot")
+        self.main_view.show_frame("chatbot")
         self.assertIn("chatbot", self.main_view.frames)
+        mock_chatbot.assert_called_once()
 
     def test_show_frame_switching(self):
         mock_dashboard = MagicMock()
@@ -86,15 +95,107 @@ class TestMainView(unittest.TestCase):
 
     def test_process_scheduler_queue_with_notification(self):
         self.scheduler_mock.notification_queue.put(("show_notification", "Asr"))
-        with patch("app.views.main_view.show_notification_popup") as notif_mock:
+        with patch("app.views.main_view.NotificationPopup") as popup_cls:
+            self.main_view.process_scheduler_queue()
+            self.main_view.dispatcher.flush()  # Normally run by the app's after()
+            popup_cls.return_value.show.assert_called_once_with(["Asr"], ANY, ANY, received_at=ANY)
+
+    def test_update_dashboard_display_skips_unchanged_labels(self):
+        self.main_view.prayer_times = {"Fajr": "04:30", "Isha": "20:30"}
+        self.main_view.schedule = MagicMock(day=MOCK_TIME.date())
+        self.main_view.prayer_labels = {"Fajr": (MagicMock(), MagicMock()), "Isha": (MagicMock(), MagicMock())}
+        self.main_view.clock_label = MagicMock()
+        self.main_view.countdown_label = MagicMock()
+
+        with patch("app.views.main_view.datetime") as mock_datetime, \
+                patch("app.views.main_view.format_next_prayer", return_value=("Isha", "8:30:00")), \
+                patch.object(self.main_view.app, "after") as mock_after:
+            mock_datetime.now.return_value = MOCK_TIME
+            before = self.main_view.renderer.configure_calls
+            self.main_view.update_dashboard_display()
+            first_pass = self.main_view.renderer.configure_calls
+            self.main_view.update_dashboard_display()
+
+        self.assertEqual(first_pass - before, 6)
+        self.assertEqual(self.main_view.renderer.configure_calls, first_pass)
+        self.main_view.clock_label.configure.assert_called_once_with(text="12:00:00")
+        # Every tick is aligned to the next wall-clock second
+        delay_ms = mock_after.call_args[0][0]
+        self.assertLessEqual(delay_ms, 1000 + 5)
+
+    def test_process_scheduler_queue_coalesces_a_burst(self):
+        for prayer in ("Asr", "Maghrib", "Asr"):
+            self.scheduler_mock.notification_queue.put(("show_notification", prayer))
+        with patch("app.views.main_view.NotificationPopup") as popup_cls:
+            self.main_view.process_scheduler_queue()
+            self.main_view.dispatcher.flush()
+
+        popup_cls.return_value.show.assert_called_once_with(["Asr", "Maghrib"], ANY, ANY, received_at=ANY)
+        self.assertTrue(self.scheduler_mock.notification_queue.empty())
+        self.assertEqual(self.main_view.dispatcher.stats()["deduplicated"], 1)
+
+    def test_reminders_are_published_to_the_sink_fanout(self):
+        self.main_view.fanout = MagicMock()
+        with patch("app.views.main_view.NotificationPopup"):
+            self.main_view._handle_scheduler_message(("show_notification", "Isha"))
+
+        event = self.main_view.fanout.publish.call_args[0][0]
+        self.assertEqual(event.prayer_name, "Isha")
+
+    def test_answered_prayer_can_be_reminded_again(self):
+        with patch("app.views.main_view.NotificationPopup") as popup_cls:
+            self.main_view._handle_scheduler_message(("show_notification", "Asr"))
+            self.main_view.dispatcher.flush()
+            self.main_view._on_prayer_snoozed("Asr")
+            self.main_view._handle_scheduler_message(("show_notification", "Asr"))
+            self.main_view.dispatcher.flush()
+
+        popup_cls.assert_called_once_with(self.main_view.app)
+        self.assertEqual(popup_cls.return_value.show.call_count, 2)
+        self.scheduler_mock.snooze_prayer.assert_called_once_with("Asr")
+
+    def test_event_channel_replaces_polling(self):
+        channel = self.main_view.scheduler.notification_queue = EventChannel()
+        with patch.object(channel, "attach") as mock_attach, \
+                patch.object(self.main_view.app, "after") as mock_after:
+            self.main_view._connect_scheduler_queue()
             self.main_view.process_scheduler_queue()
-            notif_mock.assert_called_once()
+
+        mock_attach.assert_called_once_with(self.main_view.app, self.main_view.process_scheduler_queue)
+        mock_after.assert_not_called()
 
     def test_hide_window_logs(self):
         with patch.object(self.main_view.app, "withdraw") as mock_withdraw:
             self.main_view.hide_window()
             mock_withdraw.assert_called_once()
 
+    def test_background_mode_suspends_and_resumes_timers(self):
+        self.main_view._dashboard_job = "dashboard-job"
+        self.main_view._queue_job = "queue-job"
+
+        with patch.object(self.main_view.app, "after", return_value="slow-queue-job") as mock_after, \
+                patch.object(self.main_view.app, "after_cancel") as mock_cancel, \
+                patch.object(self.main_view.app, "withdraw"):
+            self.main_view.hide_window()
+
+            self.assertTrue(self.main_view.in_background)
+            mock_cancel.assert_has_calls([call("dashboard-job"), call("queue-job")])
+            mock_after.assert_called_once_with(1000, self.main_view.process_scheduler_queue)
+            self.assertIsNone(self.main_view._dashboard_job)
+
+        with patch.object(self.main_view, "update_dashboard_display") as mock_render, \
+                patch.object(self.main_view, "process_scheduler_queue") as mock_poll, \
+                patch.object(self.main_view.app, "after_cancel") as mock_cancel:
+            self.main_view._show_window_on_main_thread()
+
+            self.assertFalse(self.main_view.in_background)
+            mock_render.assert_called_once()
+            mock_poll.assert_called_once()
+            mock_cancel.assert_called_once_with("slow-queue-job")
+
+        rates = self.main_view.wakeups_per_minute()
+        self.assertEqual(set(rates), {"foreground", "background"})
+
     def test_schedule_show_window_executes(self):
         with patch.object(self.main_view.app, "after") as mock_after:
             self.main_view.schedule_show_window()
@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BASELINE_FILE = PROJECT_ROOT / "benchmarks" / "startup_baseline.json"
+
+# Runs in a fresh interpreter so modules imported by other tests do not interfere
+PROBE = """
+import json, sys
+import app.views.main_view
+from app.services import gemini_client
+from app.utils.lazy_import import is_loaded
+print(json.dumps({
+    "pygame_loaded": is_loaded(sys.modules["pygame"]),
+    "genai_loaded": is_loaded(sys.modules["google.generativeai"]),
+    "model_initialized": gemini_client.model is not gemini_client._UNSET,
+}))
+"""
+
+# Times the import phases of main.main() the way --profile-startup does (they need
+# no display) and checks them against the baseline passed as the first argument
+TIMING_PROBE = """
+import json, sys
+from app.utils.startup_profiler import StartupProfiler
+profiler = StartupProfiler()
+profiler.start()
+with profiler.phase("import core modules"):
+    from app.utils import utils
+with profiler.phase("import main view"):
+    from app.views.main_view import MainView
+profiler.stop()
+print(json.dumps(profiler.check_baseline(json.loads(sys.argv[1]))))
+"""
+IMPORT_PHASES = ("import core modules", "import main view")
+
+
+class TestStartupImports(unittest.TestCase):
+
+    def test_heavy_dependencies_are_deferred(self):
+        """
+        Importing the GUI must not load pygame or the Gemini SDK, nor contact Gemini.
+        """
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        self.assertFalse(result["pygame_loaded"])
+        self.assertFalse(result["genai_loaded"])
+        self.assertFalse(result["model_initialized"])
+
+    def test_import_phases_are_within_the_startup_baseline(self):
+        """
+        The import phases must stay within benchmarks/startup_baseline.json, the
+        budgets `main.py --profile-startup --startup-baseline` checks.
+        """
+        baseline = json.loads(BASELINE_FILE.read_text())
+        baseline = {
+            "tolerance": baseline["tolerance"],
+            "phases": {name: baseline["phases"][name] for name in IMPORT_PHASES},
+        }
+        output = subprocess.run(
+            [sys.executable, "-c", TIMING_PROBE, json.dumps(baseline)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        regressions = json.loads(output.strip().splitlines()[-1])
+
+        self.assertEqual(regressions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()